@@ -282,6 +282,7 @@ def get_league_teams(
         teams = (
             db.query(Team)
             .filter(Team.league_id == league_id)
+            .order_by(Team.id)
             .offset(skip)
             .limit(limit)
             .all()
@@ -145,7 +145,9 @@ def train_model(
         min_matches: Minimum number of finished matches required
 
     Returns:
-        Training result with metrics and status
+        Training result with metrics and status. ``metrics.cv_mean`` is the
+        out-of-bag accuracy for random forests and null for logistic models,
+        which are not cross-validated here
 
     Raises:
         503: If training fails or insufficient data
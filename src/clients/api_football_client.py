@@ -14,6 +14,8 @@ from datetime import datetime
 
 import requests
 
+from src.clients.http import create_session
+
 # Configure logging
 logger = logging.getLogger(__name__)
 
@@ -69,8 +71,7 @@ class ApiFootballClient:
         self.api_key = api_key
         self.request_delay = request_delay
         self.last_request_time = 0
-        self.session = requests.Session()
-        self.session.headers.update({
+        self.session = create_session({
             'X-RapidAPI-Key': self.api_key,
             'X-RapidAPI-Host': self.RAPIDAPI_HOST,
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
@@ -78,11 +79,11 @@ class ApiFootballClient:
 
     def _rate_limit_check(self) -> None:
         """Enforce rate limiting between requests."""
-        elapsed = time.time() - self.last_request_time
+        elapsed = time.monotonic() - self.last_request_time
         if elapsed < self.request_delay:
             delay = self.request_delay - elapsed
             time.sleep(delay)
-        self.last_request_time = time.time()
+        self.last_request_time = time.monotonic()
 
     def _get(self, endpoint: str, params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """
@@ -136,7 +137,9 @@ class ApiFootballClient:
         self,
         league_id: int,
         season: int,
-        status: Optional[str] = None
+        status: Optional[str] = None,
+        date_from: Optional[str] = None,
+        date_to: Optional[str] = None,
     ) -> List[Dict[str, Any]]:
         """
         Get fixtures/matches for a league and season.
@@ -145,6 +148,9 @@ class ApiFootballClient:
             league_id: League ID (from LEAGUE_IDS)
             season: Season year (e.g., 2023)
             status: Match status ('SCHEDULED', 'LIVE', 'FINISHED', 'POSTPONED')
+            date_from: Only fixtures on or after this date (YYYY-MM-DD);
+                must be given together with date_to
+            date_to: Only fixtures on or before this date (YYYY-MM-DD)
 
         Returns:
             List of fixture dictionaries
@@ -159,6 +165,9 @@ class ApiFootballClient:
             }
             if status:
                 params['status'] = status
+            if date_from and date_to:
+                params['from'] = date_from
+                params['to'] = date_to
 
             response = self._get('/fixtures', params=params)
             fixtures = response.get('response', [])
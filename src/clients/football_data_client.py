@@ -8,12 +8,13 @@ API Documentation: https://www.football-data.org/client/register
 """
 
 import logging
-import time
 from typing import Dict, List, Optional, Any
 from datetime import datetime
 
 import requests
 
+from src.clients.http import TokenBucket, create_session
+
 # Configure logging
 logger = logging.getLogger(__name__)
 
@@ -50,13 +51,31 @@ class FootballDataClient:
         'LIGA_NOS': 'PPL',
     }
 
-    def __init__(self, api_key: str, request_delay: float = 0.5):
+    # Requests allowed back to back before request_delay pacing kicks in
+    # (the free tier allows 10 requests per minute)
+    RATE_LIMIT_BURST = 10
+    # Sustained pacing that keeps within the free tier: 60s / 10 requests
+    RATE_LIMIT_DELAY = 60 / RATE_LIMIT_BURST
+
+    def __init__(
+        self,
+        api_key: str,
+        request_delay: float = RATE_LIMIT_DELAY,
+        session: Optional[requests.Session] = None,
+        burst: int = RATE_LIMIT_BURST,
+    ):
         """
         Initialize the football-data.org client.
 
         Args:
             api_key: API key for football-data.org
-            request_delay: Delay between requests in seconds
+            request_delay: Sustained delay between requests in seconds once
+                the burst allowance is used up; the default keeps within the
+                free tier's 10 requests per minute (0 disables rate limiting)
+            session: HTTP session to send requests with. Defaults to a new
+                retrying session carrying the auth headers; a session passed
+                in is used as-is.
+            burst: Number of requests that may be sent without waiting
 
         Raises:
             ValueError: If API key is empty
@@ -66,20 +85,20 @@ class FootballDataClient:
 
         self.api_key = api_key
         self.request_delay = request_delay
-        self.last_request_time = 0
-        self.session = requests.Session()
-        self.session.headers.update({
-            'X-Auth-Token': self.api_key,
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-        })
+        self.rate_limiter = (
+            TokenBucket(capacity=burst, rate=1 / request_delay) if request_delay > 0 else None
+        )
+        if session is None:
+            session = create_session({
+                'X-Auth-Token': self.api_key,
+                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+            })
+        self.session = session
 
     def _rate_limit_check(self) -> None:
-        """Enforce rate limiting between requests."""
-        elapsed = time.time() - self.last_request_time
-        if elapsed < self.request_delay:
-            delay = self.request_delay - elapsed
-            time.sleep(delay)
-        self.last_request_time = time.time()
+        """Take a request token, waiting for a refill once the burst is spent."""
+        if self.rate_limiter is not None:
+            self.rate_limiter.take()
 
     def _get(self, endpoint: str, params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """
@@ -118,13 +137,23 @@ class FootballDataClient:
             logger.error(f"Request error for {url}: {e}")
             raise FootballDataError(f"Request error: {e}")
 
-    def get_current_matches(self, league_code: str, status: str = 'SCHEDULED') -> List[Dict[str, Any]]:
+    def get_current_matches(
+        self,
+        league_code: str,
+        status: Optional[str] = 'SCHEDULED',
+        date_from: Optional[str] = None,
+        date_to: Optional[str] = None,
+    ) -> List[Dict[str, Any]]:
         """
         Get current or upcoming matches for a league.
 
         Args:
             league_code: League code (e.g., 'EPL')
-            status: Match status ('SCHEDULED', 'LIVE', 'FINISHED', 'POSTPONED')
+            status: Match status ('SCHEDULED', 'LIVE', 'FINISHED', 'POSTPONED'),
+                or None for every status
+            date_from: Only matches on or after this date (YYYY-MM-DD);
+                must be given together with date_to
+            date_to: Only matches on or before this date (YYYY-MM-DD)
 
         Returns:
             List of match dictionaries
@@ -137,13 +166,17 @@ class FootballDataClient:
 
         api_league = self.LEAGUE_CODES[league_code]
         try:
-            response = self._get(
-                f'/competitions/{api_league}/matches',
-                params={'status': status}
-            )
+            params = {}
+            if status:
+                params['status'] = status
+            if date_from and date_to:
+                params['dateFrom'] = date_from
+                params['dateTo'] = date_to
+
+            response = self._get(f'/competitions/{api_league}/matches', params=params)
 
             matches = response.get('matches', [])
-            logger.info(f"Retrieved {len(matches)} {status} matches for {league_code}")
+            logger.info(f"Retrieved {len(matches)} {status or 'all'} matches for {league_code}")
             return matches
 
         except FootballDataError as e:
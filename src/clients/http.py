@@ -0,0 +1,104 @@
+"""
+Shared HTTP session setup for the external API clients.
+
+Each client keeps one pooled, keep-alive session for its lifetime so repeat
+calls reuse TCP/TLS connections instead of handshaking per request.
+"""
+
+import threading
+import time
+from typing import Dict, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# Connection pool sizing per host
+POOL_CONNECTIONS = 20
+POOL_MAXSIZE = 20
+
+# Retries for connection failures and transient error statuses. Read timeouts
+# are not retried, so they reach the clients as requests.Timeout; once status
+# retries run out the last response is returned for the clients to map to
+# their own exceptions. Retry-After is left to the clients as well, so a long
+# rate-limit wait is reported instead of blocking the caller.
+MAX_RETRIES = 3
+RETRY_BACKOFF_FACTOR = 0.3
+RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+
+
+def create_session(headers: Optional[Dict[str, str]] = None) -> requests.Session:
+    """
+    Create a requests session with connection pooling and retries.
+
+    Args:
+        headers: Default headers sent with every request (e.g. API keys)
+
+    Returns:
+        Configured requests.Session
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=POOL_CONNECTIONS,
+        pool_maxsize=POOL_MAXSIZE,
+        max_retries=Retry(
+            total=MAX_RETRIES,
+            read=False,
+            backoff_factor=RETRY_BACKOFF_FACTOR,
+            status_forcelist=RETRY_STATUS_CODES,
+            allowed_methods=frozenset({'GET'}),
+            raise_on_status=False,
+            respect_retry_after_header=False,
+        ),
+    )
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    if headers:
+        session.headers.update(headers)
+    return session
+
+
+class TokenBucket:
+    """
+    Token-bucket rate limiter.
+
+    Holds up to ``capacity`` tokens and refills at ``rate`` tokens per second.
+    Each request takes one token, so up to ``capacity`` requests go out back
+    to back before callers are paced at ``rate``. Thread-safe.
+    """
+
+    def __init__(self, capacity: float, rate: float):
+        """
+        Initialize a full bucket.
+
+        Args:
+            capacity: Maximum burst size (tokens)
+            rate: Refill rate in tokens per second
+        """
+        self.capacity = capacity
+        self.rate = rate
+        self.tokens = capacity
+        self.updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def take(self) -> float:
+        """
+        Take one token, sleeping until one is available.
+
+        Returns:
+            Seconds slept (0.0 when a token was available)
+        """
+        with self._lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            if self.tokens >= 1:
+                self.tokens -= 1
+                return 0.0
+
+            delay = (1 - self.tokens) / self.rate
+            time.sleep(delay)
+            # The token that refilled during the sleep is spent on this request
+            self.tokens = 0.0
+            self.updated = now + delay
+            return delay
@@ -13,9 +13,17 @@ from typing import Dict, List, Optional, Any
 
 import requests
 
+from src.clients.http import create_session
+
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Parsed market key -> (outcome name, point) of the over/under 2.5 goals line
+TOTALS_2_5_KEYS = {
+    'over_2_5_odds': ('Over', 2.5),
+    'under_2_5_odds': ('Under', 2.5),
+}
+
 
 class OddsApiError(Exception):
     """Base exception for the-odds-api.com API errors."""
@@ -93,8 +101,7 @@ class OddsApiClient:
         self.api_key = api_key
         self.request_delay = request_delay
         self.last_request_time = 0
-        self.session = requests.Session()
-        self.session.headers.update({
+        self.session = create_session({
             'X-RapidAPI-Key': self.api_key,
             'X-RapidAPI-Host': self.RAPIDAPI_HOST,
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
@@ -102,11 +109,11 @@ class OddsApiClient:
 
     def _rate_limit_check(self) -> None:
         """Enforce rate limiting between requests."""
-        elapsed = time.time() - self.last_request_time
+        elapsed = time.monotonic() - self.last_request_time
         if elapsed < self.request_delay:
             delay = self.request_delay - elapsed
             time.sleep(delay)
-        self.last_request_time = time.time()
+        self.last_request_time = time.monotonic()
 
     def _get(self, endpoint: str, params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """
@@ -398,24 +405,34 @@ class OddsApiClient:
                 'markets': {},
             }
 
-            # Parse markets (h2h, spreads, totals)
-            for market in bookmaker.get('markets', []):
-                market_key = market.get('key')
-                outcomes = market.get('outcomes', [])
-
-                if market_key == 'h2h':
-                    # Match winner market
-                    for outcome in outcomes:
-                        team = outcome.get('name')
-                        odds = outcome.get('price')
-                        if team and odds:
-                            bm_data['markets'][f'{team}_odds'] = odds
-                elif market_key == 'spreads':
-                    # Point spread market
-                    bm_data['markets']['spreads'] = outcomes
-                elif market_key == 'totals':
-                    # Over/under market
-                    bm_data['markets']['totals'] = outcomes
+            # Index markets by key once instead of branching per market
+            markets_by_key = {
+                market['key']: market.get('outcomes', [])
+                for market in bookmaker.get('markets', [])
+                if market.get('key')
+            }
+
+            # Match winner market
+            bm_data['markets'].update({
+                f"{outcome['name']}_odds": outcome['price']
+                for outcome in markets_by_key.get('h2h', [])
+                if outcome.get('name') and outcome.get('price')
+            })
+
+            # Point spread and over/under markets
+            for market_key in ('spreads', 'totals'):
+                if market_key in markets_by_key:
+                    bm_data['markets'][market_key] = markets_by_key[market_key]
+
+            # Over/under 2.5 goals, looked up by (name, point) in one pass
+            totals_by_key = {
+                (outcome.get('name'), outcome.get('point')): outcome.get('price')
+                for outcome in markets_by_key.get('totals', [])
+            }
+            for odds_key, totals_key in TOTALS_2_5_KEYS.items():
+                price = totals_by_key.get(totals_key)
+                if price:
+                    bm_data['markets'][odds_key] = price
 
             parsed['bookmakers'].append(bm_data)
 
@@ -22,6 +22,7 @@ from src.db.models import (
     Prediction,
     PredictionResult,
     ModelMetrics,
+    LeagueFetchLog,
     LeagueType,
     MatchStatus,
     PredictionOutcome,
@@ -49,6 +50,7 @@ __all__ = [
     "Prediction",
     "PredictionResult",
     "ModelMetrics",
+    "LeagueFetchLog",
     # Enums
     "LeagueType",
     "MatchStatus",
@@ -27,6 +27,8 @@ from sqlalchemy import (
     Boolean,
     Date,
     Index,
+    SmallInteger,
+    TypeDecorator,
 )
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import relationship
@@ -34,6 +36,42 @@ from sqlalchemy.orm import relationship
 Base = declarative_base()
 
 
+class IntEnum(TypeDecorator):
+    """
+    Store a Python Enum as a SMALLINT code.
+
+    Codes are assigned from the member definition order, so new members must
+    only ever be appended to the enum. Bound values may be enum members or
+    their string values; loaded values are always returned as enum members.
+    """
+
+    impl = SmallInteger
+    cache_ok = True
+
+    def __init__(self, enum_class, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.enum_class = enum_class
+        self._to_code = {member: code for code, member in enumerate(enum_class)}
+        self._from_code = {code: member for member, code in self._to_code.items()}
+
+    def process_bind_param(self, value, dialect):
+        if value is None:
+            return None
+        return self._to_code[self.enum_class(value)]
+
+    def process_result_value(self, value, dialect):
+        if value is None:
+            return None
+        return self._from_code[value]
+
+    def process_literal_param(self, value, dialect):
+        return str(self.process_bind_param(value, dialect))
+
+    @property
+    def python_type(self):
+        return self.enum_class
+
+
 class LeagueType(str, Enum):
     """Type of football league"""
     DOMESTIC = "domestic"
@@ -62,11 +100,11 @@ class League(Base):
     __tablename__ = "leagues"
 
     id = Column(Integer, primary_key=True)
-    name = Column(String(255), nullable=False, unique=True)
+    name = Column(String(255), nullable=False)
     country = Column(String(100), nullable=False)
     season = Column(String(9), nullable=False)  # e.g., "2023-24"
     league_type = Column(SQLEnum(LeagueType), default=LeagueType.DOMESTIC)
-    external_id = Column(String(100), unique=True, nullable=True)  # For API tracking
+    external_id = Column(String(100), nullable=True)  # For API tracking
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
@@ -76,6 +114,9 @@ class League(Base):
 
     __table_args__ = (
         Index("ix_league_country_season", "country", "season"),
+        # One row per competition and season
+        Index("ix_league_name_season", "name", "season", unique=True),
+        Index("ix_league_external_season", "external_id", "season", unique=True),
     )
 
 
@@ -103,7 +144,7 @@ class Team(Base):
     team_stats = relationship("TeamStats", back_populates="team", cascade="all, delete-orphan")
 
     __table_args__ = (
-        Index("ix_team_league_id", "league_id"),
+        Index("ix_team_league_name", "league_id", "name", unique=True),
         Index("ix_team_name", "name"),
     )
 
@@ -119,7 +160,7 @@ class Match(Base):
     match_date = Column(DateTime, nullable=False)
     home_goals = Column(Integer, nullable=True)
     away_goals = Column(Integer, nullable=True)
-    status = Column(SQLEnum(MatchStatus), default=MatchStatus.SCHEDULED)
+    status = Column(IntEnum(MatchStatus), default=MatchStatus.SCHEDULED)
     home_shots = Column(Integer, nullable=True)
     away_shots = Column(Integer, nullable=True)
     home_shots_on_target = Column(Integer, nullable=True)
@@ -152,6 +193,7 @@ class Match(Base):
         Index("ix_match_league_date", "league_id", "match_date"),
         Index("ix_match_status", "status"),
         Index("ix_match_external_id", "external_id"),
+        Index("ix_match_home_away", "home_team_id", "away_team_id"),
     )
 
 
@@ -224,7 +266,7 @@ class Odds(Base):
     match = relationship("Match", back_populates="odds")
 
     __table_args__ = (
-        Index("ix_odds_match_bookmaker", "match_id", "bookmaker"),
+        Index("ix_odds_match_bookmaker", "match_id", "bookmaker", "retrieved_at"),
         Index("ix_odds_retrieved_at", "retrieved_at"),
     )
 
@@ -257,7 +299,7 @@ class Prediction(Base):
     id = Column(Integer, primary_key=True)
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
     match_id = Column(Integer, ForeignKey("matches.id"), nullable=False)
-    predicted_outcome = Column(SQLEnum(PredictionOutcome), nullable=False)
+    predicted_outcome = Column(IntEnum(PredictionOutcome), nullable=False)
     confidence = Column(Float, nullable=False)  # 0.0 to 1.0
     stake = Column(Numeric(10, 2), nullable=True)  # Betting stake
     odds_used = Column(Numeric(6, 2), nullable=True)  # Odds at time of prediction
@@ -283,7 +325,7 @@ class PredictionResult(Base):
 
     id = Column(Integer, primary_key=True)
     prediction_id = Column(Integer, ForeignKey("predictions.id"), nullable=False, unique=True)
-    actual_outcome = Column(SQLEnum(PredictionOutcome), nullable=False)
+    actual_outcome = Column(IntEnum(PredictionOutcome), nullable=False)
     is_correct = Column(Boolean, nullable=False)
     profit_loss = Column(Numeric(10, 2), nullable=True)  # P/L if stake was recorded
     return_rate = Column(Float, nullable=True)  # ROI percentage
@@ -317,3 +359,18 @@ class ModelMetrics(Base):
         Index("ix_model_metrics_version", "model_version"),
         Index("ix_model_metrics_training_date", "training_date"),
     )
+
+
+class LeagueFetchLog(Base):
+    """Fingerprint of the last data fetched per league season, to skip unchanged reruns"""
+    __tablename__ = "league_fetch_logs"
+
+    id = Column(Integer, primary_key=True)
+    league_code = Column(String(20), nullable=False)
+    season = Column(String(9), nullable=False)
+    content_hash = Column(String(64), nullable=False)  # blake2b hex digest
+    fetched_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+    __table_args__ = (
+        Index("ix_league_fetch_log_league_season", "league_code", "season", unique=True),
+    )
@@ -6,11 +6,13 @@ for use in match outcome prediction models.
 """
 
 import logging
+from collections import OrderedDict
 from datetime import datetime, timedelta
 from typing import Tuple, Optional, Dict, Any
 
 import pandas as pd
 import numpy as np
+from sqlalchemy import func
 from sqlalchemy.orm import Session
 
 from src.db.models import Match, MatchStatus, TeamStats, PredictionOutcome
@@ -92,11 +94,172 @@ def get_head_to_head(
     return matches
 
 
+# Per-match stat columns used for team form, read from the team's perspective
+_STAT_COLUMNS = (
+    "home_goals",
+    "away_goals",
+    "home_shots",
+    "away_shots",
+    "home_shots_on_target",
+    "away_shots_on_target",
+    "home_possession",
+    "away_possession",
+)
+
+
+def _team_stat_query(session: Session, team_id: int):
+    """
+    Build a column query over a team's finished matches.
+
+    Stat columns are COALESCEd to 0 in SQL so rows arrive without NULLs.
+    """
+    return session.query(
+        Match.match_date,
+        Match.home_team_id,
+        *(func.coalesce(getattr(Match, name), 0).label(name) for name in _STAT_COLUMNS),
+    ).filter(
+        Match.status == MatchStatus.FINISHED,
+        ((Match.home_team_id == team_id) | (Match.away_team_id == team_id))
+    )
+
+
+def _rows_to_arrays(rows: list, team_id: int) -> Dict[str, np.ndarray]:
+    """Convert rows from _team_stat_query into a dictionary of column arrays."""
+    columns = list(zip(*rows)) if rows else [()] * (len(_STAT_COLUMNS) + 2)
+    arrays = {
+        "match_date": np.array(columns[0], dtype="datetime64[us]"),
+        "is_home": np.array(columns[1], dtype=np.int64) == team_id,
+    }
+    for name, values in zip(_STAT_COLUMNS, columns[2:]):
+        arrays[name] = np.array(values, dtype=np.float64)
+    return arrays
+
+
+class TeamHistoryCache:
+    """
+    LRU cache of finished-match history per team, held as NumPy arrays.
+
+    The first lookup for a team loads all of its finished matches with a single
+    column query; later lookups slice the last-N window before a given date with
+    a binary search instead of querying the database again. Intended for batch
+    feature extraction (e.g. building a training set) where the same teams are
+    looked up many times. Matches stored after a team has been loaded are not
+    seen, so create a new cache per batch.
+    """
+
+    def __init__(self, session: Session, max_teams: int = 256):
+        """
+        Initialize the cache.
+
+        Args:
+            session: SQLAlchemy session
+            max_teams: Maximum number of teams to keep before evicting the least recently used
+        """
+        self.session = session
+        self.max_teams = max_teams
+        self._histories: "OrderedDict[int, Dict[str, np.ndarray]]" = OrderedDict()
+
+    def _load(self, team_id: int) -> Dict[str, np.ndarray]:
+        """Load all finished matches for a team, ordered by date ascending."""
+        rows = (
+            _team_stat_query(self.session, team_id)
+            .order_by(Match.match_date.asc())
+            .all()
+        )
+        return _rows_to_arrays(rows, team_id)
+
+    def preload(self, team_ids) -> None:
+        """
+        Load the histories of several teams with a single query.
+
+        Args:
+            team_ids: Team IDs to load; teams already cached are skipped
+        """
+        missing = sorted(set(team_ids) - set(self._histories))
+        if not missing:
+            return
+
+        rows = (
+            self.session.query(
+                Match.match_date,
+                Match.home_team_id,
+                Match.away_team_id,
+                *(func.coalesce(getattr(Match, name), 0).label(name) for name in _STAT_COLUMNS),
+            )
+            .filter(
+                Match.status == MatchStatus.FINISHED,
+                (Match.home_team_id.in_(missing) | Match.away_team_id.in_(missing))
+            )
+            .order_by(Match.match_date.asc())
+            .all()
+        )
+
+        rows_by_team = {team_id: [] for team_id in missing}
+        for row in rows:
+            # Drop away_team_id so rows match the _team_stat_query layout
+            team_row = (row[0], row[1], *row[3:])
+            for team_id in (row.home_team_id, row.away_team_id):
+                if team_id in rows_by_team:
+                    rows_by_team[team_id].append(team_row)
+
+        for team_id, team_rows in rows_by_team.items():
+            self._histories[team_id] = _rows_to_arrays(team_rows, team_id)
+        while len(self._histories) > self.max_teams:
+            self._histories.popitem(last=False)
+
+    def get(self, team_id: int) -> Dict[str, np.ndarray]:
+        """
+        Get the full finished-match history for a team.
+
+        Args:
+            team_id: Team ID
+
+        Returns:
+            Dictionary of column name to array, ordered by match date ascending
+        """
+        history = self._histories.get(team_id)
+        if history is None:
+            history = self._load(team_id)
+            self._histories[team_id] = history
+            if len(self._histories) > self.max_teams:
+                self._histories.popitem(last=False)
+        else:
+            self._histories.move_to_end(team_id)
+        return history
+
+    def recent(
+        self, team_id: int, num_matches: int = 10, before_date: Optional[datetime] = None
+    ) -> Dict[str, np.ndarray]:
+        """
+        Get the most recent finished matches for a team before a date.
+
+        Args:
+            team_id: Team ID
+            num_matches: Number of recent matches to retrieve
+            before_date: Only consider matches before this date (defaults to now)
+
+        Returns:
+            Dictionary of column name to array for the window, oldest first
+        """
+        if before_date is None:
+            before_date = datetime.utcnow()
+
+        history = self.get(team_id)
+        end = int(np.searchsorted(history["match_date"], np.datetime64(before_date, "us"), side="left"))
+        start = max(0, end - num_matches)
+        return {name: values[start:end] for name, values in history.items()}
+
+    def clear(self) -> None:
+        """Drop all cached team histories."""
+        self._histories.clear()
+
+
 def calculate_team_stats(
     session: Session,
     team_id: int,
     num_matches: int = 10,
     before_date: Optional[datetime] = None,
+    cache: Optional[TeamHistoryCache] = None,
 ) -> Dict[str, float]:
     """
     Calculate team statistics from recent matches.
@@ -106,13 +269,28 @@ def calculate_team_stats(
         team_id: Team ID
         num_matches: Number of recent matches to use
         before_date: Only consider matches before this date
+        cache: Optional team history cache to read recent matches from
 
     Returns:
         Dictionary with team statistics
     """
-    matches = get_recent_matches(session, team_id, num_matches, before_date)
+    if cache is not None:
+        window = cache.recent(team_id, num_matches, before_date)
+    else:
+        if before_date is None:
+            before_date = datetime.utcnow()
+        rows = (
+            _team_stat_query(session, team_id)
+            .filter(Match.match_date < before_date)
+            .order_by(Match.match_date.desc())
+            .limit(num_matches)
+            .all()
+        )
+        window = _rows_to_arrays(rows, team_id)
 
-    if not matches:
+    num_matches_played = len(window["is_home"])
+
+    if num_matches_played == 0:
         return {
             "win_rate": 0.0,
             "loss_rate": 0.0,
@@ -125,49 +303,27 @@ def calculate_team_stats(
             "matches_played": 0,
         }
 
-    wins = 0
-    losses = 0
-    draws = 0
-    goals_for = 0
-    goals_against = 0
-    shots = 0
-    shots_on_target = 0
-    possession_sum = 0
-    valid_possession_count = 0
-
-    for match in matches:
-        is_home = match.home_team_id == team_id
-
-        if is_home:
-            match_goals_for = match.home_goals or 0
-            match_goals_against = match.away_goals or 0
-            match_shots = match.home_shots or 0
-            match_shots_on_target = match.home_shots_on_target or 0
-            match_possession = match.home_possession or 0
-        else:
-            match_goals_for = match.away_goals or 0
-            match_goals_against = match.home_goals or 0
-            match_shots = match.away_shots or 0
-            match_shots_on_target = match.away_shots_on_target or 0
-            match_possession = match.away_possession or 0
-
-        goals_for += match_goals_for
-        goals_against += match_goals_against
-        shots += match_shots
-        shots_on_target += match_shots_on_target
-
-        if match_possession > 0:
-            possession_sum += match_possession
-            valid_possession_count += 1
-
-        if match_goals_for > match_goals_against:
-            wins += 1
-        elif match_goals_for < match_goals_against:
-            losses += 1
-        else:
-            draws += 1
-
-    num_matches_played = len(matches)
+    (
+        wins,
+        losses,
+        draws,
+        goals_for,
+        goals_against,
+        shots,
+        shots_on_target,
+        possession_sum,
+        valid_possession_count,
+    ) = _accumulate_stats(
+        window["is_home"],
+        window["home_goals"],
+        window["away_goals"],
+        window["home_shots"],
+        window["away_shots"],
+        window["home_shots_on_target"],
+        window["away_shots_on_target"],
+        window["home_possession"],
+        window["away_possession"],
+    )
 
     return {
         "win_rate": wins / num_matches_played if num_matches_played > 0 else 0.0,
@@ -182,6 +338,47 @@ def calculate_team_stats(
     }
 
 
+def _accumulate_stats(
+    is_home: np.ndarray,
+    home_goals: np.ndarray,
+    away_goals: np.ndarray,
+    home_shots: np.ndarray,
+    away_shots: np.ndarray,
+    home_sot: np.ndarray,
+    away_sot: np.ndarray,
+    home_possession: np.ndarray,
+    away_possession: np.ndarray,
+) -> Tuple[int, int, int, float, float, float, float, float, int]:
+    """
+    Accumulate win/draw/loss counts and stat totals from the team's perspective.
+
+    All arrays are aligned per match; ``is_home`` selects which side of each
+    match belongs to the team.
+
+    Returns:
+        Tuple of (wins, losses, draws, goals_for, goals_against, shots,
+        shots_on_target, possession_sum, valid_possession_count)
+    """
+    goals_for = np.where(is_home, home_goals, away_goals)
+    goals_against = np.where(is_home, away_goals, home_goals)
+    shots = np.where(is_home, home_shots, away_shots)
+    shots_on_target = np.where(is_home, home_sot, away_sot)
+    possession = np.where(is_home, home_possession, away_possession)
+    has_possession = possession > 0
+
+    return (
+        int(np.count_nonzero(goals_for > goals_against)),
+        int(np.count_nonzero(goals_for < goals_against)),
+        int(np.count_nonzero(goals_for == goals_against)),
+        float(goals_for.sum()),
+        float(goals_against.sum()),
+        float(shots.sum()),
+        float(shots_on_target.sum()),
+        float(possession[has_possession].sum()),
+        int(np.count_nonzero(has_possession)),
+    )
+
+
 def calculate_h2h_stats(
     session: Session,
     home_team_id: int,
@@ -203,7 +400,20 @@ def calculate_h2h_stats(
         Dictionary with H2H statistics
     """
     matches = get_head_to_head(session, home_team_id, away_team_id, num_matches, before_date)
+    return _h2h_stats_from_matches(matches, home_team_id)
+
 
+def _h2h_stats_from_matches(matches: list, home_team_id: int) -> Dict[str, float]:
+    """
+    Aggregate head-to-head statistics from the perspective of the home team.
+
+    Args:
+        matches: H2H matches (Match objects or rows with the same attributes)
+        home_team_id: ID of the team treated as home
+
+    Returns:
+        Dictionary with H2H statistics
+    """
     if not matches:
         return {
             "h2h_home_wins": 0,
@@ -251,7 +461,11 @@ def calculate_h2h_stats(
 
 
 def extract_match_features(
-    session: Session, match: Match, recent_matches: int = 10, h2h_matches: int = 5
+    session: Session,
+    match: Match,
+    recent_matches: int = 10,
+    h2h_matches: int = 5,
+    cache: Optional[TeamHistoryCache] = None,
 ) -> Dict[str, float]:
     """
     Extract all features for a match for ML prediction.
@@ -261,18 +475,17 @@ def extract_match_features(
         match: Match object
         recent_matches: Number of recent matches to use for stats
         h2h_matches: Number of H2H matches to use
+        cache: Optional team history cache shared across matches
 
     Returns:
         Dictionary with all extracted features
     """
-    features = {}
-
     # Get team statistics (only consider matches before this one)
     home_stats = calculate_team_stats(
-        session, match.home_team_id, recent_matches, match.match_date
+        session, match.home_team_id, recent_matches, match.match_date, cache
     )
     away_stats = calculate_team_stats(
-        session, match.away_team_id, recent_matches, match.match_date
+        session, match.away_team_id, recent_matches, match.match_date, cache
     )
 
     # Get H2H statistics
@@ -280,6 +493,15 @@ def extract_match_features(
         session, match.home_team_id, match.away_team_id, h2h_matches, match.match_date
     )
 
+    return _assemble_features(home_stats, away_stats, h2h_stats)
+
+
+def _assemble_features(
+    home_stats: Dict[str, float], away_stats: Dict[str, float], h2h_stats: Dict[str, float]
+) -> Dict[str, float]:
+    """Combine team and H2H statistics into the model feature dictionary."""
+    features = {}
+
     # Home team features
     features["home_win_rate"] = home_stats["win_rate"]
     features["home_draw_rate"] = home_stats["draw_rate"]
@@ -317,7 +539,88 @@ def extract_match_features(
     # Match context
     features["is_home_advantage"] = 1.0  # Always 1 for home team in home match
 
-    return features
+    # Missing stats default to 0.0 upstream; coerce so every value is a float
+    return {name: float(value) for name, value in features.items()}
+
+
+def extract_match_features_bulk(
+    session: Session,
+    match_objects: list[Match],
+    recent_matches: int = 10,
+    h2h_matches: int = 5,
+) -> pd.DataFrame:
+    """
+    Extract features for many matches with a fixed number of queries.
+
+    Team histories for every involved team are loaded with one query and
+    head-to-head candidates with another, instead of several queries per match.
+
+    Args:
+        session: SQLAlchemy session
+        match_objects: Match objects to extract features for
+        recent_matches: Number of recent matches to use for stats
+        h2h_matches: Number of H2H matches to use
+
+    Returns:
+        float32 DataFrame indexed by match_id with get_feature_names() columns
+    """
+    feature_names = get_feature_names()
+    if not match_objects:
+        return pd.DataFrame(
+            np.zeros((0, len(feature_names)), dtype=np.float32),
+            columns=feature_names,
+            index=pd.Index([], name="match_id"),
+        )
+
+    team_ids = {m.home_team_id for m in match_objects} | {m.away_team_id for m in match_objects}
+
+    # Team form: one query for all teams
+    cache = TeamHistoryCache(session, max_teams=max(len(team_ids), 1))
+    cache.preload(team_ids)
+
+    # H2H: one query for finished matches between any two involved teams,
+    # most recent first, then filtered per pair in Python
+    h2h_rows = (
+        session.query(
+            Match.match_date,
+            Match.home_team_id,
+            Match.away_team_id,
+            Match.home_goals,
+            Match.away_goals,
+        )
+        .filter(
+            Match.status == MatchStatus.FINISHED,
+            Match.home_team_id.in_(team_ids),
+            Match.away_team_id.in_(team_ids),
+        )
+        .order_by(Match.match_date.desc())
+        .all()
+    )
+    h2h_by_pair: Dict[frozenset, list] = {}
+    for row in h2h_rows:
+        h2h_by_pair.setdefault(frozenset((row.home_team_id, row.away_team_id)), []).append(row)
+
+    X = np.zeros((len(match_objects), len(feature_names)), dtype=np.float32)
+    for i, match in enumerate(match_objects):
+        home_stats = calculate_team_stats(
+            session, match.home_team_id, recent_matches, match.match_date, cache
+        )
+        away_stats = calculate_team_stats(
+            session, match.away_team_id, recent_matches, match.match_date, cache
+        )
+        pair_rows = h2h_by_pair.get(frozenset((match.home_team_id, match.away_team_id)), [])
+        h2h = [row for row in pair_rows if row.match_date < match.match_date][:h2h_matches]
+        h2h_stats = _h2h_stats_from_matches(h2h, match.home_team_id)
+
+        features = _assemble_features(home_stats, away_stats, h2h_stats)
+        X[i] = [features[name] for name in feature_names]
+
+    return pd.DataFrame(
+        X,
+        columns=feature_names,
+        index=pd.Index([m.id for m in match_objects], name="match_id"),
+        copy=False,
+    )
 
 
 def create_training_dataset(
@@ -333,7 +636,7 @@ def create_training_dataset(
         h2h_matches: Number of H2H matches to use
 
     Returns:
-        Tuple of (features DataFrame, target Series)
+        Tuple of (float32 features DataFrame, target Series)
     """
     # Get all finished matches
     finished_matches = (
@@ -351,9 +654,14 @@ def create_training_dataset(
 
     logger.info(f"Creating training dataset from {len(finished_matches)} finished matches")
 
-    feature_list = []
+    # Fill a preallocated float32 matrix row by row; rows for skipped matches
+    # are simply not used
+    feature_names = get_feature_names()
+    X_buffer = np.zeros((len(finished_matches), len(feature_names)), dtype=np.float32)
+    n_samples = 0
     target_list = []
     skipped = 0
+    cache = TeamHistoryCache(session)
 
     for match in finished_matches:
         try:
@@ -364,9 +672,10 @@ def create_training_dataset(
 
             # Extract features
             features = extract_match_features(
-                session, match, recent_matches, h2h_matches
+                session, match, recent_matches, h2h_matches, cache
             )
-            feature_list.append(features)
+            X_buffer[n_samples] = [features[name] for name in feature_names]
+            n_samples += 1
 
             # Determine outcome (target)
             if match.home_goals > match.away_goals:
@@ -384,17 +693,15 @@ def create_training_dataset(
             continue
 
     logger.info(
-        f"Created dataset with {len(feature_list)} samples "
+        f"Created dataset with {n_samples} samples "
         f"({skipped} matches skipped)"
     )
 
-    # Convert to DataFrame
-    X = pd.DataFrame(feature_list)
+    # Wrap the filled rows without copying. extract_match_features already
+    # defaults missing stats to 0.0, so no NaN pass is needed here.
+    X = pd.DataFrame(X_buffer[:n_samples], columns=feature_names, copy=False)
     y = pd.Series(target_list)
 
-    # Fill any NaN values with 0
-    X = X.fillna(0.0)
-
     return X, y
 
 
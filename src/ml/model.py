@@ -7,22 +7,34 @@ for predicting football match outcomes (home win, draw, away win).
 
 import logging
 import json
+import os
+import tempfile
+import threading
+import time
+from collections import OrderedDict
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Tuple, Optional
+from typing import Dict, Tuple, Optional, Union
 
 import joblib
 import numpy as np
 import pandas as pd
 from sklearn.preprocessing import LabelEncoder
+from sklearn.base import clone
 from sklearn.model_selection import train_test_split, cross_val_score
 from sklearn.linear_model import LogisticRegression
 from sklearn.ensemble import RandomForestClassifier
 from sklearn.metrics import accuracy_score, precision_score, recall_score, f1_score, roc_auc_score
 from sqlalchemy.orm import Session
 
-from src.db.models import PredictionOutcome, ModelMetrics
-from src.ml.features import create_training_dataset, extract_match_features, get_feature_names
+from src.db.models import MatchStatus, PredictionOutcome, ModelMetrics
+from src.ml.features import (
+    create_training_dataset,
+    extract_match_features,
+    extract_match_features_bulk,
+    get_feature_names,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -30,6 +42,40 @@ logger = logging.getLogger(__name__)
 MODELS_DIR = Path(__file__).parent.parent.parent / "models"
 MODELS_DIR.mkdir(exist_ok=True)
 
+# Models are fit and scored on float32 features to halve memory traffic
+FEATURE_DTYPE = np.float32
+
+# Cached single-match predictions, keyed by (model_name, match_id). Finished
+# matches never change so they are kept until the model is retrained;
+# upcoming matches expire quickly since team form may still change.
+PREDICTION_CACHE_SIZE = 4096
+UPCOMING_PREDICTION_TTL = 60.0  # seconds
+_prediction_cache: OrderedDict[Tuple[str, int], Tuple[Optional[float], Dict]] = OrderedDict()
+# Sync API endpoints run on threadpool threads, so cache access is serialized
+_prediction_cache_lock = threading.Lock()
+
+
+def _replace_file(path: Path, write) -> None:
+    """
+    Write a file through a temporary sibling and rename it into place.
+
+    Loaded models memory-map their file, so overwriting it in place would
+    change the arrays under a running process. After the rename, readers that
+    still have the old file open keep seeing the old model.
+
+    Args:
+        path: Destination path
+        write: Callable writing the content to the temporary path it is given
+    """
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    os.close(fd)
+    try:
+        write(tmp_path)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
 
 class ModelManager:
     """Manager for ML model training, saving, and loading."""
@@ -48,38 +94,60 @@ class ModelManager:
         self.model = None
         self.label_encoder = None
         self.feature_names = get_feature_names()
+        self._feature_index = {name: i for i, name in enumerate(self.feature_names)}
 
     def train(
         self,
-        X: pd.DataFrame,
+        X: Union[pd.DataFrame, np.ndarray],
         y: pd.Series,
         model_type: str = "logistic",
         test_size: float = 0.2,
         random_state: int = 42,
+        warm_start: bool = False,
+        do_cv: bool = False,
         **model_kwargs
     ) -> Dict[str, float]:
         """
         Train an ML model on the provided dataset.
 
         Args:
-            X: Feature DataFrame
+            X: Feature DataFrame or 2-D array
             y: Target Series (outcome labels)
             model_type: Type of model ("logistic" or "random_forest")
             test_size: Proportion of data to use for testing
             random_state: Random seed for reproducibility
+            warm_start: For logistic models, start lbfgs from the coefficients
+                of the previously saved model when it is compatible
+            do_cv: Run 5-fold cross-validation for cv_mean/cv_std. Random forests
+                fitted with bootstrap samples report their out-of-bag score
+                instead, so this only affects logistic models and forests
+                trained with bootstrap=False
             **model_kwargs: Additional keyword arguments for model initialization
+                (override the defaults below)
 
         Returns:
-            Dictionary with evaluation metrics
+            Dictionary with evaluation metrics: accuracy, precision, recall,
+            f1, auc, and the generalization estimate cv_mean/cv_std. For
+            bootstrapped random forests cv_mean is the out-of-bag accuracy
+            (cv_std 0.0); otherwise both are None unless do_cv is set
         """
         # Encode target labels
         self.label_encoder = LabelEncoder()
-        y_encoded = self.label_encoder.fit_transform(y)
-
-        # Split data
-        X_train, X_test, y_train, y_test = train_test_split(
-            X, y_encoded, test_size=test_size, random_state=random_state, stratify=y_encoded
+        y_encoded = self.label_encoder.fit_transform(y).astype(np.int32)
+
+        # Contiguous float32 features avoid the hidden copies sklearn makes
+        # otherwise; this is a no-op for float32 input from create_training_dataset
+        if isinstance(X, pd.DataFrame):
+            X = X.to_numpy()
+        X_values = np.ascontiguousarray(X, dtype=FEATURE_DTYPE)
+
+        # Split row indices, then take each split from the matrix once
+        train_idx, test_idx = train_test_split(
+            np.arange(len(X_values)), test_size=test_size, random_state=random_state,
+            shuffle=True, stratify=y_encoded,
         )
+        X_train, X_test = X_values[train_idx], X_values[test_idx]
+        y_train, y_test = y_encoded[train_idx], y_encoded[test_idx]
 
         logger.info(
             f"Training {model_type} model with {len(X_train)} training samples "
@@ -88,19 +156,30 @@ class ModelManager:
 
         # Create model
         if model_type == "logistic":
-            self.model = LogisticRegression(
-                max_iter=1000,
-                random_state=random_state,
-                multi_class="multinomial",
-                **model_kwargs
-            )
+            # lbfgs fits the multinomial model directly; a looser tol stops
+            # once further iterations no longer move accuracy
+            params = {
+                "solver": "lbfgs",
+                "max_iter": 200,
+                "tol": 1e-3,
+                "C": 1.0,
+                "random_state": random_state,
+            }
+            params.update(model_kwargs)
+            self.model = LogisticRegression(**params)
+            if warm_start:
+                self._warm_start_from_saved(X_values.shape[1])
         elif model_type == "random_forest":
-            self.model = RandomForestClassifier(
-                n_estimators=100,
-                random_state=random_state,
-                n_jobs=-1,
-                **model_kwargs
-            )
+            params = {
+                "n_estimators": 100,
+                "random_state": random_state,
+                "n_jobs": -1,
+                "bootstrap": True,
+            }
+            params.update(model_kwargs)
+            # The out-of-bag score needs bootstrap samples
+            params.setdefault("oob_score", bool(params["bootstrap"]))
+            self.model = RandomForestClassifier(**params)
         else:
             raise ValueError(f"Unknown model type: {model_type}")
 
@@ -125,31 +204,86 @@ class ModelManager:
             logger.warning(f"Could not calculate AUC: {e}")
             metrics["auc"] = None
 
-        # Cross-validation score
-        cv_scores = cross_val_score(
-            self.model, X_train, y_train, cv=5, scoring="accuracy"
-        )
-        metrics["cv_mean"] = cv_scores.mean()
-        metrics["cv_std"] = cv_scores.std()
+        # Generalization estimate: the out-of-bag score comes free with the
+        # forest fit; cross-validation refits the model 5 times so is opt-in
+        if getattr(self.model, "oob_score", False):
+            metrics["cv_mean"] = self.model.oob_score_
+            metrics["cv_std"] = 0.0
+        elif do_cv:
+            # Folds run in parallel. Random forests already use every core per
+            # fit, so the CV copies are single-threaded.
+            cv_estimator = clone(self.model)
+            if model_type == "random_forest":
+                cv_estimator.set_params(n_jobs=1)
+            cv_scores = cross_val_score(
+                cv_estimator, X_train, y_train, cv=5, scoring="accuracy",
+                n_jobs=-1, pre_dispatch="2*n_jobs",
+            )
+            metrics["cv_mean"] = cv_scores.mean()
+            metrics["cv_std"] = cv_scores.std()
+        else:
+            metrics["cv_mean"] = None
+            metrics["cv_std"] = None
 
         logger.info(f"Model evaluation metrics: {metrics}")
 
         return metrics
 
-    def save(self, session: Session, model_type: str = "logistic") -> None:
+    def _warm_start_from_saved(self, n_features: int) -> None:
+        """
+        Seed the current logistic model with coefficients from the saved model.
+
+        Only applies when the saved model is a logistic regression over the same
+        number of features and the same classes; otherwise training starts cold.
+
+        Args:
+            n_features: Number of features the new model will be fit on
+        """
+        if not self.model_path.exists() or not self.encoder_path.exists():
+            logger.info("No saved model to warm start from")
+            return
+
+        prior_model = joblib.load(self.model_path)
+        prior_encoder = joblib.load(self.encoder_path)
+
+        if (
+            not isinstance(prior_model, LogisticRegression)
+            or prior_model.coef_.shape[1] != n_features
+            or list(prior_encoder.classes_) != list(self.label_encoder.classes_)
+        ):
+            logger.info("Saved model is not compatible, training from scratch")
+            return
+
+        self.model.set_params(warm_start=True)
+        self.model.coef_ = np.array(prior_model.coef_, copy=True)
+        self.model.intercept_ = np.array(prior_model.intercept_, copy=True)
+        logger.info(f"Warm starting from {self.model_path}")
+
+    def save(self, session: Session, model_type: str = "logistic", compress=0) -> None:
         """
         Save trained model and metadata to disk.
 
+        Models are pickled with protocol 5 so large tree/coefficient arrays are
+        written without an extra buffer copy. They are left uncompressed by
+        default so load() can memory-map them; pass ``compress`` (e.g. 3 or
+        ("lz4", 3) when lz4 is installed) to trade that for a smaller file.
+
         Args:
             session: SQLAlchemy session for storing metrics
             model_type: Type of model trained
+            compress: joblib compression setting for the model file
         """
         if self.model is None:
             raise ValueError("Model has not been trained yet")
 
-        # Save model and encoder
-        joblib.dump(self.model, self.model_path)
-        joblib.dump(self.label_encoder, self.encoder_path)
+        # Save model and encoder (atomically, see _replace_file)
+        _replace_file(
+            self.model_path,
+            lambda tmp: joblib.dump(self.model, tmp, compress=compress, protocol=5),
+        )
+        _replace_file(
+            self.encoder_path, lambda tmp: joblib.dump(self.label_encoder, tmp, protocol=5)
+        )
 
         logger.info(f"Saved model to {self.model_path}")
 
@@ -159,11 +293,16 @@ class ModelManager:
             "model_type": model_type,
             "saved_at": datetime.utcnow().isoformat(),
             "feature_names": self.feature_names,
+            "dtype": np.dtype(FEATURE_DTYPE).name,
+            "compressed": bool(compress),
             "classes": self.label_encoder.classes_.tolist() if self.label_encoder else [],
         }
 
-        with open(self.metadata_path, "w") as f:
-            json.dump(metadata, f, indent=2)
+        def write_metadata(tmp: str) -> None:
+            with open(tmp, "w") as f:
+                json.dump(metadata, f, indent=2)
+
+        _replace_file(self.metadata_path, write_metadata)
 
         logger.info(f"Saved metadata to {self.metadata_path}")
 
@@ -178,7 +317,14 @@ class ModelManager:
             logger.warning(f"Model files not found at {self.model_path}")
             return False
 
-        self.model = joblib.load(self.model_path)
+        # Memory-map large arrays so worker processes share the same pages.
+        # Compressed files cannot be memory-mapped.
+        compressed = False
+        if self.metadata_path.exists():
+            with open(self.metadata_path) as f:
+                compressed = json.load(f).get("compressed", False)
+
+        self.model = joblib.load(self.model_path, mmap_mode=None if compressed else "r")
         self.label_encoder = joblib.load(self.encoder_path)
 
         logger.info(f"Loaded model from {self.model_path}")
@@ -197,14 +343,114 @@ class ModelManager:
         if self.model is None:
             raise ValueError("Model has not been trained or loaded")
 
-        predictions = self.model.predict(X)
-        probabilities = self.model.predict_proba(X)
+        X_values = np.ascontiguousarray(X, dtype=FEATURE_DTYPE)
+        predictions = self.model.predict(X_values)
+        probabilities = self.model.predict_proba(X_values)
 
         # Decode predictions back to outcome labels
         decoded_predictions = self.label_encoder.inverse_transform(predictions)
 
         return decoded_predictions, probabilities
 
+    def _fill_row(self, row: np.ndarray, features: Dict[str, float]) -> None:
+        """Write a feature dictionary into a row vector in feature_names order."""
+        for name, value in features.items():
+            idx = self._feature_index.get(name)
+            if idx is not None:
+                row[idx] = value
+
+    def predict_one(self, features: Dict[str, float]) -> Tuple[str, np.ndarray]:
+        """
+        Predict a single match from a feature dictionary.
+
+        Skips DataFrame construction by filling a NumPy row directly in
+        feature_names order. The row is allocated per call so a cached
+        manager can be shared between request threads.
+
+        Args:
+            features: Feature dictionary as returned by extract_match_features
+
+        Returns:
+            Tuple of (predicted outcome label, class probabilities)
+        """
+        if self.model is None:
+            raise ValueError("Model has not been trained or loaded")
+
+        row = np.zeros((1, len(self.feature_names)), dtype=FEATURE_DTYPE)
+        self._fill_row(row[0], features)
+
+        probabilities = self.model.predict_proba(row)[0]
+        predicted_outcome = self.label_encoder.classes_[int(np.argmax(probabilities))]
+
+        return predicted_outcome, probabilities
+
+
+@lru_cache(maxsize=4)
+def _get_manager(model_name: str) -> ModelManager:
+    """
+    Get a loaded ModelManager, reusing it across calls.
+
+    Args:
+        model_name: Name of the model to load
+
+    Returns:
+        ModelManager with model and encoder loaded
+
+    Raises:
+        FileNotFoundError: If the model files do not exist (failures are not cached)
+    """
+    manager = ModelManager(model_name)
+    if not manager.load():
+        raise FileNotFoundError(f"Model '{model_name}' not found at {manager.model_path}")
+    return manager
+
+
+def _get_cached_prediction(key: Tuple[str, int]) -> Optional[Dict[str, any]]:
+    """Return a cached prediction if present and not expired."""
+    with _prediction_cache_lock:
+        entry = _prediction_cache.get(key)
+        if entry is None:
+            return None
+
+        expires_at, prediction = entry
+        if expires_at is not None and expires_at <= time.monotonic():
+            _prediction_cache.pop(key, None)
+            return None
+
+        _prediction_cache.move_to_end(key)
+        return prediction
+
+
+def _cache_prediction(key: Tuple[str, int], prediction: Dict[str, any], match_object) -> None:
+    """Cache a prediction, forever for finished matches and briefly otherwise."""
+    if match_object.status == MatchStatus.FINISHED:
+        expires_at = None
+    else:
+        expires_at = time.monotonic() + UPCOMING_PREDICTION_TTL
+
+    with _prediction_cache_lock:
+        _prediction_cache[key] = (expires_at, prediction)
+        _prediction_cache.move_to_end(key)
+        while len(_prediction_cache) > PREDICTION_CACHE_SIZE:
+            _prediction_cache.popitem(last=False)
+
+
+def clear_prediction_cache(match_id: Optional[int] = None) -> None:
+    """
+    Drop cached predictions.
+
+    Args:
+        match_id: Only drop predictions for this match (e.g. after its data was
+            updated); drops everything if None
+    """
+    with _prediction_cache_lock:
+        if match_id is None:
+            _prediction_cache.clear()
+            return
+
+        for key in [key for key in _prediction_cache if key[1] == match_id]:
+            _prediction_cache.pop(key, None)
+
 
 def train_and_save_model(
     session: Session,
@@ -234,10 +480,13 @@ def train_and_save_model(
         manager = ModelManager(model_name)
         metrics = manager.train(X, y, model_type=model_type)
 
-        # Save model
+        # Save model and drop any stale cached copy
         manager.save(session, model_type)
+        _get_manager.cache_clear()
+        clear_prediction_cache()
 
-        # Store metrics in database
+        # Store metrics in database (a single row; batches of metrics should
+        # go through session.bulk_insert_mappings instead of per-row adds)
         db_metrics = ModelMetrics(
             model_version=f"{model_name}_v1",
             training_date=datetime.utcnow(),
@@ -275,6 +524,9 @@ def get_prediction_for_match(
     """
     Get ML prediction for a specific match.
 
+    Results are cached per (model_name, match id): indefinitely for finished
+    matches and for UPCOMING_PREDICTION_TTL seconds otherwise.
+
     Args:
         session: SQLAlchemy session
         match_object: Match ORM object
@@ -283,45 +535,99 @@ def get_prediction_for_match(
     Returns:
         Dictionary with prediction details or None if prediction fails
     """
+    cache_key = (model_name, match_object.id)
+    cached = _get_cached_prediction(cache_key)
+    if cached is not None:
+        return cached
+
     try:
-        # Load model
-        manager = ModelManager(model_name)
-        if not manager.load():
-            logger.error("Failed to load model")
+        # Load model (cached after the first call)
+        try:
+            manager = _get_manager(model_name)
+        except FileNotFoundError as e:
+            logger.error(f"Failed to load model: {e}")
             return None
 
         # Extract features for the match
         features_dict = extract_match_features(session, match_object)
-        features_df = pd.DataFrame([features_dict])
 
         # Make prediction
-        predictions, probabilities = manager.predict(features_df)
+        predicted_outcome, probabilities = manager.predict_one(features_dict)
 
-        # Get prediction details
-        predicted_outcome = predictions[0]
-        class_indices = {
-            cls: idx for idx, cls in enumerate(manager.label_encoder.classes_)
-        }
-        outcome_idx = class_indices.get(predicted_outcome, 0)
-        confidence = float(probabilities[0, outcome_idx])
-
-        return {
+        prediction = {
             "match_id": match_object.id,
-            "predicted_outcome": predicted_outcome,
-            "confidence": confidence,
+            "predicted_outcome": str(predicted_outcome),
+            "confidence": float(probabilities.max()),
             "probabilities": {
                 outcome: float(prob)
                 for outcome, prob in zip(
-                    manager.label_encoder.classes_, probabilities[0]
+                    manager.label_encoder.classes_, probabilities
                 )
             },
         }
+        _cache_prediction(cache_key, prediction, match_object)
+        return prediction
 
     except Exception as e:
         logger.error(f"Prediction failed for match {match_object.id}: {e}", exc_info=True)
         return None
 
 
+def get_predictions_for_matches(
+    session: Session, match_objects: list, model_name: str = "match_predictor"
+) -> Optional[list[Dict[str, any]]]:
+    """
+    Get ML predictions for several matches with a single model call.
+
+    Features for all matches are extracted in bulk (a fixed number of
+    queries) and scored with one predict_proba call.
+
+    Args:
+        session: SQLAlchemy session
+        match_objects: List of Match ORM objects
+        model_name: Name of the model to use
+
+    Returns:
+        List of prediction dictionaries in input order, or None if prediction fails
+    """
+    if not match_objects:
+        return []
+
+    try:
+        try:
+            manager = _get_manager(model_name)
+        except FileNotFoundError as e:
+            logger.error(f"Failed to load model: {e}")
+            return None
+
+        features_df = extract_match_features_bulk(session, match_objects)
+        batch = np.ascontiguousarray(
+            features_df[manager.feature_names].to_numpy(), dtype=FEATURE_DTYPE
+        )
+
+        probabilities = manager.model.predict_proba(batch)
+        classes = manager.label_encoder.classes_
+        predicted = classes[probabilities.argmax(axis=1)]
+        confidences = probabilities.max(axis=1)
+
+        return [
+            {
+                "match_id": match_object.id,
+                "predicted_outcome": str(predicted[i]),
+                "confidence": float(confidences[i]),
+                "probabilities": {
+                    outcome: float(prob)
+                    for outcome, prob in zip(classes, probabilities[i])
+                },
+            }
+            for i, match_object in enumerate(match_objects)
+        ]
+
+    except Exception as e:
+        logger.error(f"Batch prediction failed for {len(match_objects)} matches: {e}", exc_info=True)
+        return None
+
+
 def get_model_metrics(session: Session, limit: int = 10) -> list[Dict[str, any]]:
     """
     Get recent model metrics from database.
@@ -30,10 +30,21 @@ logger = logging.getLogger(__name__)
 project_root = Path(__file__).parent.parent.parent
 sys.path.insert(0, str(project_root))
 
-from src.db.models import Base
+# Use Intel's oneDAL kernels for sklearn when scikit-learn-intelex is installed.
+# Must run before sklearn is imported; the lbfgs LogisticRegression and
+# RandomForest used by ModelManager are both supported.
+try:
+    from sklearnex import patch_sklearn
+
+    patch_sklearn()
+    logger.info("Patched scikit-learn with scikit-learn-intelex")
+except ImportError:
+    pass
+
+from src.db.models import Base, Match
 from src.db.init_db import seed_sample_data
 from src.db.config import init_db
-from src.ml.model import train_and_save_model
+from src.ml.model import MODELS_DIR, train_and_save_model
 
 
 def train_baseline_model(database_url: str = "sqlite:///soccer_prediction.db") -> bool:
@@ -65,8 +76,6 @@ def train_baseline_model(database_url: str = "sqlite:///soccer_prediction.db") -
 
         try:
             # Check if we have data, if not seed sample data
-            from src.db.models import Match
-
             match_count = session.query(Match).count()
             if match_count < 50:
                 logger.info("Database is empty or has insufficient data. Seeding sample data...")
@@ -92,11 +101,10 @@ def train_baseline_model(database_url: str = "sqlite:///soccer_prediction.db") -
                 logger.info(f"  - F1 Score: {result['metrics']['f1']:.4f}")
                 if result['metrics'].get('auc'):
                     logger.info(f"  - AUC Score: {result['metrics']['auc']:.4f}")
-                logger.info(f"  - CV Mean: {result['metrics']['cv_mean']:.4f} (+/- {result['metrics']['cv_std']:.4f})")
+                if result['metrics'].get('cv_mean') is not None:
+                    logger.info(f"  - CV Mean: {result['metrics']['cv_mean']:.4f} (+/- {result['metrics']['cv_std']:.4f})")
 
                 # Log model paths
-                from src.ml.model import MODELS_DIR
-
                 logger.info(f"\nModel files saved to: {MODELS_DIR}/")
                 logger.info(f"  - {MODELS_DIR}/match_predictor.joblib")
                 logger.info(f"  - {MODELS_DIR}/match_predictor_encoder.joblib")
@@ -8,17 +8,121 @@ Rate limiting: FBref allows reasonable scraping; we add delays to be respectful.
 """
 
 import logging
+import re
+import threading
 import time
-from datetime import datetime
-from typing import Dict, List, Optional, Any
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from functools import lru_cache
+from typing import Dict, List, NamedTuple, Optional, Any
 from decimal import Decimal
 
+import numpy as np
+import pandas as pd
 import requests
 from bs4 import BeautifulSoup
+from lxml import etree, html as lxml_html
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# FBref competition IDs used in schedule URLs
+LEAGUE_COMP_IDS = {
+    'EPL': 9,
+    'LA_LIGA': 12,
+    'SERIE_A': 11,
+    'BUNDESLIGA': 20,
+    'LIGUE_1': 13,
+}
+
+# Rows of match report stat tables with at least a name and two values
+MATCH_STATS_ROWS_XPATH = '//table[contains(@class, "stats_table")]//tr[count(td|th) >= 3]'
+
+# Integer columns of the standings table, keyed by cell index
+STANDINGS_INT_COLUMNS = {
+    6: 'matches_played',
+    7: 'wins',
+    8: 'draws',
+    9: 'losses',
+    10: 'goals_for',
+    11: 'goals_against',
+    12: 'goal_difference',
+    13: 'points',
+}
+
+# Text columns of the team match log table, keyed by cell index
+MATCHLOG_TEXT_COLUMNS = {
+    2: 'time',
+    3: 'day',
+    4: 'competition',
+    5: 'round',
+    6: 'venue',
+    7: 'opponent',
+    8: 'result',
+}
+
+
+ISO_DATE_RE = re.compile(r'\d{4}-\d{2}-\d{2}')
+
+
+@lru_cache(maxsize=4096)
+def _parse_date(date_str: str) -> Optional[datetime]:
+    """
+    Parse date string to datetime object.
+
+    Results are memoized since match logs repeat the same dates heavily.
+    Zero-padded ISO dates, by far the most common, skip the other formats.
+
+    Args:
+        date_str: Date string (e.g., '2023-08-12')
+
+    Returns:
+        Datetime object or None if parsing fails
+    """
+    if ISO_DATE_RE.fullmatch(date_str):
+        try:
+            return datetime.strptime(date_str, '%Y-%m-%d')
+        except ValueError:
+            return None
+
+    for fmt in ['%Y-%m-%d', '%d/%m/%Y', '%d %b %Y']:
+        try:
+            return datetime.strptime(date_str, fmt)
+        except ValueError:
+            continue
+    return None
+
+
+@lru_cache(maxsize=256)
+def _parse_season_year(season: str) -> str:
+    """
+    Parse season string to year for URL construction.
+
+    Args:
+        season: Season string (e.g., '2023-24')
+
+    Returns:
+        Year string (e.g., '2024')
+    """
+    if '-' in season:
+        return season.split('-')[1]
+    return season[-2:]
+
+
+class TeamMatchRow(NamedTuple):
+    """One row of a team's match log (fixed layout, cheaper than a dict per row)."""
+
+    date: Optional[datetime]
+    time: str
+    day: str
+    competition: str
+    round: str
+    venue: str
+    opponent: str
+    result: str
+    goals_for: int
+    goals_against: Optional[int]
+
 
 class FbrefScraperError(Exception):
     """Base exception for FBref scraper errors."""
@@ -43,49 +147,90 @@ class FbrefScraper:
     BASE_URL = "https://fbref.com/en"
     REQUEST_DELAY = 2.0  # 2 seconds between requests
     TIMEOUT = 10
+    CACHE_EXPIRE_AFTER = timedelta(hours=6)  # Current-season pages change daily at most
+    SCHEDULE_URL_TEMPLATE = BASE_URL + "/comps/{comp_id}/{season_year}/schedule/"
 
-    def __init__(self, request_delay: float = REQUEST_DELAY):
+    def __init__(self, request_delay: float = REQUEST_DELAY, cache_name: Optional[str] = None):
         """
         Initialize the FBref scraper.
 
         Args:
             request_delay: Delay between requests in seconds
+            cache_name: Path of an on-disk HTTP cache (SQLite). When set, responses
+                are cached with requests-cache and cache hits skip the rate limit
+                delay. Requires the ``cache`` extra.
         """
         self.request_delay = request_delay
         self.last_request_time = 0
-        self.session = requests.Session()
+        self._rate_lock = threading.Lock()
+        if cache_name:
+            import requests_cache
+
+            self.session = requests_cache.CachedSession(
+                cache_name,
+                backend="sqlite",
+                expire_after=self.CACHE_EXPIRE_AFTER,
+                cache_control=True,
+            )
+        else:
+            self.session = requests.Session()
         self.session.headers.update({
             "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
         })
 
     def _rate_limit_check(self) -> None:
-        """Enforce rate limiting with delay between requests."""
-        elapsed = time.time() - self.last_request_time
-        if elapsed < self.request_delay:
-            delay = self.request_delay - elapsed
-            logger.debug(f"Rate limit delay: {delay:.2f}s")
-            time.sleep(delay)
-        self.last_request_time = time.time()
-
-    def _fetch_url(self, url: str) -> Optional[BeautifulSoup]:
         """
-        Fetch and parse a URL with rate limiting.
+        Enforce rate limiting with delay between requests.
+
+        Thread-safe: concurrent callers are released one at a time, each at
+        least request_delay seconds after the previous one.
+        """
+        with self._rate_lock:
+            elapsed = time.monotonic() - self.last_request_time
+            if elapsed < self.request_delay:
+                delay = self.request_delay - elapsed
+                logger.debug(f"Rate limit delay: {delay:.2f}s")
+                time.sleep(delay)
+            self.last_request_time = time.monotonic()
+
+    def _is_cached(self, url: str) -> bool:
+        """Check whether an unexpired response for the URL is in the HTTP cache."""
+        cache = getattr(self.session, "cache", None)
+        if cache is None:
+            return False
+        # Expired entries are refetched, so they must not bypass the rate limiter
+        response = cache.get_response(cache.create_key(requests.Request('GET', url)))
+        return response is not None and not response.is_expired
+
+    def _fetch_content(self, url: str, expire_after: Any = None) -> bytes:
+        """
+        Fetch the raw body of a URL with rate limiting.
 
         Args:
             url: URL to fetch
+            expire_after: Cache lifetime override for this URL (only used when
+                the HTTP cache is enabled)
 
         Returns:
-            BeautifulSoup object or None if request fails
+            Response body
 
         Raises:
             FbrefScraperError: If request fails
         """
-        self._rate_limit_check()
+        request_kwargs = {"timeout": self.TIMEOUT}
+        if hasattr(self.session, "cache"):
+            if expire_after is not None:
+                request_kwargs["expire_after"] = expire_after
+            if not self._is_cached(url):
+                self._rate_limit_check()
+        else:
+            self._rate_limit_check()
+
         try:
             logger.debug(f"Fetching: {url}")
-            response = self.session.get(url, timeout=self.TIMEOUT)
+            response = self.session.get(url, **request_kwargs)
             response.raise_for_status()
-            return BeautifulSoup(response.content, "html.parser")
+            return response.content
         except requests.Timeout:
             logger.error(f"Timeout fetching {url}")
             raise FbrefScraperError(f"Request timeout: {url}")
@@ -93,80 +238,167 @@ class FbrefScraper:
             logger.error(f"Request error for {url}: {e}")
             raise FbrefScraperError(f"Request error: {e}")
 
-    def scrape_league_standings(self, league_code: str, season: str) -> List[Dict[str, Any]]:
+    def _fetch_url(self, url: str, expire_after: Any = None) -> Optional[BeautifulSoup]:
+        """
+        Fetch and parse a URL with rate limiting.
+
+        Args:
+            url: URL to fetch
+            expire_after: Cache lifetime override for this URL (only used when
+                the HTTP cache is enabled)
+
+        Returns:
+            BeautifulSoup object or None if request fails
+
+        Raises:
+            FbrefScraperError: If request fails
+        """
+        return BeautifulSoup(self._fetch_content(url, expire_after), "lxml")
+
+    def _fetch_tree(self, url: str) -> lxml_html.HtmlElement:
+        """
+        Fetch a URL and parse it into an lxml element tree.
+
+        Used where pages are queried with XPath, which runs in C instead of
+        walking a BeautifulSoup tree in Python.
+
+        Args:
+            url: URL to fetch
+
+        Returns:
+            Root HtmlElement of the page
+
+        Raises:
+            FbrefScraperError: If request fails or the page cannot be parsed
+        """
+        content = self._fetch_content(url)
+        try:
+            return lxml_html.fromstring(content)
+        except (etree.ParserError, ValueError) as e:
+            logger.error(f"Error parsing {url}: {e}")
+            raise FbrefScraperError(f"Failed to parse page {url}: {e}")
+
+    def scrape_league_standings(self, league_code: str, season: str) -> pd.DataFrame:
         """
         Scrape league standings and team statistics.
 
+        The standings are returned as one frame rather than per-team dicts so
+        callers can write them in a single batch, e.g.
+        ``session.bulk_insert_mappings(Model, standings.to_dict('records'))``.
+
         Args:
             league_code: League code (e.g., 'EPL' for English Premier League)
             season: Season (e.g., '2023-24')
 
         Returns:
-            List of team data dictionaries with standings and stats
+            DataFrame with one row per team: a ``name`` column followed by the
+            integer STANDINGS_INT_COLUMNS; empty (with those columns) if no
+            standings table was found
 
         Example:
             >>> scraper = FbrefScraper()
             >>> teams = scraper.scrape_league_standings('EPL', '2023-24')
         """
+        url = self._league_schedule_url(league_code, season)
+        soup = self._fetch_url(url, expire_after=self._season_expire_after(season))
+        if not soup:
+            raise FbrefScraperError(f"Failed to fetch standings for {league_code}")
+
+        return self._parse_standings(soup, league_code)
+
+    def scrape_league_standings_many(
+        self, league_code: str, seasons: List[str], max_workers: int = 4
+    ) -> Dict[str, pd.DataFrame]:
+        """
+        Scrape league standings for several seasons concurrently.
+
+        Requests still start at most once per request_delay (the rate limiter
+        is shared across threads), but a page is parsed while the next one is
+        in flight instead of fetching and parsing strictly in turn.
+
+        Args:
+            league_code: League code (e.g., 'EPL')
+            seasons: Seasons to scrape (e.g., ['2022-23', '2023-24'])
+            max_workers: Maximum number of pages in flight at once
+
+        Returns:
+            Dictionary mapping each season to its standings DataFrame
+
+        Raises:
+            FbrefScraperError: If the league code is unknown or any page fails
+        """
+        urls = [self._league_schedule_url(league_code, season) for season in seasons]
+
+        def fetch_and_parse(url: str, season: str) -> pd.DataFrame:
+            soup = self._fetch_url(url, expire_after=self._season_expire_after(season))
+            if not soup:
+                raise FbrefScraperError(f"Failed to fetch standings for {league_code}")
+            return self._parse_standings(soup, league_code)
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            results = list(executor.map(fetch_and_parse, urls, seasons))
+
+        return dict(zip(seasons, results))
+
+    def _season_expire_after(self, season: str) -> Optional[int]:
+        """
+        Get the cache lifetime for a season's pages.
+
+        Finished seasons never change, so they are cached forever (-1); the
+        current season uses the session default (None).
+        """
+        season_year = _parse_season_year(season)
+        try:
+            end_year = 2000 + int(season_year[-2:])
+        except ValueError:
+            return None
+        return -1 if end_year < datetime.utcnow().year else None
+
+    def _league_schedule_url(self, league_code: str, season: str) -> str:
+        """
+        Build the FBref schedule URL for a league season.
+
+        Raises:
+            FbrefScraperError: If the league code is unknown
+        """
         # Convert season format if needed (e.g., 2023-24 -> 2024)
-        season_year = self._parse_season_year(season)
-
-        # FBref URLs for different leagues
-        league_urls = {
-            'EPL': f'{self.BASE_URL}/comps/9/{season_year}/schedule/',
-            'LA_LIGA': f'{self.BASE_URL}/comps/12/{season_year}/schedule/',
-            'SERIE_A': f'{self.BASE_URL}/comps/11/{season_year}/schedule/',
-            'BUNDESLIGA': f'{self.BASE_URL}/comps/20/{season_year}/schedule/',
-            'LIGUE_1': f'{self.BASE_URL}/comps/13/{season_year}/schedule/',
-        }
+        season_year = _parse_season_year(season)
 
-        if league_code not in league_urls:
+        if league_code not in LEAGUE_COMP_IDS:
             raise FbrefScraperError(f"Unknown league code: {league_code}")
 
-        url = league_urls[league_code]
-        soup = self._fetch_url(url)
-        if not soup:
-            raise FbrefScraperError(f"Failed to fetch standings for {league_code}")
+        return self.SCHEDULE_URL_TEMPLATE.format(
+            comp_id=LEAGUE_COMP_IDS[league_code], season_year=season_year
+        )
 
-        teams_data = []
+    def _parse_standings(self, soup: BeautifulSoup, league_code: str) -> pd.DataFrame:
+        """Extract the team standings frame from a parsed schedule page."""
+        teams = pd.DataFrame(columns=['name', *STANDINGS_INT_COLUMNS.values()])
         try:
             # Look for table with standings
             table = soup.find('table', {'id': 'sched_' + self._get_league_table_id(league_code)})
             if not table:
                 logger.warning(f"Could not find standings table for {league_code}")
-                return teams_data
-
-            rows = table.find_all('tr')[1:]  # Skip header row
-            for row in rows:
-                cells = row.find_all('td')
-                if len(cells) < 8:
-                    continue
-
-                team_name = cells[5].get_text(strip=True)
-                if not team_name:
-                    continue
-
-                team_data = {
-                    'name': team_name,
-                    'matches_played': self._safe_int(cells[6].get_text(strip=True)),
-                    'wins': self._safe_int(cells[7].get_text(strip=True)),
-                    'draws': self._safe_int(cells[8].get_text(strip=True)) if len(cells) > 8 else 0,
-                    'losses': self._safe_int(cells[9].get_text(strip=True)) if len(cells) > 9 else 0,
-                    'goals_for': self._safe_int(cells[10].get_text(strip=True)) if len(cells) > 10 else 0,
-                    'goals_against': self._safe_int(cells[11].get_text(strip=True)) if len(cells) > 11 else 0,
-                    'goal_difference': self._safe_int(cells[12].get_text(strip=True)) if len(cells) > 12 else 0,
-                    'points': self._safe_int(cells[13].get_text(strip=True)) if len(cells) > 13 else 0,
-                }
-                teams_data.append(team_data)
+                return teams
+
+            frame = self._table_frame(table, min_cells=8, width=14)
+            frame = frame[frame[5] != '']
+            if frame.empty:
+                return teams
+
+            teams = self._to_int_columns(frame[list(STANDINGS_INT_COLUMNS)])
+            teams.columns = list(STANDINGS_INT_COLUMNS.values())
+            teams.insert(0, 'name', frame[5])
+            teams = teams.reset_index(drop=True)
 
         except (AttributeError, ValueError) as e:
             logger.error(f"Error parsing standings table: {e}")
             raise FbrefScraperError(f"Failed to parse standings: {e}")
 
-        logger.info(f"Scraped {len(teams_data)} teams from {league_code}")
-        return teams_data
+        logger.info(f"Scraped {len(teams)} teams from {league_code}")
+        return teams
 
-    def scrape_team_matches(self, team_url: str) -> List[Dict[str, Any]]:
+    def scrape_team_matches(self, team_url: str) -> List[TeamMatchRow]:
         """
         Scrape match history for a specific team.
 
@@ -174,7 +406,8 @@ class FbrefScraper:
             team_url: Team page URL on FBref
 
         Returns:
-            List of match data dictionaries
+            List of TeamMatchRow tuples (use ``row._asdict()`` where a dict
+            is needed)
 
         Example:
             >>> url = "https://fbref.com/en/squads/..."
@@ -192,28 +425,18 @@ class FbrefScraper:
                 logger.warning(f"No match log table found for {team_url}")
                 return matches
 
-            rows = table.find_all('tr')[1:]  # Skip header
-            for row in rows:
-                cells = row.find_all('td')
-                if len(cells) < 10:
-                    continue
-
-                try:
-                    match_data = {
-                        'date': self._parse_date(cells[1].get_text(strip=True)),
-                        'time': cells[2].get_text(strip=True),
-                        'day': cells[3].get_text(strip=True),
-                        'competition': cells[4].get_text(strip=True),
-                        'round': cells[5].get_text(strip=True),
-                        'venue': cells[6].get_text(strip=True),
-                        'opponent': cells[7].get_text(strip=True),
-                        'result': cells[8].get_text(strip=True),
-                        'goals_for': self._safe_int(cells[9].get_text(strip=True)),
-                        'goals_against': self._safe_int(cells[10].get_text(strip=True)) if len(cells) > 10 else None,
-                    }
-                    matches.append(match_data)
-                except (ValueError, IndexError):
-                    continue
+            frame = self._table_frame(table, min_cells=10, width=11)
+            if frame.empty:
+                return matches
+
+            goals = self._to_int_columns(frame[[9, 10]]).astype(object)
+            match_frame = frame[list(MATCHLOG_TEXT_COLUMNS)].rename(columns=MATCHLOG_TEXT_COLUMNS)
+            dates = pd.Series([_parse_date(v) for v in frame[1]], index=frame.index, dtype=object)
+            match_frame.insert(0, 'date', dates)
+            match_frame['goals_for'] = goals[9]
+            # goals_against stays None when the row has no such cell
+            match_frame['goals_against'] = goals[10].where(frame[10].notna(), None)
+            matches = list(map(TeamMatchRow._make, match_frame.itertuples(index=False, name=None)))
 
         except AttributeError as e:
             logger.error(f"Error parsing match table: {e}")
@@ -232,12 +455,13 @@ class FbrefScraper:
         Returns:
             Dictionary with detailed match statistics
 
+        Raises:
+            FbrefScraperError: If the page cannot be fetched or parsed
+
         Example:
             >>> details = scraper.scrape_match_details(url)
         """
-        soup = self._fetch_url(match_url)
-        if not soup:
-            raise FbrefScraperError(f"Failed to fetch match page: {match_url}")
+        tree = self._fetch_tree(match_url)
 
         match_details = {
             'url': match_url,
@@ -249,50 +473,59 @@ class FbrefScraper:
             'away_stats': {},
         }
 
-        try:
-            # Extract score and teams from page title/header
-            title = soup.find('h1')
-            if title:
-                match_text = title.get_text(strip=True)
-                match_details['title'] = match_text
-
-            # Try to find the stats table
-            stats_tables = soup.find_all('table', {'class': 'stats_table'})
-
-            for table in stats_tables:
-                rows = table.find_all('tr')
-                for row in rows:
-                    cells = row.find_all(['td', 'th'])
-                    if len(cells) >= 3:
-                        stat_name = cells[0].get_text(strip=True)
-                        home_value = cells[1].get_text(strip=True)
-                        away_value = cells[2].get_text(strip=True)
-
-                        if stat_name:
-                            match_details['home_stats'][stat_name] = self._safe_float(home_value)
-                            match_details['away_stats'][stat_name] = self._safe_float(away_value)
+        # Extract score and teams from page title/header
+        titles = tree.xpath('//h1')
+        if titles:
+            match_details['title'] = titles[0].text_content().strip()
 
-        except AttributeError as e:
-            logger.error(f"Error parsing match details: {e}")
-            raise FbrefScraperError(f"Failed to parse match details: {e}")
+        # Every stats table row with a name, home and away value
+        for row in tree.xpath(MATCH_STATS_ROWS_XPATH):
+            cells = row.xpath('./td|./th')
+            stat_name, home_value, away_value = (
+                lxml_html.tostring(cell, method='text', encoding='unicode', with_tail=False).strip()
+                for cell in cells[:3]
+            )
+
+            if stat_name:
+                match_details['home_stats'][stat_name] = self._safe_float(home_value)
+                match_details['away_stats'][stat_name] = self._safe_float(away_value)
 
         return match_details
 
-    # Utility methods
     @staticmethod
-    def _parse_season_year(season: str) -> str:
+    def _table_frame(table, min_cells: int, width: int) -> pd.DataFrame:
         """
-        Parse season string to year for URL construction.
+        Collect the stripped cell text of a table into a DataFrame.
+
+        The header row and rows with fewer than ``min_cells`` cells are skipped;
+        shorter rows are padded with None up to ``width`` columns so values can
+        then be converted column-wise.
 
         Args:
-            season: Season string (e.g., '2023-24')
+            table: BeautifulSoup table element
+            min_cells: Minimum number of <td> cells for a row to be kept
+            width: Number of columns in the resulting frame
 
         Returns:
-            Year string (e.g., '2024')
+            DataFrame with integer column labels 0..width-1
         """
-        if '-' in season:
-            return season.split('-')[1]
-        return season[-2:]
+        rows = []
+        for row in table.find_all('tr')[1:]:  # Skip header row
+            cells = [cell.get_text(strip=True) for cell in row.find_all('td')]
+            if len(cells) >= min_cells:
+                rows.append(cells[:width] + [None] * (width - len(cells)))
+        return pd.DataFrame(rows, columns=range(width))
+
+    @staticmethod
+    def _to_int_columns(frame: pd.DataFrame) -> pd.DataFrame:
+        """Convert text columns to integers, treating unparseable values as 0."""
+        return frame.apply(pd.to_numeric, errors='coerce').fillna(0).astype(np.int64)
+
+    # Utility methods
+    @staticmethod
+    def _parse_season_year(season: str) -> str:
+        """Parse season string to year for URL construction (memoized)."""
+        return _parse_season_year(season)
 
     @staticmethod
     def _get_league_table_id(league_code: str) -> str:
@@ -308,21 +541,8 @@ class FbrefScraper:
 
     @staticmethod
     def _parse_date(date_str: str) -> Optional[datetime]:
-        """
-        Parse date string to datetime object.
-
-        Args:
-            date_str: Date string (e.g., '2023-08-12')
-
-        Returns:
-            Datetime object or None if parsing fails
-        """
-        for fmt in ['%Y-%m-%d', '%d/%m/%Y', '%d %b %Y']:
-            try:
-                return datetime.strptime(date_str, fmt)
-            except ValueError:
-                continue
-        return None
+        """Parse date string to datetime object (memoized)."""
+        return _parse_date(date_str)
 
     @staticmethod
     def _safe_int(value: str) -> int:
@@ -8,15 +8,58 @@ This module provides functionality to:
 4. Handle data deduplication and conflicts
 """
 
+import hashlib
+import json
 import logging
-from datetime import datetime
-from typing import Dict, List, Optional, Any, Tuple
-
+import string
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from itertools import chain
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+import pandas as pd
+from sqlalchemy import bindparam, func, insert, select
+from sqlalchemy.dialects import postgresql, sqlite
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import IntegrityError
 
+
+def _dumps_json_stdlib(data: Any, sort_keys: bool = False) -> str:
+    # Compact, unescaped output identical to orjson's, so payload hashes
+    # don't change with whether orjson is installed
+    return json.dumps(data, sort_keys=sort_keys, separators=(',', ':'), ensure_ascii=False)
+
+
+try:
+    import orjson
+
+    def _dumps_json(data: Any, sort_keys: bool = False) -> str:
+        option = orjson.OPT_NON_STR_KEYS
+        if sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        return orjson.dumps(data, option=option).decode('utf-8')
+except ImportError:  # pragma: no cover - optional speedup
+    _dumps_json = _dumps_json_stdlib
+
+try:
+    from ciso8601 import parse_datetime as _parse_iso_datetime
+except ImportError:  # pragma: no cover - optional speedup
+    if sys.version_info >= (3, 11):
+        # fromisoformat understands the trailing 'Z' natively since 3.11
+        _parse_iso_datetime = datetime.fromisoformat
+    else:
+        def _parse_iso_datetime(date_str: str) -> datetime:
+            return datetime.fromisoformat(date_str.replace('Z', '+00:00'))
+
+try:
+    from rapidfuzz import process as fuzzy_process
+except ImportError:  # pragma: no cover - optional fuzzy team matching
+    fuzzy_process = None
+
 from src.db.models import (
     League,
+    LeagueFetchLog,
     Team,
     Match,
     TeamStats,
@@ -31,6 +74,77 @@ from src.scraper.fbref_scraper import FbrefScraper
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# League code -> full name and country
+LEAGUE_INFO = {
+    'EPL': {'name': 'Premier League', 'country': 'England'},
+    'LA_LIGA': {'name': 'La Liga', 'country': 'Spain'},
+    'SERIE_A': {'name': 'Serie A', 'country': 'Italy'},
+    'BUNDESLIGA': {'name': 'Bundesliga', 'country': 'Germany'},
+    'LIGUE_1': {'name': 'Ligue 1', 'country': 'France'},
+}
+
+# Dialects with a native "insert, ignoring conflicts" statement
+NATIVE_INSERT_IGNORE_DIALECTS = {'postgresql', 'sqlite', 'mysql', 'mariadb'}
+
+# Length of the window fetched after the latest finished match of a league
+INCREMENTAL_FETCH_DAYS = 365
+# Days before the latest finished match that are fetched again, so late
+# result corrections and rescheduled fixtures around it are picked up
+INCREMENTAL_FETCH_OVERLAP_DAYS = 3
+
+# Minimum rapidfuzz score for a variant team name to count as a match
+FUZZY_TEAM_SCORE = 90
+
+# Match columns refreshed from the source when a stored match is seen again
+# (kick-off moves, live scores, the final result)
+MATCH_UPDATE_FIELDS = ('match_date', 'home_goals', 'away_goals', 'status')
+
+_PUNCT_TRANS = str.maketrans('', '', string.punctuation)
+
+# Lookup statements built once so repeated pipeline runs reuse them instead
+# of rebuilding the ORM query (and its cache key) on every call
+_LEAGUE_LOOKUP_STMT = select(League).where(
+    League.external_id == bindparam('ext'),
+    League.season == bindparam('season'),
+)
+_MATCHES_BY_EXTERNAL_ID_STMT = select(Match).where(
+    Match.external_id.in_(bindparam('external_ids', expanding=True))
+)
+
+
+def _naive_utc(value: datetime) -> datetime:
+    """Convert an aware datetime to naive UTC, as stored in the DateTime columns."""
+    if value.tzinfo is None:
+        return value
+    return value.astimezone(timezone.utc).replace(tzinfo=None)
+
+
+def _external_id(value: Any) -> Optional[str]:
+    """Source id as stored in external_id columns; None when the source gave none."""
+    if value is None or value == '':
+        return None
+    return str(value)
+
+
+def _normkey(name: str) -> str:
+    """Normalize a team name for lookups (case, punctuation, whitespace)."""
+    return ' '.join(name.lower().translate(_PUNCT_TRANS).split())
+
+
+def _to_int_column(values: pd.Series) -> pd.Series:
+    """Convert a column to Python ints, with missing values as NA."""
+    return pd.to_numeric(values).astype('Int64').astype(object)
+
+
+# Source status strings -> MatchStatus
+STATUS_MAP = {
+    'SCHEDULED': MatchStatus.SCHEDULED,
+    'LIVE': MatchStatus.LIVE,
+    'FINISHED': MatchStatus.FINISHED,
+    'POSTPONED': MatchStatus.POSTPONED,
+    'CANCELLED': MatchStatus.CANCELLED,
+}
+
 
 class PipelineError(Exception):
     """Base exception for pipeline errors."""
@@ -53,6 +167,7 @@ class DataPipeline:
         db_session: Session,
         football_data_key: Optional[str] = None,
         api_football_key: Optional[str] = None,
+        on_match_updated: Optional[Callable[[int], None]] = None,
     ):
         """
         Initialize the data pipeline.
@@ -61,8 +176,11 @@ class DataPipeline:
             db_session: SQLAlchemy database session
             football_data_key: API key for football-data.org
             api_football_key: API key for api-football.com
+            on_match_updated: Called with the id of every stored match whose
+                date, score or status changed, e.g. to drop cached predictions
         """
         self.db = db_session
+        self.on_match_updated = on_match_updated
         self.fbref = FbrefScraper()
         self.football_data = (
             FootballDataClient(football_data_key)
@@ -107,40 +225,23 @@ class DataPipeline:
             'errors': [],
         }
 
-        # Fetch from FBref
+        # Sources are independent HTTP calls, so fetch them concurrently;
+        # results are merged in source order to keep the output deterministic
+        fetchers = []
         if 'fbref' in sources:
-            try:
-                logger.info(f"Fetching FBref data for {league_code}...")
-                standings = self.fbref.scrape_league_standings(league_code, season)
-                data['standings'].extend(standings)
-            except Exception as e:
-                logger.error(f"FBref fetch failed: {e}")
-                data['errors'].append(f"FBref: {str(e)}")
-
-        # Fetch from football-data.org
+            fetchers.append(('FBref', self._fetch_fbref_standings))
         if 'football_data' in sources and self.football_data:
-            try:
-                logger.info(f"Fetching football-data.org data for {league_code}...")
-                standings = self.football_data.get_standings(league_code)
-                for team in standings:
-                    if 'team' in team:
-                        data['standings'].append(team['team'])
-            except Exception as e:
-                logger.error(f"football-data.org fetch failed: {e}")
-                data['errors'].append(f"football-data.org: {str(e)}")
-
-        # Fetch from api-football.com
+            fetchers.append(('football-data.org', self._fetch_football_data_standings))
         if 'api_football' in sources and self.api_football:
-            try:
-                logger.info(f"Fetching api-football.com data for {league_code}...")
-                league_id = ApiFootballClient.LEAGUE_IDS.get(league_code)
-                if league_id:
-                    season_year = int(season.split('-')[0])
-                    standings = self.api_football.get_league_standings(league_id, season_year)
-                    data['standings'].extend(standings)
-            except Exception as e:
-                logger.error(f"api-football.com fetch failed: {e}")
-                data['errors'].append(f"api-football.com: {str(e)}")
+            fetchers.append(('api-football.com', self._fetch_api_football_standings))
+
+        results = self._run_fetchers(fetchers, league_code, season)
+        data['errors'] = [
+            f"{source_name}: {error}"
+            for source_name, _, error in results
+            if error is not None
+        ]
+        data['standings'] = list(chain.from_iterable(standings for _, standings, _ in results))
 
         if not data['standings']:
             raise PipelineError(f"Could not fetch any league data for {league_code}")
@@ -155,8 +256,9 @@ class DataPipeline:
         self,
         league_code: str,
         season: str,
-        status: str = 'SCHEDULED',
+        status: Optional[str] = 'SCHEDULED',
         sources: List[str] = None,
+        since: Optional[datetime] = None,
     ) -> List[Dict[str, Any]]:
         """
         Fetch matches from multiple sources.
@@ -164,11 +266,14 @@ class DataPipeline:
         Args:
             league_code: League code
             season: Season
-            status: Match status filter
+            status: Match status filter (None for every status)
             sources: List of sources to fetch from
+            since: Only request matches from this date on (the following
+                INCREMENTAL_FETCH_DAYS days); fetches everything if None
 
         Returns:
-            List of match dictionaries
+            List of match dictionaries; empty for an incremental fetch that
+            found no matches in its window
 
         Raises:
             PipelineError: If no data can be fetched
@@ -176,42 +281,118 @@ class DataPipeline:
         if sources is None:
             sources = ['football_data', 'api_football']
 
-        matches = []
-
-        # Fetch from football-data.org
+        fetchers = []
         if 'football_data' in sources and self.football_data:
-            try:
-                logger.info(f"Fetching matches from football-data.org for {league_code}...")
-                league_matches = self.football_data.get_current_matches(
-                    league_code,
-                    status=status
-                )
-                matches.extend(league_matches)
-            except Exception as e:
-                logger.error(f"football-data.org match fetch failed: {e}")
-
-        # Fetch from api-football.com
+            fetchers.append(('football-data.org', self._fetch_football_data_matches))
         if 'api_football' in sources and self.api_football:
-            try:
-                logger.info(f"Fetching matches from api-football.com for {league_code}...")
-                league_id = ApiFootballClient.LEAGUE_IDS.get(league_code)
-                if league_id:
-                    season_year = int(season.split('-')[0])
-                    league_matches = self.api_football.get_fixtures(
-                        league_id,
-                        season_year,
-                        status=status
-                    )
-                    matches.extend(league_matches)
-            except Exception as e:
-                logger.error(f"api-football.com match fetch failed: {e}")
+            fetchers.append(('api-football.com', self._fetch_api_football_matches))
+
+        date_range = (None, None)
+        if since is not None:
+            date_range = (
+                since.strftime('%Y-%m-%d'),
+                (since + timedelta(days=INCREMENTAL_FETCH_DAYS)).strftime('%Y-%m-%d'),
+            )
 
-        if not matches:
+        matches = []
+        results = self._run_fetchers(fetchers, league_code, season, status, *date_range)
+        for _, league_matches, error in results:
+            if error is None:
+                matches.extend(league_matches)
+
+        # An incremental window with no fixtures is normal; a full fetch with
+        # none, or every source failing, is not
+        if not matches and (since is None or all(error for _, _, error in results)):
             raise PipelineError(f"Could not fetch matches for {league_code}")
 
         logger.info(f"Fetched {len(matches)} matches")
         return matches
 
+    @staticmethod
+    def _run_fetchers(fetchers: List[Tuple[str, Any]], *args) -> List[Tuple[str, list, Optional[str]]]:
+        """
+        Run source fetchers concurrently in a thread pool.
+
+        Args:
+            fetchers: (source name, callable) pairs; each callable is called
+                with ``*args`` and returns a list
+            *args: Arguments passed to every fetcher
+
+        Returns:
+            (source name, results, error message or None) per fetcher, in the
+            order the fetchers were given
+        """
+        if not fetchers:
+            return []
+
+        with ThreadPoolExecutor(max_workers=len(fetchers)) as executor:
+            futures = [
+                (source_name, executor.submit(fetcher, *args))
+                for source_name, fetcher in fetchers
+            ]
+
+        results = []
+        for source_name, future in futures:
+            try:
+                results.append((source_name, future.result(), None))
+            except Exception as e:
+                logger.error(f"{source_name} fetch failed: {e}")
+                results.append((source_name, [], str(e)))
+        return results
+
+    def _fetch_fbref_standings(self, league_code: str, season: str) -> List[Dict[str, Any]]:
+        """Fetch league standings from FBref."""
+        logger.info(f"Fetching FBref data for {league_code}...")
+        standings = self.fbref.scrape_league_standings(league_code, season)
+        return standings.to_dict('records')
+
+    def _fetch_football_data_standings(self, league_code: str, season: str) -> List[Dict[str, Any]]:
+        """Fetch league standings from football-data.org."""
+        logger.info(f"Fetching football-data.org data for {league_code}...")
+        standings = self.football_data.get_standings(league_code)
+        return [team['team'] for team in standings if 'team' in team]
+
+    def _fetch_api_football_standings(self, league_code: str, season: str) -> List[Dict[str, Any]]:
+        """Fetch league standings from api-football.com."""
+        logger.info(f"Fetching api-football.com data for {league_code}...")
+        league_id = ApiFootballClient.LEAGUE_IDS.get(league_code)
+        if not league_id:
+            return []
+        season_year = int(season.split('-')[0])
+        return self.api_football.get_league_standings(league_id, season_year)
+
+    def _fetch_football_data_matches(
+        self,
+        league_code: str,
+        season: str,
+        status: Optional[str],
+        date_from: Optional[str] = None,
+        date_to: Optional[str] = None,
+    ) -> List[Dict[str, Any]]:
+        """Fetch matches from football-data.org."""
+        logger.info(f"Fetching matches from football-data.org for {league_code}...")
+        return self.football_data.get_current_matches(
+            league_code, status=status, date_from=date_from, date_to=date_to
+        )
+
+    def _fetch_api_football_matches(
+        self,
+        league_code: str,
+        season: str,
+        status: Optional[str],
+        date_from: Optional[str] = None,
+        date_to: Optional[str] = None,
+    ) -> List[Dict[str, Any]]:
+        """Fetch matches from api-football.com."""
+        logger.info(f"Fetching matches from api-football.com for {league_code}...")
+        league_id = ApiFootballClient.LEAGUE_IDS.get(league_code)
+        if not league_id:
+            return []
+        season_year = int(season.split('-')[0])
+        return self.api_football.get_fixtures(
+            league_id, season_year, status=status, date_from=date_from, date_to=date_to
+        )
+
     def transform_to_league(
         self,
         league_code: str,
@@ -230,18 +411,10 @@ class DataPipeline:
             League ORM model instance
         """
         # Map league code to full name and country
-        league_info = {
-            'EPL': {'name': 'Premier League', 'country': 'England'},
-            'LA_LIGA': {'name': 'La Liga', 'country': 'Spain'},
-            'SERIE_A': {'name': 'Serie A', 'country': 'Italy'},
-            'BUNDESLIGA': {'name': 'Bundesliga', 'country': 'Germany'},
-            'LIGUE_1': {'name': 'Ligue 1', 'country': 'France'},
-        }
-
-        if league_code not in league_info:
+        if league_code not in LEAGUE_INFO:
             raise PipelineError(f"Unknown league code: {league_code}")
 
-        info = league_info[league_code]
+        info = LEAGUE_INFO[league_code]
         league = League(
             name=info['name'],
             country=info['country'],
@@ -312,20 +485,13 @@ class DataPipeline:
         # Parse date
         date_str = match_data.get('utcDate') or match_data.get('date')
         if isinstance(date_str, str):
-            match_date = datetime.fromisoformat(date_str.replace('Z', '+00:00'))
+            match_date = _naive_utc(_parse_iso_datetime(date_str))
         else:
             match_date = datetime.utcnow()
 
         # Map status
         status_str = match_data.get('status', 'SCHEDULED')
-        status_map = {
-            'SCHEDULED': MatchStatus.SCHEDULED,
-            'LIVE': MatchStatus.LIVE,
-            'FINISHED': MatchStatus.FINISHED,
-            'POSTPONED': MatchStatus.POSTPONED,
-            'CANCELLED': MatchStatus.CANCELLED,
-        }
-        status = status_map.get(status_str, MatchStatus.SCHEDULED)
+        status = STATUS_MAP.get(status_str, MatchStatus.SCHEDULED)
 
         # Extract scores
         score = match_data.get('score', {})
@@ -344,7 +510,7 @@ class DataPipeline:
             home_goals=home_goals,
             away_goals=away_goals,
             status=status,
-            external_id=str(match_data.get('id', '')),
+            external_id=_external_id(match_data.get('id')),
         )
 
         return match
@@ -366,12 +532,10 @@ class DataPipeline:
         Returns:
             MatchStats ORM model instance
         """
-        import json
-
         match_stats = MatchStats(
             match_id=match.id,
             source=source,
-            data_json=json.dumps(stats_data) if stats_data else None,
+            data_json=_dumps_json(stats_data) if stats_data else None,
         )
 
         return match_stats
@@ -391,16 +555,21 @@ class DataPipeline:
         Returns:
             Existing or newly created League
         """
-        existing = self.db.query(League).filter(
-            League.external_id == league_code,
-            League.season == season,
-        ).first()
+        params = {'ext': league_code, 'season': season}
+        existing = self.db.execute(_LEAGUE_LOOKUP_STMT, params).scalar_one_or_none()
 
         if existing:
             logger.info(f"League {league_code} {season} already exists")
             return existing
 
         league = self.transform_to_league(league_code, season)
+        if self._insert_ignore(League, [league], ['external_id', 'season']):
+            stored = self.db.execute(_LEAGUE_LOOKUP_STMT, params).scalar_one_or_none()
+            if stored is None:
+                raise PipelineError(f"Failed to create league: {league_code} {season} conflicts")
+            logger.info(f"Created league {league_code} {season}")
+            return stored
+
         try:
             self.db.add(league)
             self.db.commit()
@@ -414,52 +583,188 @@ class DataPipeline:
     def insert_or_update_teams(
         self,
         league: League,
-        teams_data: List[Dict[str, Any]],
+        teams_data: Iterable[Dict[str, Any]],
     ) -> List[Team]:
         """
         Insert or update teams in database.
 
         Args:
             league: Parent League
-            teams_data: List of team data dictionaries
+            teams_data: Team data dictionaries; any iterable, consumed once
 
         Returns:
-            List of Team instances (existing and new)
+            List of unique Team instances (existing and new)
         """
+        # Single pass over the input, keeping the first entry per team name;
+        # sources overlap, so the same team usually appears several times
+        first_by_name = {}
+        for team_data in teams_data:
+            team_name = team_data.get('name', '') if isinstance(team_data, dict) else str(team_data)
+            if team_name:
+                first_by_name.setdefault(team_name, team_data)
+
+        # Fetch all existing teams of the league in one query
+        teams_by_name = {
+            team.name: team
+            for team in self.db.query(Team).filter(
+                Team.league_id == league.id,
+                Team.name.in_(list(first_by_name)),
+            ).all()
+        }
+
         teams = []
+        new_teams = []
+        for team_name, team_data in first_by_name.items():
+            if team_name not in teams_by_name:
+                team = self.transform_to_team(team_data, league)
+                teams_by_name[team_name] = team
+                new_teams.append(team)
+
+            teams.append(teams_by_name[team_name])
+
+        if self._insert_ignore(Team, new_teams, ['league_id', 'name']):
+            # Swap the inserted (or concurrently created) rows in for the
+            # transient instances
+            stored = {
+                team.name: team
+                for team in self.db.query(Team).filter(
+                    Team.league_id == league.id,
+                    Team.name.in_([team.name for team in new_teams]),
+                ).all()
+            }
+            teams = [stored.get(team.name, team) for team in teams]
+            unstored = new_teams
+        else:
+            unstored = self._add_all_and_commit(new_teams)
+        if new_teams:
+            logger.debug(f"Created {len(new_teams)} teams")
 
-        for team_data in teams_data:
-            # Extract team name
-            if isinstance(team_data, dict):
-                team_name = team_data.get('name', '')
-            else:
-                team_name = str(team_data)
+        return [team for team in teams if team not in unstored]
 
-            if not team_name:
-                continue
+    @staticmethod
+    def _find_team(team_dict: Dict[str, Team], name: str) -> Optional[Team]:
+        """
+        Look up a team by normalized name, falling back to fuzzy matching.
 
-            # Check if team exists
-            existing = self.db.query(Team).filter(
-                Team.name == team_name,
-                Team.league_id == league.id,
-            ).first()
+        Args:
+            team_dict: Teams keyed by _normkey(name)
+            name: Team name as spelled by the data source
 
-            if existing:
-                teams.append(existing)
-                continue
+        Returns:
+            Matching Team or None
+        """
+        key = _normkey(name)
+        team = team_dict.get(key)
+        if team is not None or fuzzy_process is None or not team_dict:
+            return team
+
+        best = fuzzy_process.extractOne(key, team_dict.keys(), score_cutoff=FUZZY_TEAM_SCORE)
+        return team_dict[best[0]] if best else None
+
+    @staticmethod
+    def _dedupe_by_external_id(records: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Keep the first record for each external id, preserving order.
+
+        Records without an id are kept as they are.
+        """
+        seen = set()
+        unique = []
+        for record in records:
+            external_id = record.get('id')
+            if external_id:
+                key = str(external_id)
+                if key in seen:
+                    continue
+                seen.add(key)
+            unique.append(record)
+        return unique
+
+    @staticmethod
+    def _payload_hash(*payloads: Any) -> str:
+        """Return a stable blake2b digest of JSON-serializable payloads."""
+        digest = hashlib.blake2b(digest_size=32)
+        for payload in payloads:
+            digest.update(_dumps_json(payload, sort_keys=True).encode('utf-8'))
+        return digest.hexdigest()
+
+    def _insert_ignore(self, model: Any, objects: List[Any], conflict_columns: List[str]) -> bool:
+        """
+        Insert new rows in one statement, skipping rows that already exist.
+
+        Uses the dialect's native conflict handling (ON CONFLICT DO NOTHING on
+        PostgreSQL/SQLite, INSERT IGNORE on MySQL) so no SELECT-then-INSERT
+        round-trips or IntegrityError rollbacks are needed. The given
+        instances are not attached to the session; callers re-query the rows.
+
+        Args:
+            model: ORM model class
+            objects: Transient model instances (or column dicts) to insert
+            conflict_columns: Columns of the unique index that detects duplicates
+
+        Returns:
+            True if the rows were inserted natively, False if the dialect is not
+            supported and the caller should fall back to _add_all_and_commit
+        """
+        if not objects:
+            return False
 
-            # Create new team
-            team = self.transform_to_team(team_data, league)
+        dialect = self.db.get_bind().dialect.name
+        if dialect not in NATIVE_INSERT_IGNORE_DIALECTS:
+            return False
+
+        if dialect == 'postgresql':
+            stmt = postgresql.insert(model).on_conflict_do_nothing(index_elements=conflict_columns)
+        elif dialect == 'sqlite':
+            stmt = sqlite.insert(model).on_conflict_do_nothing(index_elements=conflict_columns)
+        else:
+            stmt = insert(model).prefix_with('IGNORE')
+
+        # Leave unset columns out so column defaults still apply
+        columns = [column.key for column in model.__table__.columns if not column.primary_key]
+        rows = [
+            obj if isinstance(obj, dict)
+            else {key: getattr(obj, key) for key in columns if getattr(obj, key) is not None}
+            for obj in objects
+        ]
+        self.db.execute(stmt, rows)
+        self.db.commit()
+        return True
+
+    def _add_all_and_commit(self, objects: List[Any]) -> List[Any]:
+        """
+        Insert new ORM objects with a single commit.
+
+        If the batch violates a constraint, it is rolled back and retried row
+        by row so that only the offending objects are skipped.
+
+        Args:
+            objects: New ORM instances to insert
+
+        Returns:
+            Objects that could not be inserted
+        """
+        if not objects:
+            return []
+
+        try:
+            self.db.add_all(objects)
+            self.db.commit()
+            return []
+        except IntegrityError as e:
+            self.db.rollback()
+            logger.warning(f"Bulk insert failed, retrying row by row: {e}")
+
+        failed = []
+        for obj in objects:
             try:
-                self.db.add(team)
+                self.db.add(obj)
                 self.db.commit()
-                logger.debug(f"Created team {team_name}")
-                teams.append(team)
             except IntegrityError as e:
                 self.db.rollback()
-                logger.warning(f"Failed to create team {team_name}: {e}")
-
-        return teams
+                logger.warning(f"Failed to insert {obj!r}: {e}")
+                failed.append(obj)
+        return failed
 
     def insert_or_update_matches(
         self,
@@ -478,67 +783,172 @@ class DataPipeline:
         Returns:
             List of Match instances (existing and new)
         """
-        matches = []
-        team_dict = {team.name: team for team in teams}
-
-        for match_data in matches_data:
-            # Extract team names and find Team instances
-            home_name = None
-            away_name = None
-
-            # Handle different data source formats
-            if 'homeTeam' in match_data:
-                home_name = match_data['homeTeam'].get('name', '')
-            elif 'teams' in match_data:
-                home_name = match_data['teams']['home'].get('name', '')
-
-            if 'awayTeam' in match_data:
-                away_name = match_data['awayTeam'].get('name', '')
-            elif 'teams' in match_data:
-                away_name = match_data['teams']['away'].get('name', '')
-
-            if not home_name or not away_name:
-                logger.warning(f"Could not extract team names from match data")
-                continue
-
-            # Find Team instances
-            home_team = team_dict.get(home_name)
-            away_team = team_dict.get(away_name)
-
-            if not home_team or not away_team:
-                logger.warning(
-                    f"Could not find teams for match: {home_name} vs {away_name}"
-                )
-                continue
-
-            # Check if match exists
-            external_id = match_data.get('id')
-            if external_id:
-                existing = self.db.query(Match).filter(
-                    Match.external_id == str(external_id)
-                ).first()
+        team_dict = {_normkey(team.name): team for team in teams}
 
-                if existing:
-                    matches.append(existing)
-                    continue
+        # Drop repeated fixtures (e.g. the same match returned by several
+        # pages or retries) so each is looked up and inserted once
+        matches_data = self._dedupe_by_external_id(matches_data)
 
-            # Create new match
-            try:
-                match = self.transform_to_match(
-                    match_data,
-                    league,
-                    home_team,
-                    away_team,
-                )
-                self.db.add(match)
-                self.db.commit()
-                logger.debug(f"Created match {home_name} vs {away_name}")
-                matches.append(match)
-            except IntegrityError as e:
-                self.db.rollback()
-                logger.warning(f"Failed to create match: {e}")
+        records = self.transform_matches_batch(matches_data, league.id, team_dict)
+        if len(records) < len(matches_data):
+            logger.warning(
+                f"Skipped {len(matches_data) - len(records)} matches with unknown teams"
+            )
 
-        return matches
+        # Fetch all already-stored matches in one query
+        external_ids = {record['external_id'] for record in records if record['external_id']}
+        existing_by_id = {}
+        if external_ids:
+            existing_by_id = {
+                match.external_id: match
+                for match in self.db.execute(
+                    _MATCHES_BY_EXTERNAL_ID_STMT, {'external_ids': list(external_ids)}
+                ).scalars().all()
+            }
+
+        # Existing Match instances, or positions in new_records
+        slots = []
+        new_records = []
+        updated = []
+        for record in records:
+            existing = existing_by_id.get(record['external_id']) if record['external_id'] else None
+            if existing:
+                if self._update_match(existing, record):
+                    updated.append(existing)
+                slots.append(existing)
+            else:
+                slots.append(len(new_records))
+                new_records.append(record)
+
+        if updated:
+            self.db.commit()
+            if self.on_match_updated is not None:
+                for match in updated:
+                    self.on_match_updated(match.id)
+            logger.debug(f"Updated {len(updated)} matches")
+
+        # Rows without an external id have no unique key to conflict on (or to
+        # find them by afterwards), so only keyed rows take the native path
+        new_matches = [None] * len(new_records)
+        keyed = [i for i, record in enumerate(new_records) if record['external_id']]
+        if self._insert_ignore(Match, [new_records[i] for i in keyed], ['external_id']):
+            stored = {
+                match.external_id: match
+                for match in self.db.execute(
+                    _MATCHES_BY_EXTERNAL_ID_STMT,
+                    {'external_ids': [new_records[i]['external_id'] for i in keyed]},
+                ).scalars().all()
+            }
+            for i in keyed:
+                new_matches[i] = stored.get(new_records[i]['external_id'])
+            pending = [i for i, record in enumerate(new_records) if not record['external_id']]
+        else:
+            pending = list(range(len(new_records)))
+
+        added = [Match(**new_records[i]) for i in pending]
+        unstored = self._add_all_and_commit(added)
+        for i, match in zip(pending, added):
+            new_matches[i] = match if match not in unstored else None
+        if new_records:
+            logger.debug(f"Created {len(new_records)} matches")
+
+        matches = [slot if isinstance(slot, Match) else new_matches[slot] for slot in slots]
+        return [match for match in matches if match is not None]
+
+    @staticmethod
+    def _update_match(match: Match, record: Dict[str, Any]) -> bool:
+        """
+        Copy changed MATCH_UPDATE_FIELDS from a transformed record onto a stored match.
+
+        Args:
+            match: Stored Match instance
+            record: Match column dictionary from transform_matches_batch
+
+        Returns:
+            True if any field changed
+        """
+        changed = False
+        for field in MATCH_UPDATE_FIELDS:
+            value = record.get(field)
+            if value is not None and getattr(match, field) != value:
+                setattr(match, field, value)
+                changed = True
+        return changed
+
+    def transform_matches_batch(
+        self,
+        matches_data: List[Dict[str, Any]],
+        league_id: int,
+        team_dict: Dict[str, Team],
+    ) -> List[Dict[str, Any]]:
+        """
+        Transform a batch of raw matches into Match column dictionaries.
+
+        Vectorized counterpart of transform_to_match: the raw records are
+        flattened with pandas and dates, statuses, scores and team names are
+        converted column-wise. Matches whose teams cannot be resolved are
+        dropped.
+
+        Args:
+            matches_data: Raw match dictionaries (football-data or api-football format)
+            league_id: Parent league ID
+            team_dict: Teams keyed by _normkey(name)
+
+        Returns:
+            List of dictionaries of Match column values, in input order
+        """
+        if not matches_data:
+            return []
+
+        df = pd.json_normalize(matches_data)
+
+        def column(*names: str) -> pd.Series:
+            """First present of several flattened columns, None where missing."""
+            result = pd.Series(None, index=df.index, dtype=object)
+            for name in reversed(names):
+                if name in df:
+                    result = df[name].astype(object).where(df[name].notna(), result)
+            return result
+
+        # Team names -> Team via normalized keys, fuzzy matching only the misses
+        team_ids = {}
+        for side in ('home', 'away'):
+            names = column(f'{side}Team.name', f'teams.{side}.name')
+            keys = (
+                names.fillna('').astype(str).str.lower()
+                .str.translate(_PUNCT_TRANS).str.split().str.join(' ')
+            )
+            teams = keys.map(team_dict).astype(object)
+            misses = teams.isna() & (keys != '')
+            if misses.any():
+                teams[misses] = [self._find_team(team_dict, name) for name in names[misses]]
+            team_ids[side] = _to_int_column(
+                teams.map(lambda team: team.id if team is not None else None, na_action='ignore')
+            )
+
+        # Parsed as UTC, then stored naive like every other DateTime column
+        dates = pd.to_datetime(
+            column('utcDate', 'date'), utc=True, format='ISO8601', errors='coerce'
+        ).dt.tz_convert(None)
+        statuses = column('status').map(STATUS_MAP)
+
+        frame = pd.DataFrame({
+            'league_id': league_id,
+            'home_team_id': team_ids['home'],
+            'away_team_id': team_ids['away'],
+            'match_date': pd.Series(
+                [None if pd.isna(ts) else ts.to_pydatetime() for ts in dates],
+                index=df.index, dtype=object,
+            ),
+            'home_goals': _to_int_column(column('score.fullTime.home')),
+            'away_goals': _to_int_column(column('score.fullTime.away')),
+            'status': statuses.where(statuses.notna(), MatchStatus.SCHEDULED),
+            'external_id': [_external_id(match_data.get('id')) for match_data in matches_data],
+        }, index=df.index).astype(object)
+
+        frame = frame[frame['home_team_id'].notna() & frame['away_team_id'].notna()]
+        frame['match_date'] = frame['match_date'].where(frame['match_date'].notna(), datetime.utcnow())
+        return frame.where(frame.notna(), None).to_dict('records')
 
     def run_full_pipeline(
         self,
@@ -555,7 +965,8 @@ class DataPipeline:
             fetch_matches: Whether to fetch and store matches
 
         Returns:
-            Pipeline result summary
+            Pipeline result summary; ``skipped`` is True when the fetched data
+            matched the previous run's fingerprint and nothing was written
 
         Raises:
             PipelineError: If critical pipeline step fails
@@ -566,6 +977,7 @@ class DataPipeline:
             'league_created': False,
             'teams_created': 0,
             'matches_created': 0,
+            'skipped': False,
             'errors': [],
         }
 
@@ -575,20 +987,52 @@ class DataPipeline:
             league = self.insert_or_update_league(league_code, season)
             result['league_created'] = True
 
-            # Step 2: Fetch league data
+            # Step 2: Fetch league data and matches
             league_data = self.fetch_league_data(league_code, season)
             result['errors'].extend(league_data['errors'])
 
+            matches_data = []
+            if fetch_matches:
+                # Only ask the APIs for matches from shortly before the latest
+                # finished one on, in every status, so fixtures stored while
+                # upcoming come back with their final score or new date
+                since = self.db.query(func.max(Match.match_date)).filter(
+                    Match.league_id == league.id,
+                    Match.status == MatchStatus.FINISHED,
+                ).scalar()
+                if since is not None:
+                    since = min(since, datetime.utcnow()) - timedelta(
+                        days=INCREMENTAL_FETCH_OVERLAP_DAYS
+                    )
+                matches_data = self.fetch_matches(league_code, season, status=None, since=since)
+
+            # Skip the transform/insert steps if nothing changed since last run
+            content_hash = self._payload_hash(league_data['standings'], matches_data)
+            fetch_log = self.db.query(LeagueFetchLog).filter(
+                LeagueFetchLog.league_code == league_code,
+                LeagueFetchLog.season == season,
+            ).first()
+            if fetch_log is not None and fetch_log.content_hash == content_hash:
+                logger.info(f"{league_code} {season} unchanged since last run, skipping")
+                result['skipped'] = True
+                return result
+
             # Step 3: Create/update teams
             teams = self.insert_or_update_teams(league, league_data['standings'])
             result['teams_created'] = len(teams)
 
-            # Step 4: Fetch and create matches
+            # Step 4: Create matches
             if fetch_matches:
-                matches_data = self.fetch_matches(league_code, season)
                 matches = self.insert_or_update_matches(league, teams, matches_data)
                 result['matches_created'] = len(matches)
 
+            # Remember what was stored for the next run
+            if fetch_log is None:
+                fetch_log = LeagueFetchLog(league_code=league_code, season=season)
+                self.db.add(fetch_log)
+            fetch_log.content_hash = content_hash
+            self.db.commit()
+
             logger.info(
                 f"Pipeline completed: {result['teams_created']} teams, "
                 f"{result['matches_created']} matches"
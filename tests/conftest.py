@@ -0,0 +1,253 @@
+"""
+Shared pytest fixtures for the API tests.
+"""
+
+import sqlite3
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from functools import lru_cache
+from types import SimpleNamespace
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, event, insert
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import StaticPool
+
+from src.api.main import app
+from src.api.dependencies import get_db
+from src.db.models import Base, League, Team, Match, Odds, User, MatchStatus
+
+
+@lru_cache(maxsize=None)
+def _schema_template():
+    """
+    Build the schema once per process in a bare in-memory SQLite database.
+
+    Test engines clone it with the SQLite backup API instead of re-running
+    the DDL. Within one process this only saves the second create_all (the
+    session-scoped engines are built once each), but every xdist worker is
+    its own process and builds its own template.
+    """
+    template = sqlite3.connect(":memory:", check_same_thread=False)
+    Base.metadata.create_all(bind=create_engine("sqlite://", creator=lambda: template))
+    return template
+
+
+def _create_test_engine():
+    """
+    Create an in-memory SQLite engine with the full schema.
+
+    StaticPool hands every session the same connection, so the database lives
+    as long as the engine; each xdist worker process gets its own.
+    """
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+
+    # pysqlite's own transaction handling breaks SAVEPOINTs; let SQLAlchemy
+    # emit BEGIN itself so the per-test rollback below works
+    @event.listens_for(engine, "connect")
+    def do_connect(dbapi_connection, connection_record):
+        dbapi_connection.isolation_level = None
+        dbapi_connection.execute("PRAGMA foreign_keys=ON")
+        # Test data is disposable: keep the journal and temp b-trees in RAM,
+        # never fsync, and give SQLite a 64 MB page cache
+        dbapi_connection.execute("PRAGMA journal_mode=MEMORY")
+        dbapi_connection.execute("PRAGMA synchronous=OFF")
+        dbapi_connection.execute("PRAGMA temp_store=MEMORY")
+        dbapi_connection.execute("PRAGMA cache_size=-65536")
+        _schema_template().backup(dbapi_connection)
+
+    @event.listens_for(engine, "begin")
+    def do_begin(conn):
+        conn.exec_driver_sql("BEGIN")
+
+    return engine
+
+
+@contextmanager
+def _rolled_back_session(engine):
+    """Yield a session whose changes are rolled back on exit."""
+    connection = engine.connect()
+    transaction = connection.begin()
+    # Commits inside fixtures and endpoints only release SAVEPOINTs, so there
+    # is nothing to re-read afterwards; the flush already set primary keys
+    session = Session(
+        bind=connection,
+        autoflush=False,
+        expire_on_commit=False,
+        join_transaction_mode="create_savepoint",
+    )
+    try:
+        yield session
+    finally:
+        session.close()
+        transaction.rollback()
+        connection.close()
+
+
+@contextmanager
+def _override_get_db(session):
+    """Serve ``session`` from the app's get_db dependency."""
+    app.dependency_overrides[get_db] = lambda: session
+    try:
+        yield session
+    finally:
+        app.dependency_overrides.pop(get_db, None)
+
+
+def _create_league(db):
+    league = League(
+        name="Premier League",
+        country="England",
+        season="2023-24",
+        league_type="domestic",
+        external_id="EPL",
+    )
+    db.add(league)
+    db.commit()
+    return league
+
+
+def _create_teams(db, league):
+    teams = [
+        Team(name="Manchester United", country="England", league_id=league.id),
+        Team(name="Liverpool", country="England", league_id=league.id),
+    ]
+    db.add_all(teams)
+    db.commit()
+    return teams
+
+
+def _create_match(db, league, teams):
+    match = Match(
+        league_id=league.id,
+        home_team_id=teams[0].id,
+        away_team_id=teams[1].id,
+        match_date=datetime.utcnow() + timedelta(days=7),
+        status=MatchStatus.SCHEDULED,
+    )
+    db.add(match)
+    db.commit()
+    return match
+
+
+@pytest.fixture(scope="session")
+def engine():
+    """
+    Create the schema once for tests that start from an empty database.
+
+    The database is in-memory, so each xdist worker process gets its own.
+    """
+    engine = _create_test_engine()
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture(scope="function")
+def db(engine):
+    """Provide a session whose changes are rolled back after each test."""
+    with _rolled_back_session(engine) as session:
+        yield session
+
+
+@pytest.fixture(scope="session")
+def app_client():
+    """Run the app once for the whole session behind a single TestClient."""
+    with TestClient(app) as c:
+        yield c
+
+
+@pytest.fixture(scope="function")
+def test_db_override(db):
+    """Override the get_db dependency."""
+    with _override_get_db(db):
+        yield db
+
+
+@pytest.fixture(scope="session")
+def seeded():
+    """
+    Seed a separate database once with a league, two teams and a match.
+
+    For tests that only read; the rows are shared by the whole session.
+    """
+    engine = _create_test_engine()
+    with Session(engine, expire_on_commit=False) as session:
+        league = _create_league(session)
+        teams = _create_teams(session, league)
+        match = _create_match(session, league, teams)
+    yield SimpleNamespace(engine=engine, league=league, teams=teams, match=match)
+    engine.dispose()
+
+
+@pytest.fixture(scope="function")
+def seeded_db(seeded):
+    """Serve the seeded database to the app, rolling back any changes."""
+    with _rolled_back_session(seeded.engine) as session, _override_get_db(session):
+        yield session
+
+
+@pytest.fixture
+def sample_league(db):
+    """Create a sample league."""
+    return _create_league(db)
+
+
+@pytest.fixture
+def sample_teams(db, sample_league):
+    """Create sample teams."""
+    return _create_teams(db, sample_league)
+
+
+@pytest.fixture
+def sample_match(db, sample_league, sample_teams):
+    """Create a sample match."""
+    return _create_match(db, sample_league, sample_teams)
+
+
+def _insert_odds(db, match_id, rows):
+    """Insert (bookmaker, home, draw, away) odds rows in one executemany."""
+    retrieved_at = datetime.utcnow()
+    db.execute(insert(Odds), [
+        {
+            "match_id": match_id,
+            "bookmaker": bookmaker,
+            "home_win_odds": home,
+            "draw_odds": draw,
+            "away_win_odds": away,
+            "over_2_5_odds": 1.95,
+            "under_2_5_odds": 1.85,
+            "retrieved_at": retrieved_at,
+        }
+        for bookmaker, home, draw, away in rows
+    ])
+    db.commit()
+
+
+@pytest.fixture
+def populated_odds(db, sample_match):
+    """Create odds for a sample match from three bookmakers."""
+    bookmakers = [
+        ("Bet365", 2.50, 3.00, 2.75),
+        ("DraftKings", 2.60, 2.95, 2.70),
+        ("FanDuel", 2.55, 3.05, 2.80),
+    ]
+    _insert_odds(db, sample_match.id, bookmakers)
+    return bookmakers
+
+
+@pytest.fixture
+def sample_user(db):
+    """Create a sample user."""
+    user = User(
+        username="testuser",
+        email="test@example.com",
+        password_hash="hashed_password",
+    )
+    db.add(user)
+    db.commit()
+    return user
@@ -3,7 +3,8 @@ Unit tests for api-football.com API client.
 """
 
 import pytest
-from unittest.mock import Mock, patch
+import requests
+from unittest.mock import DEFAULT, Mock
 
 from src.clients.api_football_client import (
     ApiFootballClient,
@@ -12,12 +13,56 @@ from src.clients.api_football_client import (
 )
 
 
-@pytest.fixture
+class FakeResponse:
+    """Minimal stand-in for requests.Response, cheaper than a Mock."""
+
+    __slots__ = ('status_code', '_json', 'text')
+
+    def __init__(self, status_code=200, body=None, text=''):
+        self.status_code = status_code
+        self._json = body if body is not None else {'response': [], 'errors': {}}
+        self.text = text
+
+    def json(self):
+        return self._json
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise requests.HTTPError(f"{self.status_code} Error")
+
+
+@pytest.fixture(scope="module")
 def client():
-    """Create an api-football.com client for testing."""
+    """Create an api-football.com client shared by the module's tests."""
     return ApiFootballClient(api_key='test_key', request_delay=0)
 
 
+@pytest.fixture
+def api_routes():
+    """Endpoint path -> JSON payload served by the mocked session."""
+    return {}
+
+
+@pytest.fixture(autouse=True)
+def mock_session(monkeypatch, api_routes):
+    """
+    Stub out HTTP for every test in the module.
+
+    Requests to a path registered in ``api_routes`` get that payload with a
+    200 status. Anything else gets the mock's return value, an empty
+    successful FakeResponse that tests can replace.
+    """
+    def dispatch(url, params=None, timeout=None):
+        path = url[len(ApiFootballClient.BASE_URL):]
+        if path not in api_routes:
+            return DEFAULT
+        return FakeResponse(body=api_routes[path])
+
+    get = Mock(return_value=FakeResponse(), side_effect=dispatch)
+    monkeypatch.setattr('src.clients.api_football_client.requests.Session.get', get)
+    return get
+
+
 class TestApiFootballClientInitialization:
     """Test client initialization."""
 
@@ -60,78 +105,67 @@ class TestApiFootballClientLeagueMapping:
 class TestApiFootballClientRateLimiting:
     """Test rate limiting functionality."""
 
-    def test_rate_limit_enforcement(self, client):
+    def test_rate_limit_enforcement(self, monkeypatch):
         """Test that rate limiting enforces delays."""
-        client.request_delay = 0.1
-        import time
+        # Own client, since this test changes the delay and request clock
+        client = ApiFootballClient(api_key='test_key', request_delay=0.1)
+        slept = []
+        # Second check comes 0.02s after the first request
+        clock = iter([1.0, 1.0, 1.02, 1.1])
+        monkeypatch.setattr('src.clients.api_football_client.time.monotonic', clock.__next__)
+        monkeypatch.setattr('src.clients.api_football_client.time.sleep', slept.append)
 
-        start = time.time()
         client._rate_limit_check()
         client._rate_limit_check()
-        elapsed = time.time() - start
 
-        # Should have at least 0.1 seconds of delay
-        assert elapsed >= 0.1
+        assert slept == [pytest.approx(0.08)]
+        assert client.last_request_time == 1.1
 
 
 class TestApiFootballClientAPIRequests:
     """Test API request handling."""
 
-    @patch('src.clients.api_football_client.requests.Session.get')
-    def test_get_request_success(self, mock_get, client):
+    def test_get_request_success(self, mock_session, client):
         """Test successful API request."""
-        mock_response = Mock()
-        mock_response.json.return_value = {
+        mock_session.return_value = FakeResponse(body={
             'response': [{'id': 1}],
             'errors': {}
-        }
-        mock_response.status_code = 200
-        mock_get.return_value = mock_response
+        })
 
         result = client._get('/fixtures')
         assert 'response' in result
 
-    @patch('src.clients.api_football_client.requests.Session.get')
-    def test_get_request_rate_limit(self, mock_get, client):
+    def test_get_request_rate_limit(self, mock_session, client):
         """Test API request with rate limit response."""
-        mock_response = Mock()
-        mock_response.status_code = 429
-        mock_get.return_value = mock_response
+        mock_session.return_value = FakeResponse(status_code=429)
 
         with pytest.raises(RateLimitError):
             client._get('/fixtures')
 
-    @patch('src.clients.api_football_client.requests.Session.get')
-    def test_get_request_bad_request(self, mock_get, client):
+    def test_get_request_bad_request(self, mock_session, client):
         """Test API request with bad request response."""
-        mock_response = Mock()
-        mock_response.status_code = 400
-        mock_response.json.return_value = {'errors': ['Bad request']}
-        mock_response.text = 'Bad request'
-        mock_get.return_value = mock_response
+        mock_session.return_value = FakeResponse(
+            status_code=400,
+            body={'errors': ['Bad request']},
+            text='Bad request',
+        )
 
         with pytest.raises(ApiFootballError, match="Bad request"):
             client._get('/fixtures')
 
-    @patch('src.clients.api_football_client.requests.Session.get')
-    def test_get_request_api_error(self, mock_get, client):
+    def test_get_request_api_error(self, mock_session, client):
         """Test API request with API-level error."""
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {
+        mock_session.return_value = FakeResponse(body={
             'errors': {'limit': 'Rate limit exceeded'},
             'response': []
-        }
-        mock_get.return_value = mock_response
+        })
 
         with pytest.raises(ApiFootballError, match="API error"):
             client._get('/fixtures')
 
-    @patch('src.clients.api_football_client.requests.Session.get')
-    def test_get_request_timeout(self, mock_get, client):
+    def test_get_request_timeout(self, mock_session, client):
         """Test API request timeout."""
-        import requests
-        mock_get.side_effect = requests.Timeout()
+        mock_session.side_effect = requests.Timeout()
 
         with pytest.raises(ApiFootballError, match="Request timeout"):
             client._get('/fixtures')
@@ -140,10 +174,9 @@ class TestApiFootballClientAPIRequests:
 class TestApiFootballClientFixtures:
     """Test fixture-related API methods."""
 
-    @patch.object(ApiFootballClient, '_get')
-    def test_get_fixtures(self, mock_get, client):
+    def test_get_fixtures(self, api_routes, client):
         """Test getting fixtures."""
-        mock_get.return_value = {
+        api_routes['/fixtures'] = {
             'response': [
                 {'id': 1, 'fixture': {'date': '2023-08-12'}},
                 {'id': 2, 'fixture': {'date': '2023-08-13'}},
@@ -153,18 +186,17 @@ class TestApiFootballClientFixtures:
         result = client.get_fixtures(39, 2023)
         assert len(result) == 2
 
-    @patch.object(ApiFootballClient, '_get')
-    def test_get_fixtures_with_status(self, mock_get, client):
+    def test_get_fixtures_with_status(self, api_routes, mock_session, client):
         """Test getting fixtures with status filter."""
-        mock_get.return_value = {'response': []}
+        api_routes['/fixtures'] = {'response': []}
 
         client.get_fixtures(39, 2023, status='FINISHED')
-        mock_get.assert_called_once()
+        mock_session.assert_called_once()
+        assert mock_session.call_args.kwargs['params']['status'] == 'FINISHED'
 
-    @patch.object(ApiFootballClient, '_get')
-    def test_get_fixture_details(self, mock_get, client):
+    def test_get_fixture_details(self, api_routes, client):
         """Test getting fixture details."""
-        mock_get.return_value = {
+        api_routes['/fixtures'] = {
             'response': [
                 {
                     'id': 1,
@@ -181,10 +213,9 @@ class TestApiFootballClientFixtures:
         result = client.get_fixture_details(1)
         assert result['id'] == 1
 
-    @patch.object(ApiFootballClient, '_get')
-    def test_get_fixture_details_not_found(self, mock_get, client):
+    def test_get_fixture_details_not_found(self, api_routes, client):
         """Test getting non-existent fixture."""
-        mock_get.return_value = {'response': []}
+        api_routes['/fixtures'] = {'response': []}
 
         with pytest.raises(ApiFootballError, match="Fixture not found"):
             client.get_fixture_details(999)
@@ -193,10 +224,9 @@ class TestApiFootballClientFixtures:
 class TestApiFootballClientStandings:
     """Test standings-related API methods."""
 
-    @patch.object(ApiFootballClient, '_get')
-    def test_get_league_standings(self, mock_get, client):
+    def test_get_league_standings(self, api_routes, client):
         """Test getting league standings."""
-        mock_get.return_value = {
+        api_routes['/standings'] = {
             'response': [
                 {
                     'league': {
@@ -218,10 +248,9 @@ class TestApiFootballClientStandings:
 class TestApiFootballClientTeamStatistics:
     """Test team statistics API methods."""
 
-    @patch.object(ApiFootballClient, '_get')
-    def test_get_team_statistics(self, mock_get, client):
+    def test_get_team_statistics(self, api_routes, mock_session, client):
         """Test getting team statistics."""
-        mock_get.return_value = {
+        api_routes['/teams/statistics'] = {
             'team': {'id': 1, 'name': 'Team A'},
             'statistics': [
                 {'type': 'Shots On Goal', 'value': 5}
@@ -230,12 +259,11 @@ class TestApiFootballClientTeamStatistics:
 
         result = client.get_team_statistics(39, 1, 2023)
         assert isinstance(result, dict)
-        mock_get.assert_called_once()
+        mock_session.assert_called_once()
 
-    @patch.object(ApiFootballClient, '_get')
-    def test_get_player_statistics(self, mock_get, client):
+    def test_get_player_statistics(self, api_routes, client):
         """Test getting player statistics."""
-        mock_get.return_value = {
+        api_routes['/players/statistics'] = {
             'player': {'id': 1, 'name': 'Player A'},
             'statistics': [{'games': {'minutes': 500}}]
         }
@@ -247,10 +275,9 @@ class TestApiFootballClientTeamStatistics:
 class TestApiFootballClientHeadToHead:
     """Test head-to-head API methods."""
 
-    @patch.object(ApiFootballClient, '_get')
-    def test_get_head_to_head(self, mock_get, client):
+    def test_get_head_to_head(self, api_routes, client):
         """Test getting head-to-head match history."""
-        mock_get.return_value = {
+        api_routes['/fixtures/headtohead'] = {
             'response': [
                 {'id': 1, 'teams': {'home': {'id': 1}, 'away': {'id': 2}}},
                 {'id': 2, 'teams': {'home': {'id': 2}, 'away': {'id': 1}}},
@@ -264,10 +291,9 @@ class TestApiFootballClientHeadToHead:
 class TestApiFootballClientOdds:
     """Test odds-related API methods."""
 
-    @patch.object(ApiFootballClient, '_get')
-    def test_get_odds(self, mock_get, client):
+    def test_get_odds(self, api_routes, client):
         """Test getting betting odds."""
-        mock_get.return_value = {
+        api_routes['/odds'] = {
             'response': [
                 {
                     'fixture': {'id': 1},
@@ -294,10 +320,9 @@ class TestApiFootballClientOdds:
 class TestApiFootballClientDateRange:
     """Test date range queries."""
 
-    @patch.object(ApiFootballClient, '_get')
-    def test_get_fixtures_by_date(self, mock_get, client):
+    def test_get_fixtures_by_date(self, api_routes, client):
         """Test getting fixtures for a date range."""
-        mock_get.return_value = {
+        api_routes['/fixtures'] = {
             'response': [
                 {'id': 1, 'fixture': {'date': '2023-08-12T15:00:00Z'}},
                 {'id': 2, 'fixture': {'date': '2023-08-13T15:00:00Z'}},
@@ -311,10 +336,9 @@ class TestApiFootballClientDateRange:
 class TestApiFootballClientInjuries:
     """Test injuries API methods."""
 
-    @patch.object(ApiFootballClient, '_get')
-    def test_get_injuries(self, mock_get, client):
+    def test_get_injuries(self, api_routes, client):
         """Test getting player injuries."""
-        mock_get.return_value = {
+        api_routes['/injuries'] = {
             'response': [
                 {'player': {'id': 1, 'name': 'Player A'}, 'type': 'Injury'},
                 {'player': {'id': 2, 'name': 'Player B'}, 'type': 'Suspension'},
@@ -7,16 +7,12 @@ This test suite verifies:
 - Data persistence and retrieval
 """
 
-import os
-import tempfile
 from datetime import datetime, timedelta
 
 import pytest
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker, Session
+from sqlalchemy import insert, text
 
 from src.db.models import (
-    Base,
     League,
     Team,
     Match,
@@ -29,30 +25,73 @@ from src.db.models import (
     MatchStatus,
     PredictionOutcome,
 )
-from src.db.config import get_database_url, create_db_engine, create_session_factory
+from src.db.config import get_database_url, create_db_engine
+
+# Enum members the tests use as fixed field values
+_DOMESTIC = LeagueType.DOMESTIC
+_SCHEDULED = MatchStatus.SCHEDULED
+_FINISHED = MatchStatus.FINISHED
+_HOME_WIN = PredictionOutcome.HOME_WIN
 
 
 @pytest.fixture
-def temp_db():
-    """Create temporary SQLite database for testing."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        db_path = os.path.join(tmpdir, "test.db")
-        db_url = f"sqlite:///{db_path}"
-        engine = create_engine(db_url)
-        Base.metadata.create_all(bind=engine)
-        SessionLocal = sessionmaker(bind=engine)
-        yield SessionLocal
-        Base.metadata.drop_all(bind=engine)
+def session(db):
+    """
+    Get database session for tests.
+
+    Backed by the shared in-memory schema from conftest; everything a test
+    commits is rolled back afterwards.
+    """
+    return db
+
+
+def _seed(session, *objs):
+    """
+    Add objects to the session and flush them in one unit of work.
+
+    Related objects reached through relationships are inserted too, in
+    foreign key order, so primary keys are set without extra commits.
+    """
+    session.add_all(objs)
+    session.flush()
 
 
 @pytest.fixture
-def session(temp_db):
-    """Get database session for tests."""
-    db = temp_db()
-    try:
-        yield db
-    finally:
-        db.close()
+def make_match(session):
+    """
+    Factory for a flushed match between two new teams of a new league.
+
+    Takes the home and away team names; keyword arguments override the
+    Match fields.
+    """
+    def _make(home_team="Home FC", away_team="Away FC", **overrides):
+        # Only the match goes through the ORM; its league and teams are plain
+        # multi-row Core inserts that return the new ids
+        league_id = session.execute(
+            insert(League)
+            .values(name="Premier League", country="England", season="2024-25")
+            .returning(League.id)
+        ).scalar_one()
+        home_team_id, away_team_id = session.execute(
+            insert(Team).returning(Team.id, sort_by_parameter_order=True),
+            [
+                {"name": name, "country": "England", "league_id": league_id}
+                for name in (home_team, away_team)
+            ],
+        ).scalars().all()
+
+        fields = {
+            "league_id": league_id,
+            "home_team_id": home_team_id,
+            "away_team_id": away_team_id,
+            "match_date": datetime.utcnow() + timedelta(days=7),
+            **overrides,
+        }
+        match = Match(**fields)
+        _seed(session, match)
+        return match
+
+    return _make
 
 
 class TestDatabaseModels:
@@ -64,12 +103,11 @@ class TestDatabaseModels:
             name="Premier League",
             country="England",
             season="2024-25",
-            league_type=LeagueType.DOMESTIC,
+            league_type=_DOMESTIC,
         )
-        session.add(league)
-        session.commit()
+        _seed(session, league)
 
-        retrieved = session.query(League).filter_by(name="Premier League").first()
+        retrieved = session.get(League, league.id)
         assert retrieved is not None
         assert retrieved.country == "England"
         assert retrieved.season == "2024-25"
@@ -81,106 +119,75 @@ class TestDatabaseModels:
             country="England",
             season="2024-25",
         )
-        session.add(league)
-        session.commit()
-
         team = Team(
             name="Manchester United",
             country="England",
-            league_id=league.id,
+            league=league,
             founded_year=1878,
         )
-        session.add(team)
-        session.commit()
+        _seed(session, team)
 
-        retrieved = session.query(Team).filter_by(name="Manchester United").first()
+        retrieved = session.get(Team, team.id)
         assert retrieved is not None
         assert retrieved.league_id == league.id
         assert retrieved.league.name == "Premier League"
 
-    def test_create_match(self, session):
+    def test_create_match(self, session, make_match):
         """Test creating a match with team relationships."""
-        league = League(
-            name="Premier League",
-            country="England",
-            season="2024-25",
-        )
-        session.add(league)
-        session.commit()
-
-        home_team = Team(
-            name="Manchester United",
-            country="England",
-            league_id=league.id,
-        )
-        away_team = Team(
-            name="Liverpool",
-            country="England",
-            league_id=league.id,
-        )
-        session.add_all([home_team, away_team])
-        session.commit()
-
-        match = Match(
-            league_id=league.id,
-            home_team_id=home_team.id,
-            away_team_id=away_team.id,
-            match_date=datetime.utcnow() + timedelta(days=7),
-            status=MatchStatus.SCHEDULED,
+        match = make_match(
+            "Manchester United",
+            "Liverpool",
+            status=_SCHEDULED,
             home_shots=10,
             away_shots=8,
             home_possession=55.0,
             away_possession=45.0,
         )
-        session.add(match)
-        session.commit()
 
-        retrieved = session.query(Match).first()
+        retrieved = session.get(Match, match.id)
         assert retrieved is not None
         assert retrieved.home_team.name == "Manchester United"
         assert retrieved.away_team.name == "Liverpool"
         assert retrieved.league.name == "Premier League"
 
-    def test_match_with_results(self, session):
+    def test_match_with_results(self, session, make_match):
         """Test match with goals and final status."""
-        league = League(name="Premier League", country="England", season="2024-25")
-        session.add(league)
-        session.commit()
-
-        home_team = Team(name="Man United", country="England", league_id=league.id)
-        away_team = Team(name="Arsenal", country="England", league_id=league.id)
-        session.add_all([home_team, away_team])
-        session.commit()
-
-        match = Match(
-            league_id=league.id,
-            home_team_id=home_team.id,
-            away_team_id=away_team.id,
+        match = make_match(
+            "Man United",
+            "Arsenal",
             match_date=datetime.utcnow() - timedelta(days=1),
-            status=MatchStatus.FINISHED,
+            status=_FINISHED,
             home_goals=2,
             away_goals=1,
         )
-        session.add(match)
-        session.commit()
 
-        retrieved = session.query(Match).first()
+        retrieved = session.get(Match, match.id)
         assert retrieved.home_goals == 2
         assert retrieved.away_goals == 1
-        assert retrieved.status == MatchStatus.FINISHED
+        assert retrieved.status == _FINISHED
+
+    def test_status_stored_as_small_int(self, session, make_match):
+        """Test enum columns are persisted as integer codes."""
+        make_match(
+            "Man United",
+            "Arsenal",
+            match_date=datetime.utcnow(),
+            status="finished",
+        )
+
+        raw_status = session.execute(text("SELECT status FROM matches")).scalar()
+        assert raw_status == list(MatchStatus).index(_FINISHED)
+
+        session.expire_all()
+        retrieved = session.query(Match).filter(Match.status == _FINISHED).first()
+        assert retrieved is not None
+        assert retrieved.status is _FINISHED
 
     def test_team_stats(self, session):
         """Test team statistics."""
         league = League(name="Premier League", country="England", season="2024-25")
-        session.add(league)
-        session.commit()
-
-        team = Team(name="Chelsea", country="England", league_id=league.id)
-        session.add(team)
-        session.commit()
-
         stats = TeamStats(
-            team_id=team.id,
+            team=Team(name="Chelsea", country="England", league=league),
             season="2024-25",
             matches_played=10,
             wins=7,
@@ -191,163 +198,98 @@ class TestDatabaseModels:
             points=23,
             avg_possession=58.5,
         )
-        session.add(stats)
-        session.commit()
+        _seed(session, stats)
 
-        retrieved = session.query(TeamStats).first()
+        retrieved = session.get(TeamStats, stats.id)
         assert retrieved.matches_played == 10
         assert retrieved.wins == 7
         assert retrieved.points == 23
         assert retrieved.team.name == "Chelsea"
 
-    def test_odds(self, session):
+    def test_odds(self, session, make_match):
         """Test betting odds storage."""
-        league = League(name="Premier League", country="England", season="2024-25")
-        session.add(league)
-        session.commit()
-
-        home_team = Team(name="Man City", country="England", league_id=league.id)
-        away_team = Team(name="Tottenham", country="England", league_id=league.id)
-        session.add_all([home_team, away_team])
-        session.commit()
-
-        match = Match(
-            league_id=league.id,
-            home_team_id=home_team.id,
-            away_team_id=away_team.id,
-            match_date=datetime.utcnow() + timedelta(days=7),
-        )
-        session.add(match)
-        session.commit()
-
+        match = make_match("Man City", "Tottenham")
         odds = Odds(
-            match_id=match.id,
+            match=match,
             bookmaker="Bet365",
             home_win_odds=1.80,
             draw_odds=3.50,
             away_win_odds=4.20,
             retrieved_at=datetime.utcnow(),
         )
-        session.add(odds)
-        session.commit()
+        _seed(session, odds)
 
-        retrieved = session.query(Odds).first()
+        retrieved = session.get(Odds, odds.id)
         assert retrieved.bookmaker == "Bet365"
         assert float(retrieved.home_win_odds) == pytest.approx(1.80, rel=0.01)
         assert retrieved.match.home_team.name == "Man City"
 
-    def test_user_and_prediction(self, session):
+    def test_user_and_prediction(self, session, make_match):
         """Test user creation and predictions."""
-        league = League(name="Premier League", country="England", season="2024-25")
-        session.add(league)
-        session.commit()
-
-        home_team = Team(name="Liverpool", country="England", league_id=league.id)
-        away_team = Team(name="Everton", country="England", league_id=league.id)
-        session.add_all([home_team, away_team])
-        session.commit()
-
-        match = Match(
-            league_id=league.id,
-            home_team_id=home_team.id,
-            away_team_id=away_team.id,
-            match_date=datetime.utcnow() + timedelta(days=7),
-        )
-        session.add(match)
-        session.commit()
-
+        match = make_match("Liverpool", "Everton")
         user = User(
             username="testuser",
             email="test@example.com",
             password_hash="hashed_password",
         )
-        session.add(user)
-        session.commit()
-
         prediction = Prediction(
-            user_id=user.id,
-            match_id=match.id,
-            predicted_outcome=PredictionOutcome.HOME_WIN,
+            user=user,
+            match=match,
+            predicted_outcome=_HOME_WIN,
             confidence=0.75,
             stake=10.00,
             odds_used=1.80,
         )
-        session.add(prediction)
-        session.commit()
+        _seed(session, prediction)
 
-        retrieved = session.query(Prediction).first()
+        retrieved = session.get(Prediction, prediction.id)
         assert retrieved.user.username == "testuser"
         assert retrieved.match.home_team.name == "Liverpool"
-        assert retrieved.predicted_outcome == PredictionOutcome.HOME_WIN
+        assert retrieved.predicted_outcome == _HOME_WIN
         assert retrieved.confidence == 0.75
 
-    def test_prediction_result(self, session):
+    def test_prediction_result(self, session, make_match):
         """Test prediction results and accuracy tracking."""
-        league = League(name="Premier League", country="England", season="2024-25")
-        session.add(league)
-        session.commit()
-
-        home_team = Team(name="Man United", country="England", league_id=league.id)
-        away_team = Team(name="Chelsea", country="England", league_id=league.id)
-        session.add_all([home_team, away_team])
-        session.commit()
-
-        match = Match(
-            league_id=league.id,
-            home_team_id=home_team.id,
-            away_team_id=away_team.id,
+        match = make_match(
+            "Man United",
+            "Chelsea",
             match_date=datetime.utcnow() - timedelta(days=1),
-            status=MatchStatus.FINISHED,
+            status=_FINISHED,
             home_goals=2,
             away_goals=1,
         )
-        session.add(match)
-        session.commit()
-
-        user = User(
-            username="predictor",
-            email="predictor@example.com",
-            password_hash="hashed",
-        )
-        session.add(user)
-        session.commit()
-
         prediction = Prediction(
-            user_id=user.id,
-            match_id=match.id,
-            predicted_outcome=PredictionOutcome.HOME_WIN,
+            user=User(
+                username="predictor",
+                email="predictor@example.com",
+                password_hash="hashed",
+            ),
+            match=match,
+            predicted_outcome=_HOME_WIN,
             confidence=0.80,
             stake=20.00,
             odds_used=2.00,
         )
-        session.add(prediction)
-        session.commit()
-
         result = PredictionResult(
-            prediction_id=prediction.id,
-            actual_outcome=PredictionOutcome.HOME_WIN,
+            prediction=prediction,
+            actual_outcome=_HOME_WIN,
             is_correct=True,
             profit_loss=20.00,
             return_rate=100.0,
             evaluated_at=datetime.utcnow(),
         )
-        session.add(result)
-        session.commit()
+        _seed(session, result)
 
-        retrieved = session.query(PredictionResult).first()
+        retrieved = session.get(PredictionResult, result.id)
         assert retrieved.is_correct is True
         assert retrieved.prediction.user.username == "predictor"
         assert retrieved.profit_loss == 20.00
 
+    @pytest.mark.slow
     def test_cascade_delete(self, session):
         """Test cascade delete behavior."""
         league = League(name="Test League", country="Test", season="2024-25")
-        session.add(league)
-        session.commit()
-
-        team = Team(name="Test Team", country="Test", league_id=league.id)
-        session.add(team)
-        session.commit()
+        _seed(session, Team(name="Test Team", country="Test", league=league))
 
         session.delete(league)
         session.commit()
@@ -364,19 +306,20 @@ class TestDatabaseModels:
         assert isinstance(url, str)
         assert len(url) > 0
 
-    def test_create_engine(self):
+    @pytest.mark.slow
+    def test_create_engine(self, tmp_path):
         """Test engine creation."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            db_path = os.path.join(tmpdir, "test.db")
-            db_url = f"sqlite:///{db_path}"
-            engine = create_db_engine(db_url)
-            assert engine is not None
-            assert str(engine.url) == db_url
+        db_url = f"sqlite:///{tmp_path / 'test.db'}"
+        engine = create_db_engine(db_url)
+        assert engine is not None
+        assert str(engine.url) == db_url
+        engine.dispose()
 
 
 class TestDataIntegrity:
     """Test data integrity and constraints."""
 
+    @pytest.mark.slow
     def test_unique_league_name(self, session):
         """Test unique constraint on league name."""
         league1 = League(name="Unique League", country="Country1", season="2024-25")
@@ -389,6 +332,7 @@ class TestDataIntegrity:
         with pytest.raises(Exception):  # Should raise integrity error
             session.commit()
 
+    @pytest.mark.slow
     def test_foreign_key_constraint(self, session):
         """Test foreign key constraints."""
         # Try to create team with non-existent league
@@ -398,13 +342,16 @@ class TestDataIntegrity:
         with pytest.raises(Exception):
             session.commit()
 
+    @pytest.mark.slow
     def test_timestamps(self, session):
         """Test automatic timestamp creation."""
         league = League(name="Timestamp Test", country="Country", season="2024-25")
         session.add(league)
         session.commit()
 
-        retrieved = session.query(League).first()
+        # Reload from the database rather than the identity map
+        session.expire_all()
+        retrieved = session.get(League, league.id)
         assert retrieved.created_at is not None
         assert retrieved.updated_at is not None
         assert retrieved.created_at <= retrieved.updated_at
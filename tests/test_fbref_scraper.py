@@ -4,100 +4,183 @@ Unit tests for FBref scraper module.
 
 import pytest
 from datetime import datetime
-from unittest.mock import Mock, patch, MagicMock
+from unittest.mock import Mock, patch
+
+import pandas as pd
+import requests
+import responses
+from bs4 import BeautifulSoup
 
 from src.scraper.fbref_scraper import (
     FbrefScraper,
     FbrefScraperError,
-    RateLimitError,
+    TeamMatchRow,
 )
 
+STANDINGS_HTML = '''
+<html>
+    <table id="sched_EPL">
+        <tr><th>Column Headers</th></tr>
+        <tr>
+            <td></td><td></td><td></td><td></td><td></td>
+            <td>Manchester United</td><td>5</td><td>3</td><td>1</td><td>1</td>
+            <td>10</td><td>5</td><td>5</td><td>10</td>
+        </tr>
+    </table>
+</html>
+'''
+
+STANDINGS_BAD_CELLS_HTML = '''
+<html>
+    <table id="sched_EPL">
+        <tr><th>Column Headers</th></tr>
+        <tr>
+            <td></td><td></td><td></td><td></td><td></td>
+            <td>Arsenal</td><td>5</td><td>3</td><td>n/a</td>
+        </tr>
+        <tr>
+            <td></td><td></td><td></td><td></td><td></td>
+            <td></td><td>5</td><td>3</td><td>1</td>
+        </tr>
+    </table>
+</html>
+'''
+
+TEAM_MATCHES_HTML = '''
+<html>
+    <table id="matchlogs_all">
+        <tr><th>Headers</th></tr>
+        <tr>
+            <td></td><td>2023-08-12</td><td>15:00</td><td>Sat</td>
+            <td>Premier League</td><td>1</td><td>Home</td>
+            <td>Liverpool</td><td>Win</td><td>2</td><td>1</td>
+        </tr>
+    </table>
+</html>
+'''
+
+NO_TABLE_HTML = '<html><body>No table here</body></html>'
+
+HTML_BYTES = b'<html><body>Test</body></html>'
+
+# Raising the same instance from each side_effect is fine
+TIMEOUT_ERROR = requests.Timeout()
+
+
+# Parsed once with the scraper's own parser. The scraper only reads the
+# trees, so every test can be handed the same object.
+STANDINGS_SOUP = BeautifulSoup(STANDINGS_HTML, 'lxml')
+STANDINGS_BAD_CELLS_SOUP = BeautifulSoup(STANDINGS_BAD_CELLS_HTML, 'lxml')
+TEAM_MATCHES_SOUP = BeautifulSoup(TEAM_MATCHES_HTML, 'lxml')
+NO_TABLE_SOUP = BeautifulSoup(NO_TABLE_HTML, 'lxml')
+
+
+@pytest.fixture(scope="session")
+def scraper_shared():
+    """Create one FBref scraper (and HTTP session) for the whole test run."""
+    return FbrefScraper(request_delay=0)  # No delay for tests
+
 
 @pytest.fixture
-def scraper():
-    """Create a FBref scraper instance for testing."""
-    return FbrefScraper(request_delay=0)  # No delay for tests
+def scraper(scraper_shared):
+    """Provide the shared scraper, restoring its rate-limit state afterwards."""
+    yield scraper_shared
+    scraper_shared.request_delay = 0
+    scraper_shared.last_request_time = 0
 
 
 class TestFbrefScraperUtilities:
     """Test utility methods in FBref scraper."""
 
-    def test_parse_season_year_with_dash(self):
-        """Test parsing season format with dash."""
-        assert FbrefScraper._parse_season_year('2023-24') == '24'
-
-    def test_parse_season_year_single_year(self):
-        """Test parsing single year format."""
-        assert FbrefScraper._parse_season_year('2024') == '24'
-
-    def test_get_league_table_id(self):
+    @pytest.mark.parametrize("season,expected", [
+        ('2023-24', '24'),
+        ('2024', '24'),
+    ])
+    def test_parse_season_year(self, season, expected):
+        """Test parsing dashed and single-year season formats."""
+        assert FbrefScraper._parse_season_year(season) == expected
+
+    @pytest.mark.parametrize("league_code,expected", [
+        ('EPL', 'EPL'),
+        ('LA_LIGA', 'La_Liga'),
+        ('SERIE_A', 'Serie_A'),
+    ])
+    def test_get_league_table_id(self, league_code, expected):
         """Test league table ID mapping."""
-        assert FbrefScraper._get_league_table_id('EPL') == 'EPL'
-        assert FbrefScraper._get_league_table_id('LA_LIGA') == 'La_Liga'
-        assert FbrefScraper._get_league_table_id('SERIE_A') == 'Serie_A'
-
-    def test_parse_date_with_iso_format(self):
-        """Test parsing ISO date format."""
-        date_obj = FbrefScraper._parse_date('2023-08-12')
-        assert date_obj is not None
-        assert date_obj.year == 2023
-        assert date_obj.month == 8
-        assert date_obj.day == 12
-
-    def test_parse_date_invalid_format(self):
-        """Test parsing invalid date format."""
-        result = FbrefScraper._parse_date('invalid-date')
-        assert result is None
-
-    def test_safe_int_valid(self):
-        """Test converting valid integer strings."""
-        assert FbrefScraper._safe_int('42') == 42
-        assert FbrefScraper._safe_int('  100  ') == 100
-
-    def test_safe_int_invalid(self):
-        """Test converting invalid integer strings."""
-        assert FbrefScraper._safe_int('abc') == 0
-        assert FbrefScraper._safe_int('') == 0
-        assert FbrefScraper._safe_int(None) == 0
-
-    def test_safe_float_valid(self):
-        """Test converting valid float strings."""
-        assert FbrefScraper._safe_float('42.5') == 42.5
-        assert FbrefScraper._safe_float('60%') == 60.0
-
-    def test_safe_float_invalid(self):
-        """Test converting invalid float strings."""
-        assert FbrefScraper._safe_float('abc') == 0.0
-        assert FbrefScraper._safe_float('') == 0.0
+        assert FbrefScraper._get_league_table_id(league_code) == expected
+
+    @pytest.mark.parametrize("date_str,expected", [
+        ('2023-08-12', datetime(2023, 8, 12)),
+        ('2023-8-12', datetime(2023, 8, 12)),
+        ('12/08/2023', datetime(2023, 8, 12)),
+        ('12 Aug 2023', datetime(2023, 8, 12)),
+        ('invalid-date', None),
+        ('2023-13-45', None),
+    ])
+    def test_parse_date(self, date_str, expected):
+        """Test parsing ISO and other date formats, and invalid dates."""
+        assert FbrefScraper._parse_date(date_str) == expected
+
+    def test_parse_date_is_memoized(self):
+        """Test repeated date strings are served from the cache."""
+        from src.scraper.fbref_scraper import _parse_date
+
+        _parse_date.cache_clear()
+        FbrefScraper._parse_date('2023-08-12')
+        FbrefScraper._parse_date('2023-08-12')
+        assert _parse_date.cache_info().hits == 1
+
+    @pytest.mark.parametrize("value,expected", [
+        ('42', 42),
+        ('  100  ', 100),
+        ('abc', 0),
+        ('', 0),
+        (None, 0),
+    ])
+    def test_safe_int(self, value, expected):
+        """Test converting valid and invalid integer strings."""
+        assert FbrefScraper._safe_int(value) == expected
+
+    @pytest.mark.parametrize("value,expected", [
+        ('42.5', 42.5),
+        ('60%', 60.0),
+        ('abc', 0.0),
+        ('', 0.0),
+    ])
+    def test_safe_float(self, value, expected):
+        """Test converting valid and invalid float strings."""
+        assert FbrefScraper._safe_float(value) == expected
 
 
 class TestFbrefScraperRateLimiting:
     """Test rate limiting functionality."""
 
-    def test_rate_limit_enforcement(self, scraper):
+    def test_rate_limit_enforcement(self, scraper, monkeypatch):
         """Test that rate limiting enforces delays."""
         scraper.request_delay = 0.1
-        import time
+        slept = []
+        # Second check comes 0.02s after the first request
+        clock = iter([100.0, 100.0, 100.02, 100.1])
+        monkeypatch.setattr('src.scraper.fbref_scraper.time.monotonic', clock.__next__)
+        monkeypatch.setattr('src.scraper.fbref_scraper.time.sleep', slept.append)
 
-        start = time.time()
         scraper._rate_limit_check()
         scraper._rate_limit_check()
-        elapsed = time.time() - start
 
-        # Should have at least 0.1 seconds of delay
-        assert elapsed >= 0.1
+        assert slept == [pytest.approx(0.08)]
+        assert scraper.last_request_time == 100.1
 
-    def test_no_delay_on_first_request(self, scraper):
+    def test_no_delay_on_first_request(self, scraper, monkeypatch):
         """Test that first request has no delay."""
-        import time
-
         scraper.request_delay = 1.0
-        start = time.time()
+        slept = []
+        clock = iter([100.0, 100.0])
+        monkeypatch.setattr('src.scraper.fbref_scraper.time.monotonic', clock.__next__)
+        monkeypatch.setattr('src.scraper.fbref_scraper.time.sleep', slept.append)
+
         scraper._rate_limit_check()
-        elapsed = time.time() - start
 
-        # First request should be fast
-        assert elapsed < 0.1
+        assert slept == []
 
 
 class TestFbrefScraperDataFetching:
@@ -106,9 +189,8 @@ class TestFbrefScraperDataFetching:
     @patch('src.scraper.fbref_scraper.requests.Session.get')
     def test_fetch_url_success(self, mock_get, scraper):
         """Test successful URL fetching."""
-        # Mock response
-        mock_response = Mock()
-        mock_response.content = b'<html><body>Test</body></html>'
+        mock_response = Mock(spec=requests.Response)
+        mock_response.content = HTML_BYTES
         mock_get.return_value = mock_response
 
         result = scraper._fetch_url('http://example.com')
@@ -118,8 +200,7 @@ class TestFbrefScraperDataFetching:
     @patch('src.scraper.fbref_scraper.requests.Session.get')
     def test_fetch_url_timeout(self, mock_get, scraper):
         """Test URL fetching timeout."""
-        import requests
-        mock_get.side_effect = requests.Timeout()
+        mock_get.side_effect = TIMEOUT_ERROR
 
         with pytest.raises(FbrefScraperError):
             scraper._fetch_url('http://example.com')
@@ -127,40 +208,81 @@ class TestFbrefScraperDataFetching:
     @patch('src.scraper.fbref_scraper.requests.Session.get')
     def test_fetch_url_connection_error(self, mock_get, scraper):
         """Test URL fetching connection error."""
-        import requests
         mock_get.side_effect = requests.ConnectionError()
 
         with pytest.raises(FbrefScraperError):
             scraper._fetch_url('http://example.com')
 
 
+class TestFbrefScraperHttpCache:
+    """Test on-disk HTTP caching of FBref pages."""
+
+    @pytest.fixture
+    def cached_scraper(self, tmp_path):
+        """Create a scraper backed by a temporary HTTP cache."""
+        pytest.importorskip('requests_cache')
+        return FbrefScraper(request_delay=0, cache_name=str(tmp_path / 'fbref_cache'))
+
+    @pytest.mark.parametrize("is_expired,rate_limited", [(False, False), (True, True)])
+    def test_cache_hit_skips_rate_limit(self, cached_scraper, is_expired, rate_limited):
+        """Test only fresh cached URLs are fetched without waiting on the rate limiter."""
+        mock_response = Mock()
+        mock_response.content = b'<html><body>Cached</body></html>'
+        cached = Mock(is_expired=is_expired)
+
+        with patch.object(cached_scraper.session.cache, 'get_response', return_value=cached), \
+                patch.object(cached_scraper.session, 'get', return_value=mock_response), \
+                patch.object(cached_scraper, '_rate_limit_check') as mock_rate_limit:
+            result = cached_scraper._fetch_url('http://example.com')
+
+        assert 'Cached' in str(result)
+        assert mock_rate_limit.called is rate_limited
+
+    def test_is_cached_reads_stored_responses(self, cached_scraper):
+        """Test _is_cached finds a response saved by the cache and ignores other URLs."""
+        url = 'http://example.com/page'
+        with responses.RequestsMock() as api:
+            api.get(url, body='<html></html>')
+            cached_scraper.session.get(url)
+
+        assert cached_scraper._is_cached(url)
+        assert not cached_scraper._is_cached('http://example.com/other')
+
+    def test_finished_season_never_expires(self, cached_scraper):
+        """Test finished seasons are cached forever and the current one is not."""
+        assert cached_scraper._season_expire_after('2019-20') == -1
+        current_year = datetime.utcnow().year
+        assert cached_scraper._season_expire_after(f'{current_year}-{(current_year + 1) % 100:02d}') is None
+
+
 class TestFbrefScraperLeagueStandings:
     """Test league standings scraping."""
 
     @patch.object(FbrefScraper, '_fetch_url')
     def test_scrape_league_standings_success(self, mock_fetch, scraper):
         """Test successful league standings scraping."""
-        from bs4 import BeautifulSoup
-
-        # Create mock HTML with standings table
-        html = '''
-        <html>
-            <table id="sched_EPL">
-                <tr><th>Column Headers</th></tr>
-                <tr>
-                    <td></td><td></td><td></td><td></td><td></td>
-                    <td>Manchester United</td><td>5</td><td>3</td><td>1</td><td>1</td>
-                    <td>10</td><td>5</td><td>5</td><td>10</td>
-                </tr>
-            </table>
-        </html>
-        '''
-        mock_fetch.return_value = BeautifulSoup(html, 'html.parser')
+        mock_fetch.return_value = STANDINGS_SOUP
 
         result = scraper.scrape_league_standings('EPL', '2023-24')
-        assert isinstance(result, list)
+        assert isinstance(result, pd.DataFrame)
         assert len(result) > 0
-        assert result[0]['name'] == 'Manchester United'
+        assert result.loc[0, 'name'] == 'Manchester United'
+        assert result.loc[0, 'points'] == 10
+
+    @patch.object(FbrefScraper, '_fetch_url')
+    def test_scrape_league_standings_numeric_columns(self, mock_fetch, scraper):
+        """Test standings cells are converted column-wise with 0 for bad or missing values."""
+        mock_fetch.return_value = STANDINGS_BAD_CELLS_SOUP
+
+        result = scraper.scrape_league_standings('EPL', '2023-24')
+
+        assert len(result) == 1
+        team = result.iloc[0]
+        assert team['name'] == 'Arsenal'
+        assert team['matches_played'] == 5
+        assert team['wins'] == 3
+        assert team['draws'] == 0
+        assert team['points'] == 0
 
     @patch.object(FbrefScraper, '_fetch_url')
     def test_scrape_league_standings_unknown_league(self, mock_fetch, scraper):
@@ -171,13 +293,32 @@ class TestFbrefScraperLeagueStandings:
     @patch.object(FbrefScraper, '_fetch_url')
     def test_scrape_league_standings_no_table(self, mock_fetch, scraper):
         """Test scraping when table not found."""
-        from bs4 import BeautifulSoup
-
-        html = '<html><body>No table here</body></html>'
-        mock_fetch.return_value = BeautifulSoup(html, 'html.parser')
+        mock_fetch.return_value = NO_TABLE_SOUP
 
         result = scraper.scrape_league_standings('EPL', '2023-24')
-        assert result == []
+        assert isinstance(result, pd.DataFrame)
+        assert result.empty
+        assert 'name' in result.columns
+
+
+class TestFbrefScraperConcurrentStandings:
+    """Test concurrent multi-season standings scraping."""
+
+    @patch.object(FbrefScraper, '_fetch_url')
+    def test_scrape_league_standings_many(self, mock_fetch, scraper):
+        """Test scraping several seasons returns results keyed by season."""
+        mock_fetch.return_value = STANDINGS_SOUP
+
+        result = scraper.scrape_league_standings_many('EPL', ['2022-23', '2023-24'])
+
+        assert list(result) == ['2022-23', '2023-24']
+        assert result['2023-24'].loc[0, 'name'] == 'Manchester United'
+        assert mock_fetch.call_count == 2
+
+    def test_scrape_league_standings_many_unknown_league(self, scraper):
+        """Test unknown league codes fail before any request is made."""
+        with pytest.raises(FbrefScraperError):
+            scraper.scrape_league_standings_many('UNKNOWN_LEAGUE', ['2023-24'])
 
 
 class TestFbrefScraperTeamMatches:
@@ -186,33 +327,21 @@ class TestFbrefScraperTeamMatches:
     @patch.object(FbrefScraper, '_fetch_url')
     def test_scrape_team_matches_success(self, mock_fetch, scraper):
         """Test successful team match scraping."""
-        from bs4 import BeautifulSoup
-
-        html = '''
-        <html>
-            <table id="matchlogs_all">
-                <tr><th>Headers</th></tr>
-                <tr>
-                    <td></td><td>2023-08-12</td><td>15:00</td><td>Sat</td>
-                    <td>Premier League</td><td>1</td><td>Home</td>
-                    <td>Liverpool</td><td>Win</td><td>2</td><td>1</td>
-                </tr>
-            </table>
-        </html>
-        '''
-        mock_fetch.return_value = BeautifulSoup(html, 'html.parser')
+        mock_fetch.return_value = TEAM_MATCHES_SOUP
 
         result = scraper.scrape_team_matches('http://example.com/team')
         assert isinstance(result, list)
         assert len(result) > 0
+        assert isinstance(result[0], TeamMatchRow)
+        assert result[0].date == datetime(2023, 8, 12)
+        assert result[0].opponent == 'Liverpool'
+        assert result[0].goals_for == 2
+        assert result[0].goals_against == 1
 
     @patch.object(FbrefScraper, '_fetch_url')
     def test_scrape_team_matches_no_table(self, mock_fetch, scraper):
         """Test scraping when match table not found."""
-        from bs4 import BeautifulSoup
-
-        html = '<html><body>No matches</body></html>'
-        mock_fetch.return_value = BeautifulSoup(html, 'html.parser')
+        mock_fetch.return_value = NO_TABLE_SOUP
 
         result = scraper.scrape_team_matches('http://example.com/team')
         assert result == []
@@ -221,10 +350,10 @@ class TestFbrefScraperTeamMatches:
 class TestFbrefScraperMatchDetails:
     """Test match details scraping."""
 
-    @patch.object(FbrefScraper, '_fetch_url')
+    @patch.object(FbrefScraper, '_fetch_tree')
     def test_scrape_match_details_success(self, mock_fetch, scraper):
         """Test successful match details scraping."""
-        from bs4 import BeautifulSoup
+        from lxml import html as lxml_html
 
         html = '''
         <html>
@@ -235,21 +364,33 @@ class TestFbrefScraperMatchDetails:
             </table>
         </html>
         '''
-        mock_fetch.return_value = BeautifulSoup(html, 'html.parser')
+        mock_fetch.return_value = lxml_html.fromstring(html)
 
         result = scraper.scrape_match_details('http://example.com/match')
         assert isinstance(result, dict)
         assert 'url' in result
         assert 'home_stats' in result
         assert 'away_stats' in result
+        assert result['title'] == 'Manchester United vs Liverpool'
+        assert result['home_stats'] == {'Shots': 15.0, 'Possession': 55.0}
+        assert result['away_stats'] == {'Shots': 12.0, 'Possession': 45.0}
 
-    @patch.object(FbrefScraper, '_fetch_url')
+    @pytest.mark.parametrize("body", [b'', b'   \n'])
+    @patch.object(FbrefScraper, '_fetch_content')
+    def test_scrape_match_details_empty_body(self, mock_fetch, scraper, body):
+        """Test an empty page raises FbrefScraperError instead of an lxml error."""
+        mock_fetch.return_value = body
+
+        with pytest.raises(FbrefScraperError, match="Failed to parse page"):
+            scraper.scrape_match_details('http://example.com/match')
+
+    @patch.object(FbrefScraper, '_fetch_tree')
     def test_scrape_match_details_parse_error(self, mock_fetch, scraper):
         """Test handling of parse errors."""
-        from bs4 import BeautifulSoup
+        from lxml import html as lxml_html
 
         html = '<html><body>Invalid</body></html>'
-        mock_fetch.return_value = BeautifulSoup(html, 'html.parser')
+        mock_fetch.return_value = lxml_html.fromstring(html)
 
         # Should not raise, should return basic structure
         result = scraper.scrape_match_details('http://example.com/match')
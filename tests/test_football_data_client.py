@@ -2,8 +2,14 @@
 Unit tests for football-data.org API client.
 """
 
+import socket
+from types import SimpleNamespace
+
 import pytest
-from unittest.mock import Mock, patch
+import requests
+import responses
+from requests.adapters import HTTPAdapter
+from responses import matchers
 
 from src.clients.football_data_client import (
     FootballDataClient,
@@ -11,6 +17,72 @@ from src.clients.football_data_client import (
     RateLimitError,
 )
 
+BASE_URL = FootballDataClient.BASE_URL
+
+# Response bodies shared by the endpoint tests; tests must not modify them
+CURRENT_MATCHES_PAYLOAD = {
+    'matches': [
+        {'id': 1, 'homeTeam': {'name': 'Team A'}, 'awayTeam': {'name': 'Team B'}},
+    ]
+}
+
+MATCH_DETAILS_PAYLOAD = {
+    'id': 123,
+    'homeTeam': {'name': 'Team A'},
+    'awayTeam': {'name': 'Team B'},
+    'score': {'fullTime': {'home': 2, 'away': 1}},
+}
+
+STANDINGS_PAYLOAD = {
+    'standings': [
+        {
+            'table': [
+                {'team': {'id': 1, 'name': 'Team A'}, 'points': 30},
+                {'team': {'id': 2, 'name': 'Team B'}, 'points': 25},
+            ]
+        }
+    ]
+}
+
+TEAM_INFO_PAYLOAD = {
+    'id': 1,
+    'name': 'Team A',
+    'founded': 1990,
+}
+
+SQUAD_PAYLOAD = {
+    'squad': [
+        {'id': 1, 'name': 'Player A', 'position': 'Forward'},
+        {'id': 2, 'name': 'Player B', 'position': 'Midfielder'},
+    ]
+}
+
+DATE_RANGE_PAYLOAD = {
+    'matches': [
+        {'id': 1, 'utcDate': '2023-08-12T15:00:00Z'},
+        {'id': 2, 'utcDate': '2023-08-13T15:00:00Z'},
+    ]
+}
+
+HEAD_TO_HEAD_PAYLOAD = {
+    'matches': [
+        {'id': 1, 'homeTeam': {'id': 1}, 'awayTeam': {'id': 2}},
+        {'id': 2, 'homeTeam': {'id': 2}, 'awayTeam': {'id': 1}},
+    ]
+}
+
+
+@pytest.fixture
+def api():
+    """
+    Fake the football-data.org API at the HTTP adapter level.
+
+    Tests register URL -> response mappings; every registered response must
+    be requested and unregistered URLs fail with ConnectionError.
+    """
+    with responses.RequestsMock() as rsps:
+        yield rsps
+
 
 @pytest.fixture
 def client():
@@ -27,6 +99,20 @@ class TestFootballDataClientInitialization:
         assert client.api_key == 'test_key'
         assert client.session is not None
 
+    def test_session_pools_connections(self):
+        """Test the default session reuses pooled connections and retries."""
+        client = FootballDataClient('test_key')
+
+        adapter = client.session.get_adapter(BASE_URL)
+        assert isinstance(adapter, HTTPAdapter)
+        assert adapter._pool_connections >= 10
+        assert adapter._pool_maxsize >= 10
+        assert adapter.max_retries.total >= 3
+        assert adapter.max_retries.read is False
+        assert adapter.max_retries.is_retry('GET', 503)
+        assert not adapter.max_retries.is_retry('POST', 503)
+        assert client.session.headers['X-Auth-Token'] == 'test_key'
+
     def test_init_with_empty_key(self):
         """Test initialization with empty API key."""
         with pytest.raises(ValueError, match="API key cannot be empty"):
@@ -41,71 +127,145 @@ class TestFootballDataClientInitialization:
 class TestFootballDataClientLeagueMapping:
     """Test league code mapping."""
 
-    def test_league_code_mapping(self):
+    @pytest.mark.parametrize("code,expected", [
+        ('EPL', 'PL'),
+        ('LA_LIGA', 'SA'),
+        ('SERIE_A', 'SA'),
+        ('BUNDESLIGA', 'BL1'),
+        ('LIGUE_1', 'FL1'),
+    ])
+    def test_league_code_mapping(self, code, expected):
         """Test that league codes map correctly."""
-        assert FootballDataClient.LEAGUE_CODES['EPL'] == 'PL'
-        assert FootballDataClient.LEAGUE_CODES['LA_LIGA'] == 'SA'
-        assert FootballDataClient.LEAGUE_CODES['SERIE_A'] == 'SA'
-        assert FootballDataClient.LEAGUE_CODES['BUNDESLIGA'] == 'BL1'
-        assert FootballDataClient.LEAGUE_CODES['LIGUE_1'] == 'FL1'
+        assert FootballDataClient.LEAGUE_CODES[code] == expected
+
+    @pytest.mark.parametrize("method,args", [
+        ('get_current_matches', ('UNKNOWN_LEAGUE',)),
+        ('get_standings', ('UNKNOWN_LEAGUE',)),
+        ('get_all_matches_for_date_range', ('UNKNOWN', '2023-08-12', '2023-08-13')),
+    ])
+    def test_unknown_league(self, api, client, method, args):
+        """Test league-scoped methods reject unknown league codes."""
+        with pytest.raises(ValueError, match="Unknown league code"):
+            getattr(client, method)(*args)
+        assert len(api.calls) == 0
 
 
 class TestFootballDataClientRateLimiting:
     """Test rate limiting functionality."""
 
-    def test_rate_limit_enforcement(self, client):
-        """Test that rate limiting enforces delays."""
-        client.request_delay = 0.1
-        import time
+    @pytest.fixture
+    def clock(self, monkeypatch):
+        """Fake the rate limiter's clock; sleeps are recorded and advance it."""
+        state = SimpleNamespace(now=100.0, slept=[])
+
+        def sleep(seconds):
+            state.slept.append(seconds)
+            state.now += seconds
+
+        monkeypatch.setattr('src.clients.http.time.monotonic', lambda: state.now)
+        monkeypatch.setattr('src.clients.http.time.sleep', sleep)
+        return state
+
+    def test_token_bucket_allows_burst(self, api, clock):
+        """Test a full bucket lets a burst through, then paces at request_delay."""
+        client = FootballDataClient('test_key', request_delay=6.0, burst=10)
+        api.get(f'{BASE_URL}/matches', json={})
+
+        for _ in range(10):
+            client._get('/matches')
+        assert clock.slept == []
+
+        client._get('/matches')
+        assert clock.slept == [pytest.approx(6.0)]
+
+    def test_token_bucket_refills(self, clock):
+        """Test spent tokens come back at one per request_delay."""
+        client = FootballDataClient('test_key', request_delay=0.1, burst=1)
 
-        start = time.time()
         client._rate_limit_check()
+        clock.now += 0.02
         client._rate_limit_check()
-        elapsed = time.time() - start
+        assert clock.slept == [pytest.approx(0.08)]
+
+        clock.now += 0.11
+        client._rate_limit_check()
+        assert clock.slept == [pytest.approx(0.08)]
+
+    def test_default_pacing_matches_free_tier(self, clock):
+        """Test the defaults pace at 10 requests per minute once the burst is spent."""
+        client = FootballDataClient('test_key')
+
+        for _ in range(10):
+            client._rate_limit_check()
+        assert clock.slept == []
+
+        # Each further request waits for the next of 10 tokens per minute
+        for _ in range(3):
+            client._rate_limit_check()
+        assert clock.slept == [pytest.approx(6.0)] * 3
+        assert clock.now == pytest.approx(118.0)
 
-        # Should have at least 0.1 seconds of delay
-        assert elapsed >= 0.1
+    def test_zero_delay_disables_rate_limit(self, clock):
+        """Test request_delay=0 never waits."""
+        client = FootballDataClient('test_key', request_delay=0)
+
+        for _ in range(20):
+            client._rate_limit_check()
+        assert client.rate_limiter is None
+        assert clock.slept == []
 
 
 class TestFootballDataClientAPIRequests:
     """Test API request handling."""
 
-    @patch('src.clients.football_data_client.requests.Session.get')
-    def test_get_request_success(self, mock_get, client):
+    def test_get_request_success(self, api, client):
         """Test successful API request."""
-        mock_response = Mock()
-        mock_response.json.return_value = {'matches': [{'id': 1}]}
-        mock_response.status_code = 200
-        mock_get.return_value = mock_response
+        api.get(f'{BASE_URL}/matches', json={'matches': [{'id': 1}]})
 
         result = client._get('/matches')
         assert result == {'matches': [{'id': 1}]}
+        assert api.calls[0].request.headers['X-Auth-Token'] == 'test_key'
 
-    @patch('src.clients.football_data_client.requests.Session.get')
-    def test_get_request_rate_limit(self, mock_get, client):
+    def test_get_request_rate_limit(self, api, client):
         """Test API request with rate limit response."""
-        mock_response = Mock()
-        mock_response.status_code = 429
-        mock_response.headers = {'Retry-After': '60'}
-        mock_get.return_value = mock_response
+        api.get(f'{BASE_URL}/matches', status=429, headers={'Retry-After': '60'})
 
-        with pytest.raises(RateLimitError):
+        with pytest.raises(RateLimitError, match="Retry after 60s"):
             client._get('/matches')
 
-    @patch('src.clients.football_data_client.requests.Session.get')
-    def test_get_request_timeout(self, mock_get, client):
+    def test_get_request_timeout(self, api, client):
         """Test API request timeout."""
-        import requests
-        mock_get.side_effect = requests.Timeout()
+        api.get(f'{BASE_URL}/matches', body=requests.Timeout())
 
         with pytest.raises(FootballDataError, match="Request timeout"):
             client._get('/matches')
 
-    @patch('src.clients.football_data_client.requests.Session.get')
-    def test_get_request_connection_error(self, mock_get, client):
+    def test_read_timeout_is_not_retried(self, client, monkeypatch):
+        """Test a real read timeout reaches the client as a timeout after one attempt."""
+        # A server that accepts connections but never answers
+        server = socket.socket()
+        server.bind(('127.0.0.1', 0))
+        server.listen(4)
+        monkeypatch.setattr(client, 'BASE_URL', 'http://127.0.0.1:%d' % server.getsockname()[1])
+        session_get = client.session.get
+        monkeypatch.setattr(
+            client.session, 'get', lambda url, **kwargs: session_get(url, **{**kwargs, 'timeout': 0.2})
+        )
+
+        try:
+            with pytest.raises(FootballDataError, match="Request timeout"):
+                client._get('/matches')
+            # A retried request would have queued a second connection
+            server.settimeout(0.1)
+            server.accept()[0].close()
+            with pytest.raises(socket.timeout):
+                server.accept()
+        finally:
+            server.close()
+
+    def test_get_request_connection_error(self, api, client):
         """Test API request connection error."""
-        import requests
-        mock_get.side_effect = requests.ConnectionError()
+        api.get(f'{BASE_URL}/matches', body=requests.ConnectionError())
 
         with pytest.raises(FootballDataError, match="Request error"):
             client._get('/matches')
@@ -114,94 +274,52 @@ class TestFootballDataClientAPIRequests:
 class TestFootballDataClientMatches:
     """Test match-related API methods."""
 
-    @patch.object(FootballDataClient, '_get')
-    def test_get_current_matches(self, mock_get, client):
+    def test_get_current_matches(self, api, client):
         """Test getting current matches."""
-        mock_get.return_value = {
-            'matches': [
-                {'id': 1, 'homeTeam': {'name': 'Team A'}, 'awayTeam': {'name': 'Team B'}},
-            ]
-        }
+        api.get(
+            f'{BASE_URL}/competitions/PL/matches',
+            json=CURRENT_MATCHES_PAYLOAD,
+            match=[matchers.query_param_matcher({'status': 'SCHEDULED'})],
+        )
 
         result = client.get_current_matches('EPL', status='SCHEDULED')
         assert len(result) == 1
         assert result[0]['id'] == 1
-        mock_get.assert_called_once()
 
-    @patch.object(FootballDataClient, '_get')
-    def test_get_current_matches_unknown_league(self, mock_get, client):
-        """Test getting matches for unknown league."""
-        with pytest.raises(ValueError, match="Unknown league code"):
-            client.get_current_matches('UNKNOWN_LEAGUE')
-
-    @patch.object(FootballDataClient, '_get')
-    def test_get_match_details(self, mock_get, client):
+    def test_get_match_details(self, api, client):
         """Test getting match details."""
-        mock_get.return_value = {
-            'id': 123,
-            'homeTeam': {'name': 'Team A'},
-            'awayTeam': {'name': 'Team B'},
-            'score': {'fullTime': {'home': 2, 'away': 1}},
-        }
+        api.get(f'{BASE_URL}/matches/123', json=MATCH_DETAILS_PAYLOAD)
 
         result = client.get_match_details(123)
         assert result['id'] == 123
-        mock_get.assert_called_once()
 
 
 class TestFootballDataClientStandings:
     """Test standings-related API methods."""
 
-    @patch.object(FootballDataClient, '_get')
-    def test_get_standings(self, mock_get, client):
+    def test_get_standings(self, api, client):
         """Test getting league standings."""
-        mock_get.return_value = {
-            'standings': [
-                {
-                    'table': [
-                        {'team': {'id': 1, 'name': 'Team A'}, 'points': 30},
-                        {'team': {'id': 2, 'name': 'Team B'}, 'points': 25},
-                    ]
-                }
-            ]
-        }
+        api.get(f'{BASE_URL}/competitions/PL/standings', json=STANDINGS_PAYLOAD)
 
         result = client.get_standings('EPL')
         assert len(result) == 2
         assert result[0]['team']['name'] == 'Team A'
 
-    @patch.object(FootballDataClient, '_get')
-    def test_get_standings_unknown_league(self, mock_get, client):
-        """Test getting standings for unknown league."""
-        with pytest.raises(ValueError, match="Unknown league code"):
-            client.get_standings('UNKNOWN_LEAGUE')
-
 
 class TestFootballDataClientTeamInfo:
     """Test team-related API methods."""
 
-    @patch.object(FootballDataClient, '_get')
-    def test_get_team_info(self, mock_get, client):
+    def test_get_team_info(self, api, client):
         """Test getting team information."""
-        mock_get.return_value = {
-            'id': 1,
-            'name': 'Team A',
-            'founded': 1990,
-        }
+        api.get(f'{BASE_URL}/teams/1', json=TEAM_INFO_PAYLOAD)
 
         result = client.get_team_info(1)
         assert result['id'] == 1
         assert result['name'] == 'Team A'
 
-    @patch.object(FootballDataClient, '_get')
-    def test_get_player_statistics(self, mock_get, client):
+    def test_get_player_statistics(self, api, client):
         """Test getting player statistics."""
-        mock_get.return_value = {
-            'squad': [
-                {'id': 1, 'name': 'Player A', 'position': 'Forward'},
-                {'id': 2, 'name': 'Player B', 'position': 'Midfielder'},
-            ]
-        }
+        api.get(f'{BASE_URL}/teams/1', json=SQUAD_PAYLOAD)
 
         result = client.get_player_statistics(1)
         assert len(result) == 2
@@ -211,38 +329,28 @@ class TestFootballDataClientTeamInfo:
 class TestFootballDataClientDateRange:
     """Test date range queries."""
 
-    @patch.object(FootballDataClient, '_get')
-    def test_get_all_matches_for_date_range(self, mock_get, client):
+    def test_get_all_matches_for_date_range(self, api, client):
         """Test getting matches for a date range."""
-        mock_get.return_value = {
-            'matches': [
-                {'id': 1, 'utcDate': '2023-08-12T15:00:00Z'},
-                {'id': 2, 'utcDate': '2023-08-13T15:00:00Z'},
-            ]
-        }
+        api.get(
+            f'{BASE_URL}/competitions/PL/matches',
+            json=DATE_RANGE_PAYLOAD,
+            match=[matchers.query_param_matcher({'dateFrom': '2023-08-12', 'dateTo': '2023-08-13'})],
+        )
 
         result = client.get_all_matches_for_date_range('EPL', '2023-08-12', '2023-08-13')
         assert len(result) == 2
 
-    @patch.object(FootballDataClient, '_get')
-    def test_get_all_matches_for_date_range_unknown_league(self, mock_get, client):
-        """Test date range query for unknown league."""
-        with pytest.raises(ValueError, match="Unknown league code"):
-            client.get_all_matches_for_date_range('UNKNOWN', '2023-08-12', '2023-08-13')
-
 
 class TestFootballDataClientHeadToHead:
     """Test head-to-head queries."""
 
-    @patch.object(FootballDataClient, '_get')
-    def test_get_head_to_head(self, mock_get, client):
+    def test_get_head_to_head(self, api, client):
         """Test getting head-to-head match history."""
-        mock_get.return_value = {
-            'matches': [
-                {'id': 1, 'homeTeam': {'id': 1}, 'awayTeam': {'id': 2}},
-                {'id': 2, 'homeTeam': {'id': 2}, 'awayTeam': {'id': 1}},
-            ]
-        }
+        api.get(
+            f'{BASE_URL}/teams/1/matches',
+            json=HEAD_TO_HEAD_PAYLOAD,
+            match=[matchers.query_param_matcher({'opposition': '2'})],
+        )
 
         result = client.get_head_to_head(1, 2)
         assert len(result) == 2
@@ -14,16 +14,14 @@ from unittest.mock import patch, MagicMock
 
 import pandas as pd
 import numpy as np
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker, Session
+from sqlalchemy import insert
+from sqlalchemy.orm import Session
 
 from src.db.models import (
-    Base,
     League,
     Team,
     Match,
     MatchStatus,
-    TeamStats,
     PredictionOutcome,
     ModelMetrics,
 )
@@ -33,94 +31,163 @@ from src.ml.features import (
     calculate_team_stats,
     calculate_h2h_stats,
     extract_match_features,
+    extract_match_features_bulk,
     create_training_dataset,
     get_feature_names,
+    TeamHistoryCache,
+)
+from src.ml.model import (
+    ModelManager,
+    train_and_save_model,
+    get_prediction_for_match,
+    get_predictions_for_matches,
+    clear_prediction_cache,
+    get_model_metrics,
+    _get_manager,
+    UPCOMING_PREDICTION_TTL,
 )
-from src.ml.model import ModelManager, train_and_save_model, get_prediction_for_match, get_model_metrics
 
 
 # ===== Test Database Setup =====
 
-@pytest.fixture(scope="function")
-def test_db():
-    """Create in-memory SQLite database for testing."""
-    engine = create_engine("sqlite:///:memory:")
-    Base.metadata.create_all(engine)
-    SessionLocal = sessionmaker(bind=engine)
-    session = SessionLocal()
+# Fixed start date of the sample matches (one every 5 days), so the tests
+# can count the matches before a given date
+MATCHES_ANCHOR = datetime(2024, 1, 1)
+
+
+@pytest.fixture(scope="module")
+def ml_connection(engine):
+    """
+    Hold one connection and outer transaction for the whole module.
+
+    Rows seeded by the module-scoped fixtures below live in this transaction
+    and are rolled back once the module is done.
+    """
+    connection = engine.connect()
+    transaction = connection.begin()
+    yield connection
+    transaction.rollback()
+    connection.close()
+
+
+@pytest.fixture(scope="module")
+def seed_session(ml_connection):
+    """Session that owns the module-scoped sample rows."""
+    session = Session(bind=ml_connection, autoflush=False, expire_on_commit=False)
     yield session
     session.close()
-    engine.dispose()
 
 
 @pytest.fixture(scope="function")
-def sample_league(test_db: Session) -> League:
+def test_db(ml_connection):
+    """
+    Get database session for tests.
+
+    Runs inside a SAVEPOINT on the module connection, so the shared sample
+    rows are visible and anything a test writes (even if it commits) is
+    rolled back afterwards.
+    """
+    savepoint = ml_connection.begin_nested()
+    session = Session(
+        bind=ml_connection,
+        autoflush=False,
+        expire_on_commit=False,
+        join_transaction_mode="create_savepoint",
+    )
+    yield session
+    session.close()
+    savepoint.rollback()
+
+
+@pytest.fixture(scope="module")
+def sample_league(seed_session: Session) -> League:
     """Create a sample league."""
     league = League(
         name="Premier League",
         country="England",
         season="2023-24",
     )
-    test_db.add(league)
-    test_db.commit()
-    test_db.refresh(league)
+    seed_session.add(league)
+    seed_session.flush()
     return league
 
 
-@pytest.fixture(scope="function")
-def sample_teams(test_db: Session, sample_league: League) -> tuple[Team, Team]:
+@pytest.fixture(scope="module")
+def sample_teams(seed_session: Session, sample_league: League) -> tuple[Team, Team]:
     """Create sample teams."""
     home_team = Team(name="Team A", country="England", league_id=sample_league.id)
     away_team = Team(name="Team B", country="England", league_id=sample_league.id)
-    test_db.add(home_team)
-    test_db.add(away_team)
-    test_db.commit()
-    test_db.refresh(home_team)
-    test_db.refresh(away_team)
+    seed_session.add_all([home_team, away_team])
+    seed_session.flush()
     return home_team, away_team
 
 
-@pytest.fixture(scope="function")
-def sample_matches(test_db: Session, sample_league: League, sample_teams: tuple[Team, Team]) -> list[Match]:
-    """Create sample matches with final scores."""
+@pytest.fixture(scope="module")
+def sample_matches(seed_session: Session, sample_league: League, sample_teams: tuple[Team, Team]) -> list[Match]:
+    """
+    Create sample matches with final scores.
+
+    Built once per module and shared by the tests, which must not modify
+    them; load a copy through test_db to change a match.
+    """
     home_team, away_team = sample_teams
-    matches = []
-
-    base_date = datetime.utcnow() - timedelta(days=100)
-
-    for i in range(20):
-        match_date = base_date + timedelta(days=i*5)
-
-        # Vary the scores
-        if i % 3 == 0:
-            home_goals, away_goals = 2, 1
-        elif i % 3 == 1:
-            home_goals, away_goals = 1, 1
-        else:
-            home_goals, away_goals = 0, 1
-
-        match = Match(
-            league_id=sample_league.id,
-            home_team_id=home_team.id,
-            away_team_id=away_team.id,
-            match_date=match_date,
-            home_goals=home_goals,
-            away_goals=away_goals,
-            status=MatchStatus.FINISHED,
-            home_shots=15 + i,
-            away_shots=10 + i,
-            home_shots_on_target=5 + (i % 3),
-            away_shots_on_target=4 + (i % 3),
-            home_possession=55.0 + (i % 10),
-            away_possession=45.0 - (i % 10),
-        )
-        matches.append(match)
-        test_db.add(match)
 
-    test_db.commit()
-    for m in matches:
-        test_db.refresh(m)
-    return matches
+    # Vary the scores
+    scores = [(2, 1), (1, 1), (0, 1)]
+    rows = [
+        {
+            "league_id": sample_league.id,
+            "home_team_id": home_team.id,
+            "away_team_id": away_team.id,
+            "match_date": MATCHES_ANCHOR + timedelta(days=i*5),
+            "home_goals": scores[i % 3][0],
+            "away_goals": scores[i % 3][1],
+            "status": MatchStatus.FINISHED,
+            "home_shots": 15 + i,
+            "away_shots": 10 + i,
+            "home_shots_on_target": 5 + (i % 3),
+            "away_shots_on_target": 4 + (i % 3),
+            "home_possession": 55.0 + (i % 10),
+            "away_possession": 45.0 - (i % 10),
+        }
+        for i in range(20)
+    ]
+
+    # One bulk INSERT ... RETURNING hands back the ORM objects with their ids
+    return seed_session.scalars(
+        insert(Match).returning(Match, sort_by_parameter_order=True), rows
+    ).all()
+
+
+@pytest.fixture(scope="session")
+def fast_forest_params() -> dict:
+    """Small random forest settings for tests that only check shapes and keys."""
+    return {"n_estimators": 20, "max_depth": 4}
+
+
+@pytest.fixture(scope="module")
+def sample_data():
+    """Create sample training data (seeded, and shared read-only by the module)."""
+    rng = np.random.default_rng(0)
+    # 30 rows keep every class in both stratified splits and 5 CV folds
+    # float32/int8 like create_training_dataset's output, so train() needs
+    # no conversion copy; no constant column, which would fit nothing
+    X = pd.DataFrame({
+        "home_win_rate": rng.random(30, dtype=np.float32),
+        "away_win_rate": rng.random(30, dtype=np.float32),
+        "goal_difference": rng.standard_normal(30, dtype=np.float32),
+        "h2h_home_wins": rng.integers(0, 5, 30, dtype=np.int8),
+    })
+    y = pd.Series(["home_win", "away_win", "draw"] * 10)
+    return X, y
+
+
+@pytest.fixture(scope="module")
+def fitted_logistic(sample_data):
+    """Logistic ModelManager fitted once on sample_data; tests must not retrain it."""
+    manager = ModelManager("test_fitted")
+    manager.train(*sample_data, model_type="logistic")
+    return manager
 
 
 # ===== Feature Engineering Tests =====
@@ -141,9 +208,11 @@ class TestFeatureEngineering:
         """Test retrieving matches before a specific date."""
         home_team, away_team = sample_teams
 
-        before_date = datetime.utcnow() - timedelta(days=30)
-        recent = get_recent_matches(test_db, home_team.id, num_matches=10, before_date=before_date)
+        before_date = MATCHES_ANCHOR + timedelta(days=50)
+        recent = get_recent_matches(test_db, home_team.id, num_matches=20, before_date=before_date)
 
+        # Matches on days 0, 5, ..., 45
+        assert len(recent) == 10
         assert all(m.match_date < before_date for m in recent)
 
     def test_get_head_to_head(self, test_db: Session, sample_teams: tuple[Team, Team], sample_matches: list[Match]):
@@ -169,6 +238,30 @@ class TestFeatureEngineering:
         assert 0.0 <= stats["draw_rate"] <= 1.0
         assert 0.0 <= stats["loss_rate"] <= 1.0
 
+    def test_calculate_team_stats_with_cache(self, test_db: Session, sample_teams: tuple[Team, Team], sample_matches: list[Match]):
+        """Test cached team statistics match the direct query path."""
+        home_team, away_team = sample_teams
+        cache = TeamHistoryCache(test_db)
+        before_date = sample_matches[12].match_date
+
+        for team in (home_team, away_team):
+            expected = calculate_team_stats(test_db, team.id, num_matches=5, before_date=before_date)
+            cached = calculate_team_stats(test_db, team.id, num_matches=5, before_date=before_date, cache=cache)
+            assert cached == pytest.approx(expected)
+
+        window = cache.recent(home_team.id, num_matches=5, before_date=before_date)
+        assert len(window["match_date"]) == 5
+
+    def test_team_history_cache_evicts_least_recent(self, test_db: Session, sample_teams: tuple[Team, Team], sample_matches: list[Match]):
+        """Test the cache keeps at most max_teams histories."""
+        home_team, away_team = sample_teams
+        cache = TeamHistoryCache(test_db, max_teams=1)
+
+        cache.get(home_team.id)
+        cache.get(away_team.id)
+
+        assert list(cache._histories) == [away_team.id]
+
     def test_calculate_h2h_stats(self, test_db: Session, sample_teams: tuple[Team, Team], sample_matches: list[Match]):
         """Test calculating head-to-head statistics."""
         home_team, away_team = sample_teams
@@ -187,26 +280,40 @@ class TestFeatureEngineering:
 
         features = extract_match_features(test_db, match, recent_matches=10, h2h_matches=5)
 
-        # Check required features exist
-        required_features = [
+        required_features = {
             "home_win_rate",
             "away_win_rate",
             "goal_difference",
             "h2h_home_wins",
             "is_home_advantage",
-        ]
-        for feature in required_features:
-            assert feature in features
-            assert isinstance(features[feature], (int, float))
+        }
+        missing = required_features - features.keys()
+        assert not missing, f"missing features: {missing}"
+        not_numeric = {k for k in required_features if not isinstance(features[k], (int, float))}
+        assert not not_numeric, f"non-numeric features: {not_numeric}"
+
+    def test_extract_match_features_bulk(self, test_db: Session, sample_teams: tuple[Team, Team], sample_matches: list[Match]):
+        """Test bulk extraction matches per-match extraction."""
+        matches = sample_matches[5:]
+
+        features_df = extract_match_features_bulk(test_db, matches)
+
+        assert list(features_df.index) == [match.id for match in matches]
+        assert list(features_df.columns) == get_feature_names()
+        assert (features_df.dtypes == np.float32).all()
+        for match in matches:
+            expected = extract_match_features(test_db, match)
+            actual = features_df.loc[match.id]
+            for name in get_feature_names():
+                assert actual[name] == pytest.approx(expected[name], rel=1e-5)
 
     def test_get_feature_names(self):
         """Test getting feature names."""
         feature_names = get_feature_names()
 
         assert len(feature_names) > 0
-        assert "home_win_rate" in feature_names
-        assert "away_win_rate" in feature_names
-        assert "goal_difference" in feature_names
+        missing = {"home_win_rate", "away_win_rate", "goal_difference"} - set(feature_names)
+        assert not missing, f"missing feature names: {missing}"
 
 
 # ===== Dataset Creation Tests =====
@@ -220,6 +327,7 @@ class TestDatasetCreation:
 
         assert isinstance(X, pd.DataFrame)
         assert isinstance(y, pd.Series)
+        assert (X.dtypes == np.float32).all()
         assert len(X) == len(y)
         assert len(X) > 0
         assert len(X.columns) > 0
@@ -249,19 +357,6 @@ class TestDatasetCreation:
 class TestModelManager:
     """Test ML model manager."""
 
-    @pytest.fixture
-    def sample_data(self):
-        """Create sample training data."""
-        X = pd.DataFrame({
-            "home_win_rate": np.random.rand(100),
-            "away_win_rate": np.random.rand(100),
-            "goal_difference": np.random.randn(100),
-            "h2h_home_wins": np.random.randint(0, 5, 100),
-            "is_home_advantage": np.ones(100),
-        })
-        y = pd.Series(["home_win", "away_win", "draw"] * 33 + ["home_win"])
-        return X, y
-
     def test_model_manager_initialization(self):
         """Test ModelManager initialization."""
         manager = ModelManager("test_model")
@@ -285,60 +380,151 @@ class TestModelManager:
         assert manager.model is not None
         assert manager.label_encoder is not None
 
-    def test_train_random_forest_model(self, sample_data):
+    def test_train_with_ndarray(self, sample_data):
+        """Test training directly on a NumPy feature matrix."""
+        manager = ModelManager("test_ndarray")
+        X, y = sample_data
+
+        metrics = manager.train(X.to_numpy(), y, model_type="logistic")
+
+        assert 0.0 <= metrics["accuracy"] <= 1.0
+        assert manager.model.coef_.shape[1] == X.shape[1]
+
+    def test_train_random_forest_model(self, sample_data, fast_forest_params):
         """Test training a random forest model."""
         manager = ModelManager("test_rf")
         X, y = sample_data
 
-        metrics = manager.train(X, y, model_type="random_forest")
+        metrics = manager.train(X, y, model_type="random_forest", **fast_forest_params)
 
         assert "accuracy" in metrics
+        assert metrics["cv_mean"] == manager.model.oob_score_
         assert manager.model is not None
 
-    def test_model_save_and_load(self, sample_data, tmp_path):
+    def test_train_random_forest_without_bootstrap(self, sample_data, fast_forest_params):
+        """Test bootstrap=False trains without an out-of-bag score."""
+        manager = ModelManager("test_rf_no_bootstrap")
+        X, y = sample_data
+
+        metrics = manager.train(
+            X, y, model_type="random_forest", bootstrap=False, **fast_forest_params
+        )
+
+        assert manager.model.oob_score is False
+        assert metrics["cv_mean"] is None
+
+    def test_train_logistic_with_cv(self, sample_data):
+        """Test cross-validation only runs when requested."""
+        manager = ModelManager("test_cv")
+        X, y = sample_data
+
+        without_cv = manager.train(X, y, model_type="logistic")
+        with_cv = manager.train(X, y, model_type="logistic", do_cv=True)
+
+        assert without_cv["cv_mean"] is None
+        assert 0.0 <= with_cv["cv_mean"] <= 1.0
+
+    def test_model_save_and_load(self, fitted_logistic, monkeypatch, tmp_path):
         """Test saving and loading a model."""
-        import tempfile
+        manager = fitted_logistic
+        monkeypatch.setattr(manager, "model_path", tmp_path / "test_model.joblib")
+        monkeypatch.setattr(manager, "encoder_path", tmp_path / "test_encoder.joblib")
+        monkeypatch.setattr(manager, "metadata_path", tmp_path / "test_metadata.json")
 
-        # Train model
-        manager = ModelManager("test_save_load")
+        manager.save(MagicMock(), model_type="logistic")
+
+        assert manager.model_path.exists()
+        assert manager.encoder_path.exists()
+        assert manager.metadata_path.exists()
+
+    def test_save_does_not_change_loaded_model(self, sample_data, fitted_logistic, tmp_path):
+        """Test a memory-mapped model keeps predicting the same after a retrain is saved."""
         X, y = sample_data
-        manager.train(X, y, model_type="logistic")
+        with patch("src.ml.model.MODELS_DIR", tmp_path):
+            manager = ModelManager("test_replace")
+            manager.model, manager.label_encoder = fitted_logistic.model, fitted_logistic.label_encoder
+            manager.save(MagicMock(), model_type="logistic")
+
+            loaded = ModelManager("test_replace")
+            assert loaded.load()
+            before = loaded.model.predict_proba(X.to_numpy())
+
+            retrained = ModelManager("test_replace")
+            retrained.train(X, y, model_type="logistic", C=0.01)
+            retrained.save(MagicMock(), model_type="logistic")
+
+            after = loaded.model.predict_proba(X.to_numpy())
+            assert np.isfinite(after).all()
+            np.testing.assert_array_equal(after, before)
+            assert sorted(p.name for p in tmp_path.iterdir()) == [
+                "test_replace.joblib",
+                "test_replace_encoder.joblib",
+                "test_replace_metadata.json",
+            ]
+
+    def test_train_logistic_warm_start(self, sample_data, fitted_logistic, tmp_path):
+        """Test retraining a logistic model from saved coefficients."""
+        X, y = sample_data
+        with patch("src.ml.model.MODELS_DIR", tmp_path):
+            manager = ModelManager("test_warm_start")
+            manager.model, manager.label_encoder = fitted_logistic.model, fitted_logistic.label_encoder
+            manager.save(MagicMock(), model_type="logistic")
 
-        # Save model
-        with patch.object(manager, 'model_path', tmp_path / "test_model.joblib"):
-            with patch.object(manager, 'encoder_path', tmp_path / "test_encoder.joblib"):
-                with patch.object(manager, 'metadata_path', tmp_path / "test_metadata.json"):
-                    # Mock session
-                    mock_session = MagicMock()
-                    manager.save(mock_session, model_type="logistic")
+            retrained = ModelManager("test_warm_start")
+            metrics = retrained.train(X, y, model_type="logistic", warm_start=True)
 
-        # Verify save was called (we can't actually test file I/O in this setup)
-        assert manager.model is not None
+        assert retrained.model.warm_start is True
+        assert 0.0 <= metrics["accuracy"] <= 1.0
 
-    def test_model_predict(self, sample_data):
-        """Test making predictions with trained model."""
-        manager = ModelManager("test_predict")
+    def test_model_save_compressed_and_load(self, sample_data, fitted_logistic, tmp_path):
+        """Test a compressed model round-trips through save and load."""
         X, y = sample_data
+        with patch("src.ml.model.MODELS_DIR", tmp_path):
+            manager = ModelManager("test_compressed")
+            manager.model, manager.label_encoder = fitted_logistic.model, fitted_logistic.label_encoder
+            manager.save(MagicMock(), model_type="logistic", compress=3)
 
-        # Train on most of the data
-        manager.train(X.iloc[:-10], y.iloc[:-10], model_type="logistic")
+            loaded = ModelManager("test_compressed")
+            assert loaded.load() is True
 
-        # Predict on remaining data
-        predictions, probabilities = manager.predict(X.iloc[-10:])
+        predictions, _ = loaded.predict(X.iloc[:5])
+        expected, _ = manager.predict(X.iloc[:5])
+        assert list(predictions) == list(expected)
+
+    def test_model_predict(self, sample_data, fitted_logistic):
+        """Test making predictions with trained model."""
+        X, _ = sample_data
+
+        predictions, probabilities = fitted_logistic.predict(X.iloc[-10:])
 
         assert len(predictions) == 10
         assert probabilities.shape[0] == 10
         assert probabilities.shape[1] == 3  # Three classes
 
+    def test_model_predict_one(self, fast_forest_params):
+        """Test predicting a single match from a feature dictionary."""
+        manager = ModelManager("test_predict_one")
+        rng = np.random.default_rng(0)
+        X = pd.DataFrame(rng.random((60, len(manager.feature_names))), columns=manager.feature_names)
+        y = pd.Series(["home_win", "away_win", "draw"] * 20)
+        manager.train(X, y, model_type="random_forest", **fast_forest_params)
+
+        predicted_outcome, probabilities = manager.predict_one(X.iloc[0].to_dict())
+
+        assert predicted_outcome in {"home_win", "draw", "away_win"}
+        assert probabilities.shape == (3,)
+        assert probabilities.sum() == pytest.approx(1.0)
+
 
 # ===== Integration Tests =====
 
 class TestMLIntegration:
     """Integration tests for ML components."""
 
-    def test_train_and_save_model_success(self, test_db: Session, sample_matches: list[Match]):
+    def test_train_and_save_model_success(self, test_db: Session, sample_matches: list[Match], tmp_path):
         """Test complete training and saving flow."""
-        result = train_and_save_model(test_db, model_type="logistic", min_matches=5)
+        with patch("src.ml.model.MODELS_DIR", tmp_path):
+            result = train_and_save_model(test_db, model_type="logistic", min_matches=5)
 
         assert result["success"] is True
         assert "metrics" in result
@@ -350,6 +536,69 @@ class TestMLIntegration:
 
         assert result["success"] is False
 
+    def test_get_prediction_for_match_missing_model(self, test_db: Session, sample_matches: list[Match]):
+        """Test prediction returns None when no model is saved, without caching the failure."""
+        _get_manager.cache_clear()
+
+        result = get_prediction_for_match(test_db, sample_matches[-1], model_name="missing_model")
+
+        assert result is None
+        assert _get_manager.cache_info().currsize == 0
+
+    def test_get_manager_is_cached(self):
+        """Test loaded model managers are reused across calls."""
+        _get_manager.cache_clear()
+
+        with patch.object(ModelManager, "load", return_value=True) as mock_load:
+            first = _get_manager("cached_model")
+            second = _get_manager("cached_model")
+
+        assert first is second
+        mock_load.assert_called_once()
+        _get_manager.cache_clear()
+
+    def test_get_predictions_for_matches(self, test_db: Session, sample_matches: list[Match], fast_forest_params):
+        """Test batch predictions agree with single-match predictions."""
+        manager = ModelManager("test_batch")
+        rng = np.random.default_rng(0)
+        X = pd.DataFrame(rng.random((60, len(manager.feature_names))), columns=manager.feature_names)
+        y = pd.Series(["home_win", "away_win", "draw"] * 20)
+        manager.train(X, y, model_type="random_forest", **fast_forest_params)
+
+        matches = sample_matches[-3:]
+        clear_prediction_cache()
+        with patch("src.ml.model._get_manager", return_value=manager):
+            batch = get_predictions_for_matches(test_db, matches)
+            single = get_prediction_for_match(test_db, matches[0])
+        clear_prediction_cache()
+
+        assert [p["match_id"] for p in batch] == [m.id for m in matches]
+        assert batch[0]["predicted_outcome"] == single["predicted_outcome"]
+        assert batch[0]["confidence"] == pytest.approx(single["confidence"])
+
+    def test_get_prediction_for_match_is_cached(self, test_db: Session, sample_matches: list[Match]):
+        """Test repeated predictions for a match skip feature extraction until the TTL expires."""
+        manager = MagicMock()
+        manager.predict_one.return_value = ("home_win", np.array([0.6, 0.3, 0.1]))
+        manager.label_encoder.classes_ = np.array(["home_win", "draw", "away_win"])
+        # Change a test_db copy; sample_matches is shared by the module
+        upcoming = test_db.get(Match, sample_matches[-1].id)
+        upcoming.status = MatchStatus.SCHEDULED
+        clear_prediction_cache()
+
+        with patch("src.ml.model._get_manager", return_value=manager), \
+                patch("src.ml.model.time.monotonic", return_value=1000.0) as mock_clock:
+            first = get_prediction_for_match(test_db, upcoming)
+            second = get_prediction_for_match(test_db, upcoming)
+            assert manager.predict_one.call_count == 1
+
+            mock_clock.return_value = 1000.0 + UPCOMING_PREDICTION_TTL
+            get_prediction_for_match(test_db, upcoming)
+            assert manager.predict_one.call_count == 2
+
+        assert second == first
+        clear_prediction_cache()
+
     def test_get_model_metrics(self, test_db: Session, sample_matches: list[Match]):
         """Test retrieving model metrics from database."""
         # Add sample metrics
@@ -3,7 +3,9 @@ Unit tests for the-odds-api.com API client.
 """
 
 import pytest
-from unittest.mock import Mock, patch
+import requests
+import responses
+from unittest.mock import patch
 
 from src.clients.odds_api_client import (
     OddsApiClient,
@@ -11,13 +13,95 @@ from src.clients.odds_api_client import (
     RateLimitError,
 )
 
+ODDS_URL = f'{OddsApiClient.BASE_URL}/odds'
+
+# Raw API events shared by the parsing tests; tests must not modify them
+RAW_ODDS_SINGLE = {
+    'id': 'match_1',
+    'sport_key': 'soccer_epl',
+    'sport_title': 'Premier League',
+    'home_team': 'Manchester United',
+    'away_team': 'Liverpool',
+    'commence_time': '2023-08-12T15:00:00Z',
+    'bookmakers': [
+        {
+            'title': 'Bet365',
+            'last_update': '2023-08-12T10:00:00Z',
+            'markets': [
+                {
+                    'key': 'h2h',
+                    'outcomes': [
+                        {'name': 'Manchester United', 'price': 2.50},
+                        {'name': 'Draw', 'price': 3.00},
+                        {'name': 'Liverpool', 'price': 2.75},
+                    ]
+                }
+            ]
+        }
+    ]
+}
+
+RAW_ODDS_MULTI = {
+    'id': 'match_1',
+    'home_team': 'Team A',
+    'away_team': 'Team B',
+    'bookmakers': [
+        {
+            'title': 'Bet365',
+            'markets': [
+                {
+                    'key': 'h2h',
+                    'outcomes': [
+                        {'name': 'Team A', 'price': 2.50},
+                        {'name': 'Draw', 'price': 3.00},
+                        {'name': 'Team B', 'price': 2.75},
+                    ]
+                }
+            ]
+        },
+        {
+            'title': 'DraftKings',
+            'markets': [
+                {
+                    'key': 'h2h',
+                    'outcomes': [
+                        {'name': 'Team A', 'price': 2.45},
+                        {'name': 'Draw', 'price': 3.10},
+                        {'name': 'Team B', 'price': 2.80},
+                    ]
+                }
+            ]
+        }
+    ]
+}
+
 
 @pytest.fixture
-def client():
-    """Create an odds API client for testing."""
+def api():
+    """
+    Fake the odds API at the HTTP adapter level.
+
+    Tests register URL -> response mappings; every registered response must
+    be requested and unregistered URLs fail with ConnectionError.
+    """
+    with responses.RequestsMock() as rsps:
+        yield rsps
+
+
+@pytest.fixture(scope="session")
+def client_shared():
+    """Create one odds API client for the whole test session."""
     return OddsApiClient(api_key='test_key', request_delay=0)
 
 
+@pytest.fixture
+def client(client_shared):
+    """Yield the shared client, resetting its rate-limit state afterwards."""
+    yield client_shared
+    client_shared.request_delay = 0
+    client_shared.last_request_time = 0
+
+
 class TestOddsApiClientInitialization:
     """Test client initialization."""
 
@@ -65,78 +149,48 @@ class TestOddsApiClientLeagueMapping:
 class TestOddsApiClientRateLimiting:
     """Test rate limiting functionality."""
 
-    def test_rate_limit_enforcement(self, client):
+    def test_rate_limit_enforcement(self, client, monkeypatch):
         """Test that rate limiting enforces delays."""
         client.request_delay = 0.1
-        import time
+        # Fake clock starts well past the client's initial last_request_time
+        now = [1.0]
+        slept = []
+
+        def fake_sleep(seconds):
+            slept.append(seconds)
+            now[0] += seconds
+
+        monkeypatch.setattr('src.clients.odds_api_client.time.monotonic', lambda: now[0])
+        monkeypatch.setattr('src.clients.odds_api_client.time.sleep', fake_sleep)
 
-        start = time.time()
         client._rate_limit_check()
         client._rate_limit_check()
-        elapsed = time.time() - start
 
-        # Should have at least 0.1 seconds of delay
-        assert elapsed >= 0.1
+        assert slept == [pytest.approx(0.1)]
+        assert client.last_request_time == pytest.approx(1.1)
 
 
 class TestOddsApiClientAPIRequests:
     """Test API request handling."""
 
-    @patch('src.clients.odds_api_client.requests.Session.get')
-    def test_get_request_success(self, mock_get, client):
+    def test_get_request_success(self, api, client):
         """Test successful API request."""
-        mock_response = Mock()
-        mock_response.json.return_value = {
-            'data': [{'id': 1, 'home_team': 'Team A'}]
-        }
-        mock_response.status_code = 200
-        mock_get.return_value = mock_response
+        api.get(ODDS_URL, json={'data': [{'id': 1, 'home_team': 'Team A'}]})
 
         result = client._get('/odds')
         assert 'data' in result
 
-    @patch('src.clients.odds_api_client.requests.Session.get')
-    def test_get_request_rate_limit(self, mock_get, client):
-        """Test API request with rate limit response."""
-        mock_response = Mock()
-        mock_response.status_code = 429
-        mock_get.return_value = mock_response
-
-        with pytest.raises(RateLimitError):
-            client._get('/odds')
-
-    @patch('src.clients.odds_api_client.requests.Session.get')
-    def test_get_request_bad_request(self, mock_get, client):
-        """Test API request with bad request response."""
-        mock_response = Mock()
-        mock_response.status_code = 400
-        mock_response.json.return_value = {'errors': ['Bad request']}
-        mock_response.text = 'Bad request'
-        mock_get.return_value = mock_response
-
-        with pytest.raises(OddsApiError, match="Bad request"):
-            client._get('/odds')
-
-    @patch('src.clients.odds_api_client.requests.Session.get')
-    def test_get_request_api_error(self, mock_get, client):
-        """Test API request with API-level error."""
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {
-            'errors': {'limit': 'Rate limit exceeded'},
-        }
-        mock_get.return_value = mock_response
-
-        with pytest.raises(OddsApiError, match="API error"):
-            client._get('/odds')
-
-    @patch('src.clients.odds_api_client.requests.Session.get')
-    def test_get_request_timeout(self, mock_get, client):
-        """Test API request timeout."""
-        import requests
-        mock_get.side_effect = requests.Timeout()
-
-        with pytest.raises(OddsApiError, match="Request timeout"):
+    @pytest.mark.parametrize('response_kwargs,expected_exc,match', [
+        ({'status': 429}, RateLimitError, "Rate limit exceeded"),
+        ({'status': 400, 'json': {'errors': ['Bad request']}}, OddsApiError, "Bad request"),
+        ({'json': {'errors': {'limit': 'Rate limit exceeded'}}}, OddsApiError, "API error"),
+        ({'body': requests.Timeout()}, OddsApiError, "Request timeout"),
+    ], ids=['rate_limit', 'bad_request', 'api_error', 'timeout'])
+    def test_get_request_errors(self, api, client, response_kwargs, expected_exc, match):
+        """Test API request error responses raise the matching exception."""
+        api.get(ODDS_URL, **response_kwargs)
+
+        with pytest.raises(expected_exc, match=match):
             client._get('/odds')
 
 
@@ -318,74 +372,49 @@ class TestOddsApiClientParsing:
 
     def test_parse_odds_response(self, client):
         """Test parsing odds response."""
-        raw_odds = {
-            'id': 'match_1',
-            'sport_key': 'soccer_epl',
-            'sport_title': 'Premier League',
-            'home_team': 'Manchester United',
-            'away_team': 'Liverpool',
-            'commence_time': '2023-08-12T15:00:00Z',
-            'bookmakers': [
-                {
-                    'title': 'Bet365',
-                    'last_update': '2023-08-12T10:00:00Z',
-                    'markets': [
-                        {
-                            'key': 'h2h',
-                            'outcomes': [
-                                {'name': 'Manchester United', 'price': 2.50},
-                                {'name': 'Draw', 'price': 3.00},
-                                {'name': 'Liverpool', 'price': 2.75},
-                            ]
-                        }
-                    ]
-                }
-            ]
-        }
-
-        parsed = client.parse_odds_response(raw_odds)
+        parsed = client.parse_odds_response(RAW_ODDS_SINGLE)
         assert parsed['id'] == 'match_1'
         assert parsed['home_team'] == 'Manchester United'
         assert len(parsed['bookmakers']) == 1
         assert parsed['bookmakers'][0]['name'] == 'Bet365'
 
-    def test_parse_odds_response_multiple_bookmakers(self, client):
-        """Test parsing odds with multiple bookmakers."""
+    def test_parse_odds_response_markets(self, client):
+        """Test h2h outcomes, totals and the 2.5 goals line are indexed by key."""
+        totals = [
+            {'name': 'Over', 'price': 1.90, 'point': 2.5},
+            {'name': 'Under', 'price': 1.95, 'point': 2.5},
+            {'name': 'Over', 'price': 2.60, 'point': 3.5},
+        ]
         raw_odds = {
             'id': 'match_1',
-            'home_team': 'Team A',
-            'away_team': 'Team B',
             'bookmakers': [
                 {
                     'title': 'Bet365',
                     'markets': [
+                        {'key': 'totals', 'outcomes': totals},
                         {
                             'key': 'h2h',
                             'outcomes': [
-                                {'name': 'Team A', 'price': 2.50},
-                                {'name': 'Draw', 'price': 3.00},
-                                {'name': 'Team B', 'price': 2.75},
-                            ]
-                        }
-                    ]
-                },
-                {
-                    'title': 'DraftKings',
-                    'markets': [
-                        {
-                            'key': 'h2h',
-                            'outcomes': [
-                                {'name': 'Team A', 'price': 2.45},
-                                {'name': 'Draw', 'price': 3.10},
-                                {'name': 'Team B', 'price': 2.80},
+                                {'name': 'Arsenal', 'price': 2.10},
+                                {'name': 'Draw', 'price': None},
                             ]
-                        }
+                        },
                     ]
                 }
             ]
         }
 
-        parsed = client.parse_odds_response(raw_odds)
+        markets = client.parse_odds_response(raw_odds)['bookmakers'][0]['markets']
+        assert markets == {
+            'Arsenal_odds': 2.10,
+            'totals': totals,
+            'over_2_5_odds': 1.90,
+            'under_2_5_odds': 1.95,
+        }
+
+    def test_parse_odds_response_multiple_bookmakers(self, client):
+        """Test parsing odds with multiple bookmakers."""
+        parsed = client.parse_odds_response(RAW_ODDS_MULTI)
         assert len(parsed['bookmakers']) == 2
 
 
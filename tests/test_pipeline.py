@@ -3,29 +3,117 @@ Unit tests for the data pipeline module.
 """
 
 import pytest
+import warnings
 from datetime import datetime
-from unittest.mock import Mock, patch, MagicMock
+from unittest.mock import Mock, patch
 
-from src.scraper.pipeline import DataPipeline, PipelineError
-from src.db.models import League, Team, Match, MatchStatus
+import pandas as pd
+from sqlalchemy import create_engine
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
 
+from src.scraper.pipeline import (
+    DataPipeline,
+    PipelineError,
+    _dumps_json,
+    _dumps_json_stdlib,
+    _normkey,
+)
+from src.db.models import Base, League, Team, Match, MatchStatus
 
-@pytest.fixture
-def mock_db_session():
-    """Create a mock database session."""
+
+# Public attribute names of each model, so mocks skip per-instance spec introspection
+_LEAGUE_ATTRS = [a for a in dir(League) if not a.startswith('_')]
+_TEAM_ATTRS = [a for a in dir(Team) if not a.startswith('_')]
+_MATCH_ATTRS = [a for a in dir(Match) if not a.startswith('_')]
+
+
+def _model_mock(attrs, **kwargs):
+    """Create a mock restricted to ``attrs`` with the given attributes set."""
+    mock = Mock(spec_set=attrs)
+    for name, value in kwargs.items():
+        setattr(mock, name, value)
+    return mock
+
+
+def league_mock(**kwargs):
+    """Create a League mock."""
+    return _model_mock(_LEAGUE_ATTRS, **kwargs)
+
+
+def team_mock(**kwargs):
+    """Create a Team mock."""
+    return _model_mock(_TEAM_ATTRS, **kwargs)
+
+
+def match_mock(**kwargs):
+    """Create a Match mock."""
+    return _model_mock(_MATCH_ATTRS, **kwargs)
+
+
+@pytest.fixture(scope="session")
+def mock_db_session_shared():
+    """Create a mock database session shared across the test session."""
     return Mock()
 
 
 @pytest.fixture
-def pipeline(mock_db_session):
-    """Create a data pipeline instance with mocked components."""
+def mock_db_session(mock_db_session_shared):
+    """Yield the shared mock session, clearing calls and stubs afterwards."""
+    yield mock_db_session_shared
+    mock_db_session_shared.reset_mock(return_value=True, side_effect=True)
+
+
+# Mock session attribute paths for the query results the pipeline reads
+_DB_RESULT_PATHS = {
+    'scalar_one_or_none': 'execute.return_value.scalar_one_or_none.return_value',
+    'scalars_all': 'execute.return_value.scalars.return_value.all.return_value',
+    'query_all': 'query.return_value.filter.return_value.all.return_value',
+}
+
+
+@pytest.fixture
+def db_returns(mock_db_session):
+    """
+    Stub query results on the mock session.
+
+    Sets the whole chain through ``return_value`` in one ``configure_mock``
+    call, so no ``execute()``/``query()`` calls are recorded while stubbing.
+    """
+    def _set(**results):
+        mock_db_session.configure_mock(
+            **{_DB_RESULT_PATHS[name]: value for name, value in results.items()}
+        )
+    return _set
+
+
+@pytest.fixture(scope="session")
+def pipeline_shared(mock_db_session_shared):
+    """Build one data pipeline for the session; client setup is not free."""
     return DataPipeline(
-        db_session=mock_db_session,
+        db_session=mock_db_session_shared,
         football_data_key='test_fd_key',
         api_football_key='test_af_key',
     )
 
 
+@pytest.fixture
+def pipeline(pipeline_shared, mock_db_session):
+    """Return the shared pipeline; ``mock_db_session`` resets its stubs per test."""
+    return pipeline_shared
+
+
+@pytest.fixture(scope="module")
+def match_triple():
+    """Mock league, home team and away team for match transformation tests."""
+    league = league_mock(id=1)
+    home_team = team_mock(id=1)
+    away_team = team_mock(id=2)
+    return league, home_team, away_team
+
+
+
 class TestPipelineInitialization:
     """Test pipeline initialization."""
 
@@ -78,9 +166,7 @@ class TestPipelineTeamTransformation:
 
     def test_transform_to_team_dict_format(self, pipeline):
         """Test transforming team data from dictionary."""
-        league = Mock(spec=League)
-        league.id = 1
-        league.country = 'England'
+        league = league_mock(id=1, country='England')
 
         team_data = {'name': 'Manchester United', 'id': 1}
         team = pipeline.transform_to_team(team_data, league)
@@ -91,9 +177,7 @@ class TestPipelineTeamTransformation:
 
     def test_transform_to_team_api_football_format(self, pipeline):
         """Test transforming team data from api-football format."""
-        league = Mock(spec=League)
-        league.id = 1
-        league.country = 'England'
+        league = league_mock(id=1, country='England')
 
         team_data = {'team': {'name': 'Liverpool', 'id': 2}}
         team = pipeline.transform_to_team(team_data, league)
@@ -102,9 +186,7 @@ class TestPipelineTeamTransformation:
 
     def test_transform_to_team_string_format(self, pipeline):
         """Test transforming team data from string."""
-        league = Mock(spec=League)
-        league.id = 1
-        league.country = 'England'
+        league = league_mock(id=1, country='England')
 
         team = pipeline.transform_to_team('Arsenal', league)
         assert team.name == 'Arsenal'
@@ -113,16 +195,9 @@ class TestPipelineTeamTransformation:
 class TestPipelineMatchTransformation:
     """Test match data transformation."""
 
-    def test_transform_to_match_success(self, pipeline):
+    def test_transform_to_match_success(self, pipeline, match_triple):
         """Test transforming match data."""
-        league = Mock(spec=League)
-        league.id = 1
-
-        home_team = Mock(spec=Team)
-        home_team.id = 1
-
-        away_team = Mock(spec=Team)
-        away_team.id = 2
+        league, home_team, away_team = match_triple
 
         match_data = {
             'id': 123,
@@ -143,32 +218,98 @@ class TestPipelineMatchTransformation:
         assert match.status == MatchStatus.FINISHED
         assert match.external_id == '123'
 
-    def test_transform_to_match_status_mapping(self, pipeline):
-        """Test status mapping in match transformation."""
-        league = Mock(spec=League)
-        league.id = 1
-        home_team = Mock(spec=Team)
-        home_team.id = 1
-        away_team = Mock(spec=Team)
-        away_team.id = 2
-
-        statuses = [
-            ('SCHEDULED', MatchStatus.SCHEDULED),
-            ('LIVE', MatchStatus.LIVE),
-            ('FINISHED', MatchStatus.FINISHED),
-            ('POSTPONED', MatchStatus.POSTPONED),
-            ('CANCELLED', MatchStatus.CANCELLED),
+    def test_transform_matches_batch_matches_row_transform(self, pipeline):
+        """Test the vectorized batch transform agrees with transform_to_match."""
+        league = league_mock(id=1)
+        home_team = team_mock(id=1, name='Team A')
+        away_team = team_mock(id=2, name='Team B')
+        team_dict = {_normkey(team.name): team for team in (home_team, away_team)}
+
+        matches_data = [
+            {
+                'id': 123,
+                'utcDate': '2023-08-12T15:00:00Z',
+                'status': 'FINISHED',
+                'homeTeam': {'name': 'Team A'},
+                'awayTeam': {'name': 'team b'},
+                'score': {'fullTime': {'home': 2, 'away': 1}},
+            },
+            {
+                'id': 124,
+                'utcDate': '2023-08-19T15:00:00Z',
+                'homeTeam': {'name': 'Unknown FC'},
+                'awayTeam': {'name': 'Team A'},
+            },
+        ]
+
+        records = pipeline.transform_matches_batch(matches_data, league.id, team_dict)
+        expected = pipeline.transform_to_match(matches_data[0], league, home_team, away_team)
+
+        assert len(records) == 1
+        for key, value in records[0].items():
+            assert value == getattr(expected, key)
+            assert type(value) is type(getattr(expected, key))
+
+    def test_transform_matches_batch_stores_naive_utc_dates(self, pipeline, match_triple):
+        """Test kick-off times with offsets are stored as naive UTC datetimes."""
+        league, home_team, away_team = match_triple
+        team_dict = {'team a': home_team, 'team b': away_team}
+        matches_data = [
+            {
+                'id': 1,
+                'utcDate': '2023-08-12T15:00:00+02:00',
+                'homeTeam': {'name': 'Team A'},
+                'awayTeam': {'name': 'Team B'},
+            },
         ]
 
-        for status_str, expected_status in statuses:
-            match_data = {
+        with warnings.catch_warnings():
+            warnings.simplefilter('error', FutureWarning)
+            records = pipeline.transform_matches_batch(matches_data, league.id, team_dict)
+
+        assert type(records[0]['match_date']) is datetime
+        assert records[0]['match_date'] == datetime(2023, 8, 12, 13, 0)
+
+    def test_transform_matches_batch_fuzzy_matches_every_team(self, pipeline, match_triple):
+        """Test a batch where no name matches exactly still resolves teams by fuzzy lookup."""
+        league, home_team, away_team = match_triple
+        team_dict = {'team a': home_team, 'team b': away_team}
+        matches_data = [
+            {
                 'id': 1,
                 'utcDate': '2023-08-12T15:00:00Z',
-                'status': status_str,
-                'score': {'fullTime': {'home': None, 'away': None}},
-            }
-            match = pipeline.transform_to_match(match_data, league, home_team, away_team)
-            assert match.status == expected_status
+                'homeTeam': {'name': 'Team A FC'},
+                'awayTeam': {'name': 'Team B FC'},
+            },
+        ]
+        fuzzy = {'Team A FC': home_team, 'Team B FC': away_team}
+
+        with patch.object(pipeline, '_find_team', side_effect=lambda _, name: fuzzy[name]):
+            with warnings.catch_warnings():
+                warnings.simplefilter('error', FutureWarning)
+                records = pipeline.transform_matches_batch(matches_data, league.id, team_dict)
+
+        assert (records[0]['home_team_id'], records[0]['away_team_id']) == (1, 2)
+
+    @pytest.mark.parametrize('status_str,expected_status', [
+        ('SCHEDULED', MatchStatus.SCHEDULED),
+        ('LIVE', MatchStatus.LIVE),
+        ('FINISHED', MatchStatus.FINISHED),
+        ('POSTPONED', MatchStatus.POSTPONED),
+        ('CANCELLED', MatchStatus.CANCELLED),
+    ])
+    def test_transform_to_match_status_mapping(
+        self, pipeline, match_triple, status_str, expected_status
+    ):
+        """Test status mapping in match transformation."""
+        match_data = {
+            'id': 1,
+            'utcDate': '2023-08-12T15:00:00Z',
+            'status': status_str,
+            'score': {'fullTime': {'home': None, 'away': None}},
+        }
+        match = pipeline.transform_to_match(match_data, *match_triple)
+        assert match.status == expected_status
 
 
 class TestPipelineMatchStatsStorage:
@@ -176,8 +317,7 @@ class TestPipelineMatchStatsStorage:
 
     def test_store_match_stats(self, pipeline):
         """Test storing match statistics."""
-        match = Mock(spec=Match)
-        match.id = 1
+        match = match_mock(id=1)
 
         stats_data = {'shots': 15, 'possession': 55}
         match_stats = pipeline.store_match_stats(match, stats_data, 'fbref')
@@ -186,6 +326,19 @@ class TestPipelineMatchStatsStorage:
         assert match_stats.source == 'fbref'
         assert 'shots' in match_stats.data_json
 
+    @pytest.mark.parametrize('sort_keys', [False, True])
+    def test_json_encoders_agree(self, sort_keys):
+        """Test the orjson and stdlib encoders produce the same text."""
+        data = {
+            'shots': 15,
+            'possession': 55.5,
+            'xg': None,
+            'scorer': 'Müller',
+            'minutes': {90: 2, 45: 1},
+        }
+
+        assert _dumps_json(data, sort_keys=sort_keys) == _dumps_json_stdlib(data, sort_keys=sort_keys)
+
 
 class TestPipelineDataFetching:
     """Test data fetching from sources."""
@@ -194,11 +347,11 @@ class TestPipelineDataFetching:
     @patch.object(DataPipeline, 'insert_or_update_league')
     def test_fetch_league_data_success(self, mock_insert, mock_transform, pipeline):
         """Test successful league data fetching."""
-        mock_transform.return_value = Mock(spec=League)
-        mock_insert.return_value = Mock(spec=League)
+        mock_transform.return_value = league_mock()
+        mock_insert.return_value = league_mock()
 
         with patch.object(pipeline.fbref, 'scrape_league_standings') as mock_scrape:
-            mock_scrape.return_value = [{'name': 'Team A'}, {'name': 'Team B'}]
+            mock_scrape.return_value = pd.DataFrame({'name': ['Team A', 'Team B']})
 
             result = pipeline.fetch_league_data('EPL', '2023-24', sources=['fbref'])
 
@@ -206,10 +359,34 @@ class TestPipelineDataFetching:
             assert result['season'] == '2023-24'
             assert len(result['standings']) == 2
 
+    def test_fetch_league_data_merges_sources_in_order(self, pipeline):
+        """Test concurrent source fetches are merged in source order with errors recorded."""
+        with patch.object(pipeline.fbref, 'scrape_league_standings', side_effect=Exception('blocked')), \
+                patch.object(pipeline.football_data, 'get_standings',
+                             return_value=[{'team': {'name': 'Team A'}}]), \
+                patch.object(pipeline.api_football, 'get_league_standings',
+                             return_value=[{'team': {'name': 'Team B'}}]):
+            result = pipeline.fetch_league_data('EPL', '2023-24')
+
+        assert result['standings'] == [{'name': 'Team A'}, {'team': {'name': 'Team B'}}]
+        assert result['errors'] == ['FBref: blocked']
+
+    def test_fetch_matches_since_passes_date_window(self, pipeline):
+        """Test incremental match fetches only request dates after the latest stored match."""
+        with patch.object(pipeline.football_data, 'get_current_matches', return_value=[{'id': 1}]) as mock_fd:
+            matches = pipeline.fetch_matches(
+                'EPL', '2023-24', sources=['football_data'], since=datetime(2023, 8, 12, 15, 0)
+            )
+
+        assert matches == [{'id': 1}]
+        mock_fd.assert_called_once_with(
+            'EPL', status='SCHEDULED', date_from='2023-08-12', date_to='2024-08-11'
+        )
+
     @patch.object(DataPipeline, 'insert_or_update_league')
     def test_fetch_league_data_no_sources(self, mock_insert, pipeline):
         """Test fetching league data with no available sources."""
-        mock_insert.return_value = Mock(spec=League)
+        mock_insert.return_value = league_mock()
 
         with pytest.raises(PipelineError):
             pipeline.fetch_league_data('EPL', '2023-24', sources=[])
@@ -218,88 +395,280 @@ class TestPipelineDataFetching:
 class TestPipelineInsertOrUpdate:
     """Test insert or update operations."""
 
-    def test_insert_or_update_league_new(self, pipeline):
+    def test_insert_or_update_league_new(self, pipeline, db_returns):
         """Test inserting new league."""
-        pipeline.db.query().filter().first.return_value = None
+        db_returns(scalar_one_or_none=None)
 
         league = pipeline.insert_or_update_league('EPL', '2023-24')
         assert league.name == 'Premier League'
         pipeline.db.add.assert_called()
         pipeline.db.commit.assert_called()
 
-    def test_insert_or_update_league_existing(self, pipeline):
+    def test_insert_or_update_league_existing(self, pipeline, db_returns):
         """Test updating existing league."""
-        existing_league = Mock(spec=League)
-        pipeline.db.query().filter().first.return_value = existing_league
+        existing_league = league_mock()
+        db_returns(scalar_one_or_none=existing_league)
 
         league = pipeline.insert_or_update_league('EPL', '2023-24')
         assert league == existing_league
         pipeline.db.add.assert_not_called()
 
-    def test_insert_or_update_teams_new(self, pipeline):
+    def test_insert_or_update_teams_new(self, pipeline, db_returns):
         """Test inserting new teams."""
-        league = Mock(spec=League)
-        league.id = 1
+        league = league_mock(id=1)
 
-        pipeline.db.query().filter().first.return_value = None
+        db_returns(query_all=[])
 
-        teams_data = [{'name': 'Team A', 'id': 1}]
+        teams_data = [{'name': 'Team A', 'id': 1}, {'name': 'Team B', 'id': 2}]
         teams = pipeline.insert_or_update_teams(league, teams_data)
 
-        assert len(teams) > 0
-        pipeline.db.add.assert_called()
+        assert [team.name for team in teams] == ['Team A', 'Team B']
+        pipeline.db.add_all.assert_called_once()
+        pipeline.db.commit.assert_called_once()
 
-    def test_insert_or_update_teams_existing(self, pipeline):
+    def test_insert_or_update_teams_existing(self, pipeline, db_returns):
         """Test updating existing teams."""
-        league = Mock(spec=League)
-        league.id = 1
+        league = league_mock(id=1)
 
-        existing_team = Mock(spec=Team)
-        existing_team.name = 'Team A'
-        pipeline.db.query().filter().first.return_value = existing_team
+        existing_team = team_mock(name='Team A')
+        db_returns(query_all=[existing_team])
 
         teams_data = [{'name': 'Team A', 'id': 1}]
         teams = pipeline.insert_or_update_teams(league, teams_data)
 
         assert teams[0] == existing_team
+        pipeline.db.commit.assert_not_called()
+
+    def test_insert_or_update_teams_falls_back_on_integrity_error(self, pipeline, db_returns):
+        """Test a failed batch is retried row by row, skipping only bad rows."""
+        league = league_mock(id=1)
+        db_returns(query_all=[])
+        pipeline.db.commit.side_effect = [
+            IntegrityError('INSERT', {}, Exception('duplicate')),  # batch
+            None,                                                  # Team A
+            IntegrityError('INSERT', {}, Exception('duplicate')),  # Team B
+        ]
 
+        teams_data = [{'name': 'Team A', 'id': 1}, {'name': 'Team B', 'id': 2}]
+        teams = pipeline.insert_or_update_teams(league, teams_data)
 
-class TestPipelineFullPipeline:
-    """Test complete pipeline execution."""
+        assert [team.name for team in teams] == ['Team A']
+        assert pipeline.db.rollback.call_count == 2
 
-    @patch.object(DataPipeline, 'fetch_league_data')
-    @patch.object(DataPipeline, 'fetch_matches')
-    @patch.object(DataPipeline, 'insert_or_update_league')
-    @patch.object(DataPipeline, 'insert_or_update_teams')
-    @patch.object(DataPipeline, 'insert_or_update_matches')
-    def test_run_full_pipeline_success(
-        self,
-        mock_matches,
-        mock_teams,
-        mock_league,
-        mock_fetch_matches,
-        mock_fetch_league,
-        pipeline,
-    ):
-        """Test running full pipeline."""
-        league = Mock(spec=League)
-        league.id = 1
-        mock_league.return_value = league
+    def test_insert_or_update_teams_dedupes_streamed_entries(self, pipeline, db_returns):
+        """Test overlapping source entries from an iterator yield one team each."""
+        league = league_mock(id=1)
+        db_returns(query_all=[])
 
-        teams = [Mock(spec=Team), Mock(spec=Team)]
-        mock_teams.return_value = teams
+        teams_data = iter([
+            {'name': 'Team A', 'points': 10},
+            {'name': 'Team B'},
+            {'name': 'Team A', 'points': 99},
+        ])
+        teams = pipeline.insert_or_update_teams(league, teams_data)
 
-        matches = [Mock(spec=Match)]
-        mock_matches.return_value = matches
+        assert [team.name for team in teams] == ['Team A', 'Team B']
+        assert len(pipeline.db.add_all.call_args[0][0]) == 2
 
-        mock_fetch_league.return_value = {
+    def test_insert_or_update_matches_prefetches_existing(self, pipeline, db_returns):
+        """Test existing matches are looked up in one query and new ones committed once."""
+        league = league_mock(id=1)
+        home_team = team_mock(id=1, name='Team A')
+        away_team = team_mock(id=2, name='Team B')
+
+        # Class spec, since the pipeline tells stored matches apart with isinstance
+        existing_match = Mock(spec=Match)
+        existing_match.configure_mock(
+            id=7, external_id='100', status=MatchStatus.SCHEDULED,
+            match_date=datetime(2023, 8, 12, 15, 0),
+        )
+        db_returns(scalars_all=[existing_match])
+
+        matches_data = [
+            {
+                'id': match_id,
+                'utcDate': '2023-08-12T15:00:00Z',
+                'status': 'SCHEDULED',
+                'homeTeam': {'name': 'Team A'},
+                'awayTeam': {'name': 'Team B'},
+            }
+            for match_id in (100, 101, 102, 101)
+        ]
+        matches = pipeline.insert_or_update_matches(league, [home_team, away_team], matches_data)
+
+        assert matches[0] is existing_match
+        # The repeated fixture 101 is only created once
+        assert [m.external_id for m in matches[1:]] == ['101', '102']
+        pipeline.db.execute.return_value.scalars.return_value.all.assert_called_once()
+        pipeline.db.add_all.assert_called_once()
+        pipeline.db.commit.assert_called_once()
+
+    def test_insert_or_update_matches_updates_changed_matches(self, pipeline, db_returns):
+        """Test a stored match picks up the final score and is reported as updated."""
+        league = league_mock(id=1)
+        teams = [team_mock(id=1, name='Team A'), team_mock(id=2, name='Team B')]
+        # Class spec, since the pipeline tells stored matches apart with isinstance
+        existing_match = Mock(spec=Match)
+        existing_match.configure_mock(
+            id=7, external_id='100', status=MatchStatus.SCHEDULED,
+            match_date=datetime(2023, 8, 12, 15, 0), home_goals=None, away_goals=None,
+        )
+        db_returns(scalars_all=[existing_match])
+        matches_data = [{
+            'id': 100,
+            'utcDate': '2023-08-12T15:00:00Z',
+            'status': 'FINISHED',
+            'homeTeam': {'name': 'Team A'},
+            'awayTeam': {'name': 'Team B'},
+            'score': {'fullTime': {'home': 2, 'away': 1}},
+        }]
+
+        with patch.object(pipeline, 'on_match_updated') as mock_updated:
+            matches = pipeline.insert_or_update_matches(league, teams, matches_data)
+
+        assert matches == [existing_match]
+        assert existing_match.status == MatchStatus.FINISHED
+        assert (existing_match.home_goals, existing_match.away_goals) == (2, 1)
+        pipeline.db.commit.assert_called_once()
+        mock_updated.assert_called_once_with(7)
+
+    def test_find_team_normalizes_names(self, pipeline):
+        """Test team lookups ignore case, punctuation and extra whitespace."""
+        team = team_mock(name='Brighton & Hove Albion')
+        team_dict = {_normkey(team.name): team}
+
+        assert pipeline._find_team(team_dict, 'brighton  & hove albion.') is team
+
+    def test_insert_or_update_league_per_season(self):
+        """Test one competition code is stored once per season on SQLite."""
+        engine = create_engine(
+            'sqlite://', connect_args={'check_same_thread': False}, poolclass=StaticPool
+        )
+        Base.metadata.create_all(bind=engine)
+        session = sessionmaker(bind=engine)()
+        try:
+            pipeline = DataPipeline(db_session=session)
+            first = pipeline.insert_or_update_league('EPL', '2023-24')
+            second = pipeline.insert_or_update_league('EPL', '2024-25')
+            again = pipeline.insert_or_update_league('EPL', '2023-24')
+
+            assert first.id != second.id
+            assert again.id == first.id
+            assert session.query(League).count() == 2
+        finally:
+            session.close()
+
+    def test_insert_or_update_teams_native_insert_ignore(self):
+        """Test teams are inserted with ON CONFLICT DO NOTHING on SQLite and reused on rerun."""
+        engine = create_engine(
+            'sqlite://', connect_args={'check_same_thread': False}, poolclass=StaticPool
+        )
+        Base.metadata.create_all(bind=engine)
+        session = sessionmaker(bind=engine)()
+        try:
+            pipeline = DataPipeline(db_session=session)
+            league = pipeline.insert_or_update_league('EPL', '2023-24')
+
+            teams_data = [{'name': 'Team A', 'id': 1}, {'name': 'Team B', 'id': 2}]
+            first = pipeline.insert_or_update_teams(league, teams_data)
+            second = pipeline.insert_or_update_teams(league, teams_data)
+
+            assert [team.name for team in first] == ['Team A', 'Team B']
+            assert all(team.id is not None for team in first)
+            assert [team.id for team in second] == [team.id for team in first]
+            assert session.query(Team).count() == 2
+        finally:
+            session.close()
+
+    def test_insert_or_update_matches_native_insert_ignore(self):
+        """Test matches are bulk-inserted on SQLite and reused on rerun."""
+        engine = create_engine(
+            'sqlite://', connect_args={'check_same_thread': False}, poolclass=StaticPool
+        )
+        Base.metadata.create_all(bind=engine)
+        session = sessionmaker(bind=engine)()
+        try:
+            pipeline = DataPipeline(db_session=session)
+            league = pipeline.insert_or_update_league('EPL', '2023-24')
+            teams = pipeline.insert_or_update_teams(league, [{'name': 'Team A'}, {'name': 'Team B'}])
+            matches_data = [
+                {
+                    'id': match_id,
+                    'utcDate': '2023-08-12T15:00:00Z',
+                    'status': 'FINISHED',
+                    'homeTeam': {'name': 'Team A'},
+                    'awayTeam': {'name': 'Team B'},
+                    'score': {'fullTime': {'home': 2, 'away': 1}},
+                }
+                for match_id in (1, 2)
+            ]
+
+            first = pipeline.insert_or_update_matches(league, teams, matches_data)
+            second = pipeline.insert_or_update_matches(league, teams, matches_data)
+
+            assert [match.external_id for match in first] == ['1', '2']
+            assert [match.id for match in second] == [match.id for match in first]
+            assert first[0].home_goals == 2
+            assert first[0].status == MatchStatus.FINISHED
+            assert session.query(Match).count() == 2
+        finally:
+            session.close()
+
+    def test_insert_or_update_matches_without_external_id(self):
+        """Test matches without a source id are each inserted, not collapsed into one row."""
+        engine = create_engine(
+            'sqlite://', connect_args={'check_same_thread': False}, poolclass=StaticPool
+        )
+        Base.metadata.create_all(bind=engine)
+        session = sessionmaker(bind=engine)()
+        try:
+            pipeline = DataPipeline(db_session=session)
+            league = pipeline.insert_or_update_league('EPL', '2023-24')
+            teams = pipeline.insert_or_update_teams(league, [{'name': 'Team A'}, {'name': 'Team B'}])
+            matches_data = [
+                {
+                    'utcDate': f'2023-08-{day}T15:00:00Z',
+                    'homeTeam': {'name': 'Team A'},
+                    'awayTeam': {'name': 'Team B'},
+                }
+                for day in (12, 19)
+            ]
+            matches_data.append(dict(matches_data[0], id=5))
+
+            matches = pipeline.insert_or_update_matches(league, teams, matches_data)
+
+            assert [match.external_id for match in matches] == [None, None, '5']
+            assert len({match.id for match in matches}) == 3
+            assert session.query(Match).count() == 3
+        finally:
+            session.close()
+
+
+class TestPipelineFullPipeline:
+    """Test complete pipeline execution."""
+
+    def test_run_full_pipeline_success(self, mocker, pipeline):
+        """Test running full pipeline."""
+        patches = mocker.patch.multiple(
+            DataPipeline,
+            fetch_league_data=mocker.DEFAULT,
+            fetch_matches=mocker.DEFAULT,
+            insert_or_update_league=mocker.DEFAULT,
+            insert_or_update_teams=mocker.DEFAULT,
+            insert_or_update_matches=mocker.DEFAULT,
+        )
+        patches['insert_or_update_league'].return_value = league_mock(id=1)
+        patches['insert_or_update_teams'].return_value = [team_mock(), team_mock()]
+        patches['insert_or_update_matches'].return_value = [match_mock()]
+        patches['fetch_league_data'].return_value = {
             'league_code': 'EPL',
             'season': '2023-24',
             'standings': [{'name': 'Team A'}],
             'errors': [],
         }
-
-        mock_fetch_matches.return_value = [{'id': 1}]
+        patches['fetch_matches'].return_value = [{'id': 1}]
+        # No finished matches stored yet
+        pipeline.db.query.return_value.filter.return_value.scalar.return_value = None
 
         result = pipeline.run_full_pipeline('EPL', '2023-24', fetch_matches=True)
 
@@ -307,3 +676,75 @@ class TestPipelineFullPipeline:
         assert result['league_created'] is True
         assert result['teams_created'] == 2
         assert result['matches_created'] == 1
+
+    @patch.object(DataPipeline, 'fetch_league_data')
+    @patch.object(DataPipeline, 'fetch_matches')
+    def test_run_full_pipeline_skips_unchanged_data(self, mock_fetch_matches, mock_fetch_league):
+        """Test a rerun with identical fetched data skips the insert steps."""
+        engine = create_engine(
+            'sqlite://', connect_args={'check_same_thread': False}, poolclass=StaticPool
+        )
+        Base.metadata.create_all(bind=engine)
+        session = sessionmaker(bind=engine)()
+        mock_fetch_league.return_value = {
+            'league_code': 'EPL',
+            'season': '2023-24',
+            'standings': [{'name': 'Team A'}, {'name': 'Team B'}],
+            'errors': [],
+        }
+        mock_fetch_matches.return_value = []
+
+        try:
+            pipeline = DataPipeline(db_session=session)
+            first = pipeline.run_full_pipeline('EPL', '2023-24')
+            with patch.object(DataPipeline, 'insert_or_update_teams') as mock_teams:
+                second = pipeline.run_full_pipeline('EPL', '2023-24')
+
+            assert first['skipped'] is False
+            assert first['teams_created'] == 2
+            assert second['skipped'] is True
+            mock_teams.assert_not_called()
+        finally:
+            session.close()
+
+    @patch.object(DataPipeline, 'fetch_league_data')
+    def test_run_full_pipeline_rerun_without_new_fixtures(self, mock_fetch_league):
+        """Test a rerun fetches from before the latest finished match and accepts no new fixtures."""
+        engine = create_engine(
+            'sqlite://', connect_args={'check_same_thread': False}, poolclass=StaticPool
+        )
+        Base.metadata.create_all(bind=engine)
+        session = sessionmaker(bind=engine)()
+        mock_fetch_league.return_value = {
+            'league_code': 'EPL',
+            'season': '2023-24',
+            'standings': [{'name': 'Team A'}, {'name': 'Team B'}],
+            'errors': [],
+        }
+        finished_matches = [{
+            'id': 100,
+            'utcDate': '2023-08-12T15:00:00Z',
+            'status': 'FINISHED',
+            'homeTeam': {'name': 'Team A'},
+            'awayTeam': {'name': 'Team B'},
+            'score': {'fullTime': {'home': 2, 'away': 1}},
+        }]
+
+        try:
+            pipeline = DataPipeline(db_session=session, football_data_key='key')
+            with patch.object(
+                pipeline, '_fetch_football_data_matches', side_effect=[finished_matches, []]
+            ) as mock_fetch:
+                first = pipeline.run_full_pipeline('EPL', '2023-24')
+                second = pipeline.run_full_pipeline('EPL', '2023-24')
+
+            assert first['matches_created'] == 1
+            assert second['errors'] == []
+            assert second['matches_created'] == 0
+            # Every status is requested, from three days before the finished match
+            assert mock_fetch.call_args_list[0].args == ('EPL', '2023-24', None, None, None)
+            assert mock_fetch.call_args_list[1].args == (
+                'EPL', '2023-24', None, '2023-08-09', '2024-08-08'
+            )
+        finally:
+            session.close()